@@ -0,0 +1,52 @@
+"""Shared fixtures for tests that don't require an API key"""
+import pytest
+from urllib.parse import urlencode
+from youtube_toolkit.tools.youtube_base import YouTubeAPIClient
+
+class FakeRequest:
+    """Stands in for googleapiclient's HttpRequest"""
+
+    def __init__(self, client, method_id, params):
+        self.client = client
+        self.method = 'GET'
+        self.methodId = method_id
+        self.params = params
+        self.uri = f"https://fake.invalid/{method_id}?{urlencode(sorted(params.items()))}"
+
+    def execute(self, http=None):
+        self.client.calls.append((self.methodId, self.params))
+        return self.client.handlers[self.methodId](**self.params)
+
+class FakeResource:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def list(self, **params):
+        params = {k: v for k, v in params.items() if v is not None}
+        return FakeRequest(self.client, f"youtube.{self.name}.list", params)
+
+class FakeYouTube:
+    """In-memory YouTube Data API client.
+
+    Register a handler per method ID (e.g. 'youtube.search.list') that takes
+    the request parameters and returns the response body. Every executed
+    request is recorded in `calls`.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda: FakeResource(self, name)
+
+    def count(self, method_id):
+        return sum(1 for called, _ in self.calls if called == method_id)
+
+@pytest.fixture
+def fake_youtube(monkeypatch):
+    """Install a FakeYouTube as the shared API client"""
+    client = FakeYouTube()
+    monkeypatch.setattr(YouTubeAPIClient, '_instance', client)
+    return client
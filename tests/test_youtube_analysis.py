@@ -0,0 +1,152 @@
+"""Tests for cross-video analysis tools (no API key required)"""
+import pytest
+import json
+from youtube_toolkit.tools.youtube_base import (
+    TranscriptCache, VideoMetadataCache, DuplicatePredictor,
+    compute_minhash_signature, estimate_jaccard
+)
+from youtube_toolkit.tools.youtube_analysis import (
+    build_tfidf_vectors, similarity_matrix, youtube_analyze_videos,
+    youtube_find_duplicate_videos
+)
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point all caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(
+        name="Test",
+        log_level="INFO",
+        youtube_api_key=None,
+        transcript_cache_dir=str(tmp_path / "cache"),
+        default_transcript_delay=10.0,
+        max_cache_age_days=30
+    )
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+class TestTfidfEngine:
+    """Test the sparse TF-IDF and similarity helpers"""
+
+    def test_identical_documents_are_fully_similar(self):
+        terms, rows = build_tfidf_vectors([
+            ['python', 'decorators'],
+            ['python', 'decorators'],
+            ['sourdough', 'baking']
+        ])
+        matrix = similarity_matrix(rows)
+
+        assert sorted(terms) == ['baking', 'decorators', 'python', 'sourdough']
+        assert matrix[0][1] == pytest.approx(1.0)
+        assert matrix[0][2] == 0.0
+        assert matrix[2][2] == pytest.approx(1.0)
+
+    def test_empty_document(self):
+        terms, rows = build_tfidf_vectors([[], ['python']])
+
+        assert rows[0] == {}
+        assert similarity_matrix(rows)[0] == [0.0, 0.0]
+
+class TestAnalyzeVideos:
+    """Test the analysis tool over cached data"""
+
+    @pytest.fixture
+    def cached_videos(self, mock_config):
+        metadata = VideoMetadataCache()
+        metadata.set('a1', {'title': 'Python decorators explained', 'channel_id': 'UCa', 'channel_title': 'A'})
+        metadata.set('a2', {'title': 'Python generators explained', 'channel_id': 'UCa', 'channel_title': 'A'})
+        metadata.set('b1', {'title': 'Rust ownership explained', 'channel_id': 'UCb', 'channel_title': 'B'})
+        metadata.set('b2', {'title': 'Python packaging tips', 'channel_id': 'UCb', 'channel_title': 'B'})
+        TranscriptCache().set('b1', {
+            'full_transcript': [{'text': 'borrow checker lifetimes', 'start': 0, 'duration': 5}]
+        })
+
+    def test_analyze_by_channel(self, cached_videos):
+        result = json.loads(youtube_analyze_videos(channel_ids=['UCa', 'UCb']).text)
+
+        assert result['similarity']['video_ids'] == ['a1', 'a2', 'b1', 'b2']
+        assert len(result['similarity']['matrix']) == 4
+        assert result['_metadata']['api_quota_cost'] == 0
+
+        creator_a = result['creators']['UCa']
+        assert creator_a['video_count'] == 2
+        assert 'explained' not in [t['term'] for t in creator_a['coverage_gaps']]
+        assert 'rust' in [t['term'] for t in creator_a['coverage_gaps']]
+        assert 'borrow' in [t['term'] for t in result['creators']['UCb']['distinctive_terms']]
+
+        b1 = next(v for v in result['videos'] if v['video_id'] == 'b1')
+        assert b1['fields_used'] == ['title', 'transcript']
+
+    def test_missing_videos_reported(self, cached_videos):
+        result = json.loads(youtube_analyze_videos(video_ids=['a1', 'nope']).text)
+
+        assert result['missing'] == ['nope']
+        assert result['_metadata']['videos_analyzed'] == 1
+
+    def test_requires_selection(self, mock_config):
+        result = json.loads(youtube_analyze_videos().text)
+
+        assert result['error']['type'] == 'ValueError'
+
+def _transcript(words):
+    """Build transcript entries of ten words each"""
+    return [
+        {'text': ' '.join(words[i:i + 10]), 'start': i, 'duration': 10}
+        for i in range(0, len(words), 10)
+    ]
+
+class TestNearDuplicates:
+    """Test MinHash signatures and the LSH index"""
+
+    SPEECH = [f"word{i}" for i in range(300)]
+
+    def test_signature_similarity(self):
+        original = compute_minhash_signature(self.SPEECH)
+        clip = compute_minhash_signature(self.SPEECH[:270])
+        unrelated = compute_minhash_signature([f"other{i}" for i in range(300)])
+
+        assert estimate_jaccard(original, original) == 1.0
+        assert estimate_jaccard(original, clip) > 0.75
+        assert estimate_jaccard(original, unrelated) < 0.1
+        assert compute_minhash_signature([]) == []
+
+    def test_cache_indexes_and_finds_duplicates(self, mock_config):
+        cache = TranscriptCache()
+        cache.set('orig', {'full_transcript': _transcript(self.SPEECH)})
+        cache.set('reupload', {'full_transcript': _transcript(self.SPEECH[:290])})
+        cache.set('other', {'full_transcript': _transcript([f"x{i}" for i in range(300)])})
+
+        assert 'minhash' in cache.get('orig')
+        result = json.loads(youtube_find_duplicate_videos('orig').text)
+        assert [d['video_id'] for d in result['duplicates']] == ['reupload']
+
+        # The index survives a restart and follows cache clears
+        cache.clear(video_id='reupload')
+        result = json.loads(youtube_find_duplicate_videos('orig').text)
+        assert result['duplicates'] == []
+        assert result['_metadata']['indexed_videos'] == 2
+
+    def test_backfill_index(self, mock_config):
+        cache = TranscriptCache()
+        for video_id in ('old1', 'old2'):
+            cache._write(video_id, {'full_transcript': _transcript(self.SPEECH), 'fetched_at': '2099-01-01T00:00:00'})
+
+        result = json.loads(youtube_find_duplicate_videos('old1', backfill_index=True).text)
+
+        assert result['_metadata']['backfilled'] == 2
+        assert [d['video_id'] for d in result['duplicates']] == ['old2']
+
+    def test_uncached_video(self, mock_config):
+        result = json.loads(youtube_find_duplicate_videos('missing').text)
+
+        assert result['error']['type'] == 'not_cached'
+
+    def test_duplicate_predictor(self):
+        predictor = DuplicatePredictor()
+        predictor.add('orig', 'Python Decorators in 10 Minutes', 600)
+
+        assert predictor.match('Python Decorators in 10 Minutes (Reupload)', 601) == 'orig'
+        assert predictor.match('Python Decorators in 10 Minutes', 900) is None
+        assert predictor.match('Rust Lifetimes in 10 Minutes', 600) is None
+        assert predictor.match('Python Decorators in 10 Minutes', 600, exclude='orig') is None
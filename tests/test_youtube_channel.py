@@ -0,0 +1,169 @@
+"""Tests for channel identifier resolution against a fake API client (no API key required)"""
+import pytest
+import json
+from youtube_toolkit.tools.youtube_base import normalize_channel_alias, resolve_channel, ChannelAliasCache
+from youtube_toolkit.tools.youtube_channel import youtube_get_channel_metadata
+
+CHANNEL_ID = 'UCabcdefghijklmnopqrstuv'
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(transcript_cache_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+@pytest.fixture
+def channel_api(fake_youtube):
+    """One channel reachable by handle '@chan', legacy username 'oldname' or search 'Custom Name'"""
+    channel = {
+        'id': CHANNEL_ID,
+        'snippet': {'title': 'Chan', 'description': '', 'publishedAt': '2020-01-01T00:00:00Z'},
+        'statistics': {'subscriberCount': '10', 'viewCount': '100', 'videoCount': '1'}
+    }
+
+    def channels(part, id=None, forHandle=None, forUsername=None):
+        match = id == CHANNEL_ID or forHandle == '@chan' or forUsername == 'oldname'
+        return {'items': [channel] if match else []}
+
+    def search(q, **params):
+        return {'items': [{'snippet': {'channelId': CHANNEL_ID}}] if q == 'Custom Name' else []}
+
+    fake_youtube.handlers['youtube.channels.list'] = channels
+    fake_youtube.handlers['youtube.search.list'] = search
+    return fake_youtube
+
+class TestNormalizeAlias:
+    @pytest.mark.parametrize("identifier,alias", [
+        ('@Chan', '@chan'),
+        ('https://www.youtube.com/@Chan/videos', '@chan'),
+        ('youtube.com/c/CustomName', 'customname'),
+        ('https://youtube.com/user/OldName', 'oldname'),
+        (' oldname ', 'oldname'),
+    ])
+    def test_normalize(self, identifier, alias):
+        assert normalize_channel_alias(identifier) == alias
+
+class TestResolveChannel:
+    """Test handle/username resolution and the persistent alias cache"""
+
+    def test_channel_id_needs_no_calls(self, mock_config, channel_api):
+        for identifier in (CHANNEL_ID, f"https://www.youtube.com/channel/{CHANNEL_ID}"):
+            resolved = resolve_channel(channel_api, identifier)
+            assert (resolved['channel_id'], resolved['resolved_via'], resolved['quota_cost']) == (CHANNEL_ID, 'id', 0)
+        assert channel_api.calls == []
+
+    def test_handle_uses_for_handle_then_cache(self, mock_config, channel_api):
+        first = resolve_channel(channel_api, '@Chan', part='snippet')
+        second = resolve_channel(channel_api, 'https://youtube.com/@chan')
+
+        assert channel_api.calls == [('youtube.channels.list', {'part': 'snippet', 'forHandle': '@chan'})]
+        assert first['channel']['id'] == CHANNEL_ID
+        assert (first['resolved_via'], first['quota_cost']) == ('handle', 1)
+        assert (second['channel_id'], second['resolved_via'], second['quota_cost']) == (CHANNEL_ID, 'cache', 0)
+
+    def test_bare_name_tries_username(self, mock_config, channel_api):
+        resolved = resolve_channel(channel_api, 'OldName')
+
+        assert (resolved['resolved_via'], resolved['quota_cost']) == ('username', 2)
+        assert channel_api.count('youtube.search.list') == 0
+        assert ChannelAliasCache().get('oldname') == CHANNEL_ID
+
+    def test_search_is_last_resort(self, mock_config, channel_api):
+        resolved = resolve_channel(channel_api, 'Custom Name')
+
+        assert (resolved['resolved_via'], resolved['quota_cost']) == ('search', 102)
+        assert resolve_channel(channel_api, 'custom name')['resolved_via'] == 'cache'
+        assert channel_api.count('youtube.search.list') == 1
+
+    def test_unknown_channel(self, mock_config, channel_api):
+        assert resolve_channel(channel_api, '@nobody') is None
+        assert ChannelAliasCache().get('@nobody') is None
+
+    def test_expired_alias(self, mock_config, channel_api):
+        resolve_channel(channel_api, '@chan')
+        mock_config.channel_alias_ttl_days = 0
+        assert resolve_channel(channel_api, '@chan')['resolved_via'] == 'handle'
+
+class TestChannelMetadataResolution:
+    def test_handle_costs_one_call_then_cached_alias_one(self, mock_config, channel_api):
+        first = json.loads(youtube_get_channel_metadata('@chan').text)
+        second = json.loads(youtube_get_channel_metadata('@chan').text)
+
+        assert first['channel']['id'] == CHANNEL_ID
+        assert first['_metadata']['api_quota_cost'] == 1
+        assert second['_metadata']['resolved_via'] == 'cache'
+        assert second['_metadata']['api_quota_cost'] == 1
+        assert channel_api.calls[-1] == ('youtube.channels.list', {
+            'part': 'snippet,statistics,status,brandingSettings,contentDetails', 'id': CHANNEL_ID
+        })
+
+    def test_not_found(self, mock_config, channel_api):
+        result = json.loads(youtube_get_channel_metadata('@nobody').text)
+        assert result['error']['type'] == 'channel_not_found'
+
+class TestChannelsMetadata:
+    """Test the batch channel metadata tool"""
+
+    @pytest.fixture
+    def many_channels(self, fake_youtube):
+        ids = [f"UC{i:022d}" for i in range(120)]
+
+        def channels(part, id=None, forHandle=None, forUsername=None):
+            if forHandle == '@chan':
+                wanted = [ids[0]]
+            elif id:
+                wanted = id.split(',')
+                assert len(wanted) <= 50
+            else:
+                wanted = []
+            return {'items': [{
+                'id': channel_id,
+                'snippet': {'title': channel_id, 'description': '', 'publishedAt': '2020-01-01T00:00:00Z'},
+                'statistics': {'subscriberCount': '5'}
+            } for channel_id in wanted if channel_id in ids]}
+
+        fake_youtube.handlers['youtube.channels.list'] = channels
+        fake_youtube.handlers['youtube.search.list'] = lambda **params: {'items': []}
+        return fake_youtube, ids
+
+    def test_batches_of_50(self, mock_config, many_channels):
+        from youtube_toolkit.tools.youtube_channel import youtube_get_channels_metadata
+
+        api, ids = many_channels
+        result = json.loads(youtube_get_channels_metadata(ids).text)
+
+        assert result['found'] == 120
+        assert [entry['channel']['id'] for entry in result['channels']] == ids
+        assert api.count('youtube.channels.list') == 3
+        assert result['_metadata']['api_quota_cost'] == 3
+
+    def test_mixed_inputs_and_errors(self, mock_config, many_channels):
+        from youtube_toolkit.tools.youtube_channel import youtube_get_channels_metadata
+
+        api, ids = many_channels
+        inputs = ['@chan', ids[1], 'UC' + 'z' * 22, '@nobody', ids[1]]
+        result = json.loads(youtube_get_channels_metadata(inputs).text)
+        channels = result['channels']
+
+        assert [entry['input'] for entry in channels] == inputs
+        assert channels[0]['channel']['id'] == ids[0]
+        assert channels[0]['resolved_via'] == 'handle'
+        assert channels[1]['channel']['id'] == channels[4]['channel']['id'] == ids[1]
+        assert channels[2]['error']['type'] == 'channel_not_found'
+        assert channels[3]['error']['type'] == 'channel_not_found'
+        assert (result['found'], result['failed']) == (3, 2)
+        # The handle lookup returned its channel, so only the two IDs are batch-fetched
+        batch_calls = [p for m, p in api.calls if m == 'youtube.channels.list' and 'id' in p]
+        assert batch_calls == [{'part': 'snippet,statistics,status,brandingSettings,contentDetails',
+                                'id': f"{ids[1]},{'UC' + 'z' * 22}"}]
+
+        # The handle is now cached: no more lookups
+        api.calls.clear()
+        again = json.loads(youtube_get_channels_metadata(['@chan']).text)
+        assert again['channels'][0]['resolved_via'] == 'cache'
+        assert api.calls == [('youtube.channels.list', {
+            'part': 'snippet,statistics,status,brandingSettings,contentDetails', 'id': ids[0]
+        })]
@@ -0,0 +1,103 @@
+"""Tests for comment tools against a fake API client (no API key required)"""
+import pytest
+import json
+from youtube_toolkit.tools.youtube_comments import youtube_get_video_comments
+from tests.test_youtube_tools import _http_error
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(transcript_cache_dir=str(tmp_path / "cache"), comment_cache_ttl_minutes=60)
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+@pytest.fixture
+def comments_api(fake_youtube):
+    """250 comments on 'vid', none allowed on 'closed'"""
+    threads = []  # newest first
+
+    def post(count):
+        for _ in range(count):
+            n = len(threads)
+            threads.insert(0, {
+                'id': f"c{n:04d}",
+                'snippet': {
+                    'totalReplyCount': 1,
+                    'topLevelComment': {'id': f"c{n:04d}", 'snippet': {
+                        'authorDisplayName': 'Viewer', 'textDisplay': f"comment {n}", 'likeCount': n,
+                        'publishedAt': f"2026-01-01T{n // 3600:02d}:{n // 60 % 60:02d}:{n % 60:02d}Z"
+                    }}
+                },
+                'replies': {'comments': [{'id': f"r{n}", 'snippet': {'textDisplay': 'reply'}}]}
+            })
+
+    def comment_threads(videoId, maxResults, pageToken=None, **params):
+        if videoId == 'closed':
+            raise _http_error(403, 'commentsDisabled')
+        assert params['order'] == 'time'
+        start = int(pageToken or 0)
+        end = min(start + maxResults, len(threads))
+        response = {'items': threads[start:end]}
+        if end < len(threads):
+            response['nextPageToken'] = str(end)
+        return response
+
+    fake_youtube.handlers['youtube.commentThreads.list'] = comment_threads
+    post(250)
+    return fake_youtube, post
+
+def _get(*video_ids, **kwargs):
+    return json.loads(youtube_get_video_comments(list(video_ids), **kwargs).text)
+
+class TestVideoComments:
+    def test_cap_stops_pagination(self, mock_config, comments_api):
+        api, post = comments_api
+        result = _get('vid', max_comments=120)
+        video = result['videos'][0]
+
+        assert video['comments_returned'] == 120
+        assert video['comments'][0]['text'] == 'comment 249'
+        assert video['complete'] is False
+        assert [p['maxResults'] for m, p in api.calls] == [100, 20]
+        assert result['_metadata']['api_quota_cost'] == 2
+
+    def test_cache_hit_and_incremental_refresh(self, mock_config, comments_api):
+        api, post = comments_api
+        _get('vid', max_comments=50)
+        api.calls.clear()
+
+        hit = _get('vid', max_comments=50)
+        assert hit['videos'][0]['cache'] == 'hit'
+        assert api.calls == []
+
+        post(3)
+        mock_config.comment_cache_ttl_minutes = 0
+        refreshed = _get('vid', max_comments=50)
+        video = refreshed['videos'][0]
+        assert video['cache'] == 'refresh'
+        assert [c['id'] for c in video['comments'][:4]] == ['c0252', 'c0251', 'c0250', 'c0249']
+        assert len(api.calls) == 1
+
+    def test_raising_cap_continues_from_cached_page(self, mock_config, comments_api):
+        api, post = comments_api
+        _get('vid', max_comments=100)
+        api.calls.clear()
+        mock_config.comment_cache_ttl_minutes = 0
+
+        result = _get('vid', max_comments=300)
+        video = result['videos'][0]
+        assert video['comments_returned'] == 250
+        assert video['complete'] is True
+        assert len({c['id'] for c in video['comments']}) == 250
+        # One refresh page, then older threads from the stored page token
+        assert [p.get('pageToken') for m, p in api.calls] == [None, '100', '200']
+
+    def test_replies_and_disabled_comments(self, mock_config, comments_api):
+        result = _get('vid', 'closed', max_comments=5, include_replies=True, max_concurrency=2)
+
+        assert result['videos'][0]['comments'][0]['replies'][0]['text'] == 'reply'
+        assert result['errors'] == [{'video_id': 'closed', 'error': {
+            'type': 'comments_disabled', 'message': 'Comments are disabled for this video'
+        }}]
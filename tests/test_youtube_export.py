@@ -0,0 +1,122 @@
+"""Tests for streaming catalog export against a fake API client (no API key required)"""
+import pytest
+import csv
+import json
+from youtube_toolkit.tools.youtube_export import youtube_export_catalog
+
+PLAYLIST_ID = 'PLcourse'
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(transcript_cache_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+@pytest.fixture
+def catalog(fake_youtube):
+    """A 120-video playlist served 50 per page"""
+    video_ids = [f"vid{i:03d}" for i in range(120)]
+
+    def playlist_items(playlistId, maxResults, pageToken=None, **params):
+        start = int(pageToken or 0)
+        end = min(start + maxResults, len(video_ids))
+        response = {'items': [{
+            'snippet': {'title': f"Video {v}", 'description': 'd', 'position': start + i,
+                        'publishedAt': '2026-01-01T00:00:00Z', 'channelId': 'UCx', 'channelTitle': 'X'},
+            'contentDetails': {'videoId': v}
+        } for i, v in enumerate(video_ids[start:end])]}
+        if end < len(video_ids):
+            response['nextPageToken'] = str(end)
+        return response
+
+    def videos(id, part, **params):
+        return {'items': [
+            {'id': v, 'statistics': {'viewCount': '9'}, 'contentDetails': {'duration': 'PT1M'}}
+            for v in id.split(',')
+        ]}
+
+    fake_youtube.handlers['youtube.playlistItems.list'] = playlist_items
+    fake_youtube.handlers['youtube.videos.list'] = videos
+    return fake_youtube, video_ids
+
+def _export(**kwargs):
+    return json.loads(youtube_export_catalog(playlist_id=PLAYLIST_ID, **kwargs).text)
+
+def _ndjson_ids(path):
+    with open(path) as f:
+        return [json.loads(line)['video_id'] for line in f]
+
+class TestCatalogExport:
+    def test_full_ndjson_export(self, mock_config, catalog, tmp_path):
+        api, video_ids = catalog
+        result = _export(output_path=str(tmp_path / "out.ndjson"))
+
+        assert result['complete'] is True
+        assert result['written'] == 120
+        assert _ndjson_ids(tmp_path / "out.ndjson") == video_ids
+        with open(tmp_path / "out.ndjson") as f:
+            row = json.loads(f.readline())
+        assert (row['view_count'], row['duration_seconds'], row['position']) == (9, 60, 0)
+        assert api.count('youtube.playlistItems.list') == 3
+        assert api.count('youtube.videos.list') == 3
+        assert result['_metadata']['api_quota_cost'] == 6
+
+    def test_csv_export(self, mock_config, catalog, tmp_path):
+        api, video_ids = catalog
+        _export(output_path=str(tmp_path / "out.csv"), output_format="csv", include_details=False)
+
+        with open(tmp_path / "out.csv", newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [r['video_id'] for r in rows] == video_ids
+        assert rows[0]['view_count'] == ''
+        assert api.count('youtube.videos.list') == 0
+
+    def test_resume_mid_page(self, mock_config, catalog, tmp_path):
+        api, video_ids = catalog
+        path = tmp_path / "out.ndjson"
+        first = _export(output_path=str(path), max_videos=70)
+        assert (first['written'], first['complete']) == (70, False)
+
+        api.calls.clear()
+        second = _export(output_path=str(path))
+        assert second['resumed'] is True
+        assert (second['written'], second['written_this_call']) == (120, 50)
+        assert second['complete'] is True
+        assert _ndjson_ids(path) == video_ids
+        # Resumes from the second page's token rather than the beginning
+        assert [p.get('pageToken') for m, p in api.calls if m == 'youtube.playlistItems.list'] == ['50', '100']
+
+    def test_torn_tail_is_truncated(self, mock_config, catalog, tmp_path):
+        api, video_ids = catalog
+        path = tmp_path / "out.ndjson"
+        _export(output_path=str(path), max_videos=50)
+        with open(path, 'a') as f:
+            f.write('{"video_id": "vid050", "tit')
+
+        _export(output_path=str(path))
+        assert _ndjson_ids(path) == video_ids
+
+    def test_complete_export_is_not_repeated(self, mock_config, catalog, tmp_path):
+        api, video_ids = catalog
+        path = tmp_path / "out.ndjson"
+        _export(output_path=str(path))
+        api.calls.clear()
+
+        result = _export(output_path=str(path))
+        assert result['complete'] is True
+        assert api.calls == []
+
+        restarted = _export(output_path=str(path), restart=True)
+        assert restarted['resumed'] is False
+        assert _ndjson_ids(path) == video_ids
+
+    def test_checkpoint_belongs_to_source(self, mock_config, catalog, tmp_path):
+        path = tmp_path / "out.ndjson"
+        _export(output_path=str(path), max_videos=10)
+        result = json.loads(youtube_export_catalog(
+            playlist_id='PLother', output_path=str(path)
+        ).text)
+        assert 'error' in result
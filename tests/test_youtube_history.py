@@ -0,0 +1,141 @@
+"""Tests for the statistics history store (no API key required)"""
+import pytest
+import json
+import time
+from youtube_toolkit.tools.youtube_history import (
+    StatsHistoryStore, KEYFRAME_INTERVAL, youtube_get_stats_history
+)
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(
+        name="Test",
+        log_level="INFO",
+        youtube_api_key=None,
+        transcript_cache_dir=str(tmp_path / "cache")
+    )
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+DAY = 86400
+
+class TestStatsHistoryStore:
+    """Test delta encoding and decoding"""
+
+    def test_round_trip_is_delta_encoded(self, mock_config):
+        store = StatsHistoryStore()
+        store.append("video", "v1", {"view_count": 100, "like_count": 10}, t=1000)
+        store.append("video", "v1", {"view_count": 150, "like_count": 10}, t=1000 + DAY)
+        store.append("video", "v1", {"view_count": 150, "like_count": 12, "dislike_count": None}, t=1000 + 2 * DAY)
+
+        lines = store._path("video", "v1").read_text().splitlines()
+        assert json.loads(lines[0]) == {"t": 1000, "v": {"view_count": 100, "like_count": 10}}
+        assert json.loads(lines[1]) == {"dt": DAY, "d": {"view_count": 50}}
+        assert json.loads(lines[2]) == {"dt": DAY, "d": {"like_count": 2}}
+
+        assert store.read("video", "v1") == [
+            {"t": 1000, "values": {"view_count": 100, "like_count": 10}},
+            {"t": 1000 + DAY, "values": {"view_count": 150, "like_count": 10}},
+            {"t": 1000 + 2 * DAY, "values": {"view_count": 150, "like_count": 12}},
+        ]
+        assert store.entities("video") == ["v1"]
+
+    def test_keyframes_and_torn_lines(self, mock_config):
+        store = StatsHistoryStore()
+        for i in range(KEYFRAME_INTERVAL + 1):
+            store.append("channel", "UCx", {"subscriber_count": i}, t=1000 + i)
+        lines = store._path("channel", "UCx").read_text().splitlines()
+        assert 'v' in json.loads(lines[KEYFRAME_INTERVAL])
+
+        with open(store._path("channel", "UCx"), 'a') as f:
+            f.write('{"dt": 1, "d"\n')
+        store.append("channel", "UCx", {"subscriber_count": 500}, t=5000)
+        history = store.read("channel", "UCx")
+        assert history[-1] == {"t": 5000, "values": {"subscriber_count": 500}}
+
+class TestStatsHistoryTool:
+    """Test growth queries"""
+
+    def test_growth_over_windows(self, mock_config):
+        store = StatsHistoryStore()
+        now = int(time.time())
+        for days_ago, views in ((40, 1000), (6, 1500), (1, 1900), (0, 2000)):
+            store.append("video", "v1", {"view_count": views}, t=now - days_ago * DAY)
+
+        result = json.loads(youtube_get_stats_history(["v1", "nope"], include_points=True).text)
+        entry = result['entities']['v1']
+
+        assert result['missing'] == ["nope"]
+        assert result['_metadata']['api_quota_cost'] == 0
+        assert entry['latest']['view_count'] == 2000
+        assert entry['window_growth']['view_count']['change'] == 1000
+        assert entry['window_growth']['view_count']['change_pct'] == 100.0
+        assert entry['recent_growth']['7d']['view_count']['change'] == 500
+        assert entry['recent_growth']['24h']['view_count']['change'] == 100
+        assert entry['window_growth']['like_count'] is None
+        assert len(entry['points']) == 4
+
+    def test_recorded_by_metadata_tools(self, mock_config, fake_youtube):
+        from youtube_toolkit.tools.youtube_video import youtube_get_video_metadata
+
+        fake_youtube.handlers['youtube.videos.list'] = lambda **params: {'items': [{
+            'id': 'v1',
+            'snippet': {'title': 'T', 'description': '', 'channelId': 'UCx', 'channelTitle': 'X',
+                        'publishedAt': '2026-01-01T00:00:00Z', 'categoryId': ''},
+            'contentDetails': {'duration': 'PT1M'},
+            'status': {},
+            'statistics': {'viewCount': '10', 'likeCount': '2', 'commentCount': '1'}
+        }]}
+        fake_youtube.handlers['youtube.channels.list'] = lambda **params: {'items': [{
+            'statistics': {'subscriberCount': '99'}
+        }]}
+        youtube_get_video_metadata('v1')
+
+        video = json.loads(youtube_get_stats_history(["v1"]).text)['entities']['v1']
+        channel = json.loads(youtube_get_stats_history(["UCx"], kind="channel").text)['entities']['UCx']
+        assert video['latest']['view_count'] == 10
+        assert channel['latest']['subscriber_count'] == 99
+
+class TestRefreshStatistics:
+    """Test bulk statistics refresh"""
+
+    def test_refresh_by_channel_in_batches(self, mock_config, fake_youtube):
+        from youtube_toolkit.tools.youtube_base import VideoMetadataCache
+        from youtube_toolkit.tools.youtube_video import youtube_refresh_statistics
+
+        metadata = VideoMetadataCache()
+        for i in range(120):
+            metadata.set(f"v{i:03d}", {"channel_id": "UCx", "view_count": i})
+
+        def videos(id, part, **params):
+            assert part == 'statistics'
+            ids = id.split(',')
+            assert len(ids) <= 50
+            # One video was deleted since it was cached
+            return {'items': [
+                {'id': v, 'statistics': {'viewCount': str(int(v[1:]) + 10), 'likeCount': '1'}}
+                for v in ids if v != 'v007'
+            ]}
+        fake_youtube.handlers['youtube.videos.list'] = videos
+
+        result = json.loads(youtube_refresh_statistics(channel_ids=["UCx"], video_ids=["v000"]).text)
+
+        assert fake_youtube.count('youtube.videos.list') == 3
+        assert result['_metadata']['api_quota_cost'] == 3
+        assert result['updated'] == 119
+        assert result['not_found'] == ['v007']
+        assert result['videos'][0] == {
+            "video_id": "v000", "view_count": 10, "like_count": 1, "comment_count": None, "view_change": 10
+        }
+        assert metadata.get('v050')['view_count'] == 60
+        history = json.loads(youtube_get_stats_history(["v050"]).text)
+        assert history['entities']['v050']['latest']['view_count'] == 60
+
+    def test_requires_targets(self, mock_config):
+        from youtube_toolkit.tools.youtube_video import youtube_refresh_statistics
+
+        result = json.loads(youtube_refresh_statistics(channel_ids=["UCempty"]).text)
+        assert result['error']['type'] == 'ValueError'
@@ -0,0 +1,93 @@
+"""Tests for background jobs (no API key required)"""
+import pytest
+import json
+import threading
+import time
+from youtube_toolkit.tools import youtube_jobs
+from youtube_toolkit.tools.youtube_jobs import (
+    JobManager, youtube_get_job_status, youtube_get_job_result
+)
+
+def _wait_for(manager, job_id, statuses=('completed', 'failed'), timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job['status'] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not reach {statuses}")
+
+class TestJobManager:
+    """Test job submission, progress and persistence"""
+
+    @pytest.fixture
+    def release(self, monkeypatch):
+        """Register a test job kind that blocks until released"""
+        event = threading.Event()
+
+        def fake_runner(params, progress):
+            progress(1, 2, "halfway")
+            event.wait(5)
+            if params.get('fail'):
+                raise RuntimeError("harvest failed")
+            return {"videos": [params['channel_id']]}
+
+        monkeypatch.setitem(youtube_jobs.JOB_RUNNERS, "test_harvest", fake_runner)
+        return event
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        manager = JobManager(jobs_dir=tmp_path, max_workers=1)
+        monkeypatch.setattr(JobManager, '_instance', manager)
+        return manager
+
+    def test_submit_returns_before_completion(self, manager, release):
+        job = manager.submit("test_harvest", {"channel_id": "UCx"})
+        running = _wait_for(manager, job['job_id'], statuses=('running',))
+
+        status = json.loads(youtube_get_job_status(job['job_id']).text)
+        assert status['progress'] == {"completed": 1, "total": 2, "message": "halfway"}
+        assert json.loads(youtube_get_job_result(job['job_id']).text)['error']['type'] == 'job_not_finished'
+
+        release.set()
+        _wait_for(manager, job['job_id'])
+        result = json.loads(youtube_get_job_result(job['job_id']).text)
+        assert result['videos'] == ["UCx"]
+        assert result['_job']['status'] == 'completed'
+        assert running['started_at'] is not None
+
+    def test_failed_job(self, manager, release):
+        release.set()
+        job = manager.submit("test_harvest", {"channel_id": "UCx", "fail": True})
+        job = _wait_for(manager, job['job_id'])
+
+        assert job['status'] == 'failed'
+        assert job['error']['message'] == 'harvest failed'
+
+    def test_results_survive_restart(self, manager, release, tmp_path):
+        release.set()
+        job = manager.submit("test_harvest", {"channel_id": "UCx"})
+        _wait_for(manager, job['job_id'])
+
+        restarted = JobManager(jobs_dir=tmp_path, max_workers=1)
+        assert restarted.get_result(job['job_id']) == {"videos": ["UCx"]}
+        assert [j['job_id'] for j in restarted.list()] == [job['job_id']]
+
+    def test_interrupted_jobs_are_requeued(self, manager, release, tmp_path):
+        manager._save({
+            "job_id": "stale", "kind": "test_harvest", "params": {"channel_id": "UCy"},
+            "status": "running", "progress": {}, "submitted_at": "2026-01-01T00:00:00",
+            "started_at": None, "finished_at": None, "error": None
+        })
+        release.set()
+
+        restarted = JobManager(jobs_dir=tmp_path, max_workers=1)
+        job = _wait_for(restarted, "stale")
+
+        assert job['status'] == 'completed'
+        assert job['restarts'] == 1
+
+    def test_unknown_job(self, manager):
+        assert json.loads(youtube_get_job_status("nope").text)['error']['type'] == 'not_found'
+        with pytest.raises(ValueError):
+            manager.submit("bogus", {})
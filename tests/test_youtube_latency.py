@@ -0,0 +1,96 @@
+"""Round-trip latency of multi-call tools against a local fake API server (no API key required)"""
+import pytest
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from googleapiclient.discovery import build
+from youtube_toolkit.tools import youtube_video
+from youtube_toolkit.tools.youtube_base import YouTubeAPIClient
+from youtube_toolkit.tools.youtube_video import youtube_get_video_metadata
+from youtube_toolkit.tools.youtube_channel import youtube_get_channel_metadata
+
+# Simulated network round trip per request
+LATENCY = 0.2
+
+CHANNEL = {
+    'id': 'UCfakefakefakefakefake00',
+    'snippet': {'title': 'Fake', 'description': '', 'publishedAt': '2020-01-01T00:00:00Z'},
+    'statistics': {'subscriberCount': '10', 'viewCount': '100', 'videoCount': '1'}
+}
+
+def _respond(path, params):
+    """Canned Data API responses by endpoint"""
+    if path.endswith('/videos'):
+        return {'items': [{
+            'id': params['id'][0],
+            'snippet': {'title': 'T', 'description': '', 'channelId': CHANNEL['id'], 'channelTitle': 'Fake',
+                        'publishedAt': '2026-01-01T00:00:00Z', 'categoryId': '27'},
+            'contentDetails': {'duration': 'PT1M'},
+            'status': {},
+            'statistics': {'viewCount': '1'}
+        }]}
+    if path.endswith('/videoCategories'):
+        return {'items': [{'snippet': {'title': 'Education'}}]}
+    if path.endswith('/channels'):
+        return {'items': [CHANNEL] if 'id' in params or 'forHandle' in params else []}
+    if path.endswith('/search'):
+        return {'items': [{'snippet': {'channelId': CHANNEL['id']}}]}
+    return {}
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(LATENCY)
+        url = urlparse(self.path)
+        body = json.dumps(_respond(url.path, parse_qs(url.query))).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def local_api(tmp_path, monkeypatch):
+    """Real discovery client pointed at a local server with simulated latency"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(transcript_cache_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    monkeypatch.setattr(youtube_video, '_category_cache', {})
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = build(
+        'youtube', 'v3', developerKey='test', static_discovery=True,
+        client_options={'api_endpoint': f"http://127.0.0.1:{server.server_port}"}
+    )
+    monkeypatch.setattr(YouTubeAPIClient, '_instance', client)
+    yield client
+    server.shutdown()
+
+def _timed(fn, *args):
+    start = time.monotonic()
+    result = json.loads(fn(*args).text)
+    return result, time.monotonic() - start
+
+class TestRoundTrips:
+    """Independent lookups should cost one round trip together, not one each"""
+
+    def test_video_metadata(self, local_api):
+        # video -> (channel, category): 2 round trips; sequentially it was 3
+        result, elapsed = _timed(youtube_get_video_metadata, 'dQw4w9WgXcQ')
+
+        assert result['category_name'] == 'Education'
+        assert result['channel']['subscriber_count'] == 10
+        assert elapsed < 2.5 * LATENCY
+
+    def test_channel_metadata_by_handle(self, local_api):
+        # forHandle returns the full channel: 1 round trip (it was username + search, then ID)
+        result, elapsed = _timed(youtube_get_channel_metadata, '@fake')
+
+        assert result['channel']['id'] == CHANNEL['id']
+        assert elapsed < 1.5 * LATENCY
@@ -0,0 +1,100 @@
+"""Tests for playlist tools against a fake API client (no API key required)"""
+import pytest
+import json
+from youtube_toolkit.tools.youtube_base import TranscriptCache, VideoMetadataCache, parse_playlist_id
+from youtube_toolkit.tools.youtube_playlist import youtube_get_playlist_videos
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(transcript_cache_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+@pytest.fixture
+def course(fake_youtube):
+    """A 120-video course playlist; 'vid007' has been deleted"""
+    video_ids = [f"vid{i:03d}" for i in range(120)]
+
+    def playlists(id, part, **params):
+        if id != 'PLcourse':
+            return {'items': []}
+        return {'items': [{
+            'id': 'PLcourse',
+            'snippet': {'title': 'Course', 'description': '', 'channelId': 'UCx', 'channelTitle': 'X'},
+            'contentDetails': {'itemCount': 120}
+        }]}
+
+    def playlist_items(playlistId, maxResults, pageToken=None, **params):
+        start = int(pageToken or 0)
+        end = min(start + maxResults, len(video_ids))
+        response = {'items': [{
+            'snippet': {'title': f"Lesson {start + i}", 'description': '', 'position': start + i,
+                        'publishedAt': '2026-01-01T00:00:00Z', 'thumbnails': {},
+                        'videoOwnerChannelId': 'UCx', 'videoOwnerChannelTitle': 'X'},
+            'contentDetails': {'videoId': v}
+        } for i, v in enumerate(video_ids[start:end])]}
+        if end < len(video_ids):
+            response['nextPageToken'] = str(end)
+        return response
+
+    def videos(id, part, **params):
+        ids = id.split(',')
+        assert len(ids) <= 50
+        return {'items': [
+            {'id': v, 'statistics': {'viewCount': '3'}, 'contentDetails': {'duration': 'PT10M'}}
+            for v in ids if v != 'vid007'
+        ]}
+
+    fake_youtube.handlers['youtube.playlists.list'] = playlists
+    fake_youtube.handlers['youtube.playlistItems.list'] = playlist_items
+    fake_youtube.handlers['youtube.videos.list'] = videos
+    return fake_youtube, video_ids
+
+class TestPlaylistVideos:
+    def test_parse_playlist_id(self):
+        assert parse_playlist_id('https://www.youtube.com/playlist?list=PLabc-1_x') == 'PLabc-1_x'
+        assert parse_playlist_id('https://youtube.com/watch?v=abc&list=PLabc&index=2') == 'PLabc'
+        assert parse_playlist_id('PLabc') == 'PLabc'
+
+    def test_large_playlist(self, mock_config, course):
+        api, video_ids = course
+        result = json.loads(youtube_get_playlist_videos(
+            'https://www.youtube.com/playlist?list=PLcourse', max_results=200
+        ).text)
+
+        assert result['playlist']['title'] == 'Course'
+        assert [v['video_id'] for v in result['videos']] == video_ids
+        assert result['videos'][5]['duration_seconds'] == 600
+        assert result['videos'][7]['unavailable'] is True
+        assert result['_metadata']['videos_unavailable'] == 1
+        assert api.count('youtube.playlistItems.list') == 3
+        assert api.count('youtube.videos.list') == 3
+        assert result['_metadata']['api_quota_cost'] == 7
+        assert VideoMetadataCache().get('vid005')['channel_id'] == 'UCx'
+
+    def test_max_results(self, mock_config, course):
+        api, video_ids = course
+        result = json.loads(youtube_get_playlist_videos('PLcourse', max_results=60).text)
+
+        assert len(result['videos']) == 60
+        assert api.count('youtube.playlistItems.list') == 2
+
+    def test_cached_transcripts_only(self, mock_config, course):
+        TranscriptCache().set('vid001', {
+            'video_id': 'vid001',
+            'full_transcript': [{'text': 'hello', 'start': 0, 'duration': 1}, {'text': 'world', 'start': 1, 'duration': 1}]
+        })
+        result = json.loads(youtube_get_playlist_videos(
+            'PLcourse', max_results=3, include_transcripts=True, scrape_missing=False
+        ).text)
+
+        assert [v['transcript'] for v in result['videos']] == [None, 'hello world', None]
+        assert result['_metadata']['transcripts_cached'] == 1
+        assert result['_metadata']['transcripts_not_cached'] == 2
+
+    def test_not_found(self, mock_config, course):
+        result = json.loads(youtube_get_playlist_videos('PLmissing').text)
+        assert result['error']['type'] == 'not_found'
@@ -0,0 +1,113 @@
+"""Tests for the transcript prefetch queue (no API key required)"""
+import pytest
+import json
+from mcp import types
+from youtube_toolkit.tools.youtube_prefetch import PrefetchQueue
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(
+        name="Test",
+        log_level="INFO",
+        youtube_api_key=None,
+        transcript_cache_dir=str(tmp_path / "cache"),
+        default_transcript_delay=10.0,
+        max_cache_age_days=30,
+        prefetch_block_cooldown=600
+    )
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_prefetch.load_config', lambda: config)
+    return config
+
+@pytest.fixture
+def fake_transcripts(monkeypatch):
+    """Replace transcript fetching with scripted responses"""
+    responses = {}
+    calls = []
+
+    def fake_get_transcript(video_id, extract_mode="full", use_cache=True, delay_seconds=None):
+        calls.append(video_id)
+        data = responses.get(video_id, {"video_id": video_id, "_metadata": {"cache_hit": False}})
+        return types.TextContent(type="text", text=json.dumps(data))
+
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_prefetch.youtube_get_video_transcript', fake_get_transcript)
+    return responses, calls
+
+class TestPrefetchQueue:
+    """Test queueing, checkpointing and resuming"""
+
+    def test_run_completes_queue(self, mock_config, fake_transcripts):
+        responses, calls = fake_transcripts
+        responses['v2'] = {"error": {"type": "no_transcript"}}
+        responses['v3'] = {"video_id": "v3", "_metadata": {"cache_hit": True}}
+
+        queue = PrefetchQueue()
+        assert queue.enqueue(video_ids=['v1', 'v2', 'v3', 'v1']) == 3
+        status = queue.run()
+
+        assert calls == ['v1', 'v2', 'v3']
+        assert status['state'] == 'complete'
+        assert status['videos'] == {"total": 3, "done": 1, "no_transcript": 1, "cached": 1}
+
+    def test_block_checkpoints_and_resumes(self, mock_config, fake_transcripts):
+        responses, calls = fake_transcripts
+        responses['v2'] = {"error": {"type": "transcript_blocked"}}
+
+        queue = PrefetchQueue()
+        queue.enqueue(video_ids=['v1', 'v2', 'v3'])
+        status = queue.run()
+
+        assert calls == ['v1', 'v2']
+        assert status['state'] == 'blocked'
+        assert status['videos']['pending'] == 2
+        assert status['blocked_until'] is not None
+
+        # A restarted process picks up from the checkpoint once the block clears
+        del responses['v2']
+        resumed = PrefetchQueue()
+        assert resumed.status()['state'] == 'blocked'
+        assert resumed.run()['state'] == 'blocked'
+        resumed.state['blocked_until'] = None
+        status = resumed.run()
+
+        assert calls == ['v1', 'v2', 'v2', 'v3']
+        assert status['state'] == 'complete'
+        assert status['totals']['blocks'] == 1
+
+    def test_repeated_failures_give_up(self, mock_config, fake_transcripts):
+        responses, calls = fake_transcripts
+        responses['bad'] = {"error": {"type": "RuntimeError", "message": "boom"}}
+
+        queue = PrefetchQueue()
+        queue.enqueue(video_ids=['bad'])
+        status = queue.run()
+
+        assert len(calls) == 3
+        assert status['videos'] == {"total": 1, "failed": 1}
+
+    def test_max_videos(self, mock_config, fake_transcripts):
+        queue = PrefetchQueue()
+        queue.enqueue(video_ids=['v1', 'v2', 'v3'])
+        status = queue.run(max_videos=2)
+
+        assert status['state'] == 'paused'
+        assert status['videos']['pending'] == 1
+
+    def test_open_breaker_is_not_a_new_block(self, mock_config, fake_transcripts):
+        responses, calls = fake_transcripts
+        responses['v1'] = {"error": {
+            "type": "transcript_blocked",
+            "details": {"circuit_breaker": {"state": "open", "retry_at": "2099-01-01T00:00:00"}}
+        }}
+
+        queue = PrefetchQueue()
+        queue.enqueue(video_ids=['v1'])
+        status = queue.run()
+
+        assert status['state'] == 'blocked'
+        assert status['blocked_until'] == "2099-01-01T00:00:00"
+        assert status['totals']['blocks'] == 0
+        assert queue.state['items']['v1']['attempts'] == 0
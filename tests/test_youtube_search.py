@@ -0,0 +1,280 @@
+"""Tests for search tools against a fake API client (no API key required)"""
+import pytest
+import json
+from youtube_toolkit.tools.youtube_search import youtube_search_videos
+
+@pytest.fixture
+def mock_config(tmp_path, monkeypatch):
+    """Point caches at a temporary directory"""
+    from youtube_toolkit.config import ServerConfig
+
+    config = ServerConfig(
+        name="Test",
+        log_level="INFO",
+        youtube_api_key=None,
+        transcript_cache_dir=str(tmp_path / "cache"),
+        search_cache_ttl_minutes=60
+    )
+    monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+    return config
+
+def _search_item(video_id):
+    return {
+        'id': {'videoId': video_id},
+        'snippet': {
+            'title': f"Video {video_id}", 'channelTitle': 'Chan', 'channelId': 'UCchanchanchanchanchan00',
+            'description': '', 'publishedAt': '2026-01-01T00:00:00Z', 'thumbnails': {}
+        }
+    }
+
+@pytest.fixture
+def search_api(fake_youtube):
+    views = {'v1': 100, 'v2': 200}
+
+    def search(**params):
+        return {'items': [_search_item(v) for v in views]}
+
+    def videos(id, part, **params):
+        return {'items': [
+            {'id': v, 'statistics': {'viewCount': str(views[v])}, 'contentDetails': {'duration': 'PT1M'}}
+            for v in id.split(',')
+        ]}
+
+    fake_youtube.handlers['youtube.search.list'] = search
+    fake_youtube.handlers['youtube.videos.list'] = videos
+    return fake_youtube, views
+
+class TestSearchCache:
+    """Test caching and statistics refresh for youtube_search_videos"""
+
+    def test_repeat_search_is_a_hit(self, mock_config, search_api):
+        api, views = search_api
+        first = json.loads(youtube_search_videos('Python  Tutorial').text)
+        second = json.loads(youtube_search_videos('python tutorial').text)
+
+        assert first['_metadata']['cache'] == 'miss'
+        assert second['_metadata']['cache'] == 'hit'
+        assert second['_metadata']['api_quota_cost'] == 0
+        assert second['results'] == first['results']
+        assert api.count('youtube.search.list') == 1
+
+    def test_different_parameters_miss(self, mock_config, search_api):
+        api, views = search_api
+        youtube_search_videos('python', order='date')
+        result = json.loads(youtube_search_videos('python', order='viewCount').text)
+
+        assert result['_metadata']['cache'] == 'miss'
+        assert api.count('youtube.search.list') == 2
+
+    def test_refresh_statistics(self, mock_config, search_api):
+        api, views = search_api
+        youtube_search_videos('python')
+        views['v1'] = 150
+        result = json.loads(youtube_search_videos('python', refresh_statistics=True).text)
+
+        assert result['_metadata']['cache'] == 'refresh'
+        assert result['_metadata']['api_quota_cost'] == 1
+        assert result['results'][0]['view_count'] == 150
+        assert api.count('youtube.search.list') == 1
+        assert api.calls[-1] == ('youtube.videos.list', {'part': 'statistics', 'id': 'v1,v2'})
+
+        # The refreshed counts are kept for later hits
+        hit = json.loads(youtube_search_videos('python').text)
+        assert hit['results'][0]['view_count'] == 150
+
+    def test_expired_and_bypassed_cache(self, mock_config, search_api):
+        api, views = search_api
+        youtube_search_videos('python')
+        assert json.loads(youtube_search_videos('python', use_cache=False).text)['_metadata']['cache'] == 'miss'
+
+        mock_config.search_cache_ttl_minutes = 0
+        assert json.loads(youtube_search_videos('python').text)['_metadata']['cache'] == 'miss'
+        assert api.count('youtube.search.list') == 3
+
+@pytest.fixture
+def paged_api(fake_youtube):
+    """120 videos served 50 per search page"""
+    all_ids = [f"vid{i:03d}" for i in range(120)]
+
+    def search(maxResults, pageToken=None, **params):
+        start = int(pageToken or 0)
+        end = min(start + maxResults, len(all_ids))
+        response = {'items': [_search_item(v) for v in all_ids[start:end]]}
+        if end < len(all_ids):
+            response['nextPageToken'] = str(end)
+        return response
+
+    def videos(id, part, **params):
+        ids = id.split(',')
+        assert len(ids) <= 50
+        return {'items': [
+            {'id': v, 'statistics': {'viewCount': '7'}, 'contentDetails': {'duration': 'PT2M'}}
+            for v in ids
+        ]}
+
+    fake_youtube.handlers['youtube.search.list'] = search
+    fake_youtube.handlers['youtube.videos.list'] = videos
+    fake_youtube.handlers['youtube.channels.list'] = lambda **params: {'items': [{
+        'id': 'UCchanchanchanchanchan00', 'snippet': {'title': 'Chan', 'description': ''}, 'statistics': {}
+    }]}
+    return fake_youtube
+
+class TestLargeResultSets:
+    """Test listings beyond the 50-ID videos.list limit"""
+
+    def test_search_beyond_50(self, mock_config, paged_api):
+        result = json.loads(youtube_search_videos('python', max_results=120).text)
+
+        assert len(result['results']) == 120
+        assert all(r['view_count'] == 7 and r['duration_seconds'] == 120 for r in result['results'])
+        assert paged_api.count('youtube.search.list') == 3
+        assert paged_api.count('youtube.videos.list') == 3
+        assert result['_metadata']['api_quota_cost'] == 303
+
+    def test_partial_last_page(self, mock_config, paged_api):
+        result = json.loads(youtube_search_videos('python', max_results=60).text)
+
+        assert len(result['results']) == 60
+        search_sizes = [p['maxResults'] for m, p in paged_api.calls if m == 'youtube.search.list']
+        assert search_sizes == [50, 10]
+
+    def test_channel_videos_beyond_50(self, mock_config, paged_api):
+        from youtube_toolkit.tools.youtube_channel import youtube_get_channel_videos
+
+        result = json.loads(youtube_get_channel_videos('UCchanchanchanchanchan00', max_results=75).text)
+
+        assert len(result['videos']) == 75
+        assert all(v['duration_seconds'] == 120 for v in result['videos'])
+        assert paged_api.count('youtube.videos.list') == 2
+
+class TestChannelSync:
+    """Test incremental channel sync against a fake uploads playlist"""
+
+    @pytest.fixture
+    def uploads(self, fake_youtube):
+        videos = []  # newest first
+
+        def playlist_items(playlistId, maxResults, pageToken=None, **params):
+            assert playlistId == 'UUchanchanchanchanchan00'
+            start = int(pageToken or 0)
+            end = min(start + maxResults, len(videos))
+            response = {'items': [{
+                'snippet': {'title': f"Video {v}", 'description': '', 'publishedAt': t,
+                            'channelTitle': 'Chan', 'thumbnails': {}},
+                'contentDetails': {'videoId': v, 'videoPublishedAt': t}
+            } for v, t in videos[start:end]]}
+            if end < len(videos):
+                response['nextPageToken'] = str(end)
+            return response
+
+        def details(id, part, **params):
+            return {'items': [
+                {'id': v, 'statistics': {'viewCount': '5'}, 'contentDetails': {'duration': 'PT3M'}}
+                for v in id.split(',')
+            ]}
+
+        fake_youtube.handlers['youtube.playlistItems.list'] = playlist_items
+        fake_youtube.handlers['youtube.videos.list'] = details
+
+        def upload(count):
+            for _ in range(count):
+                n = len(videos)
+                videos.insert(0, (f"v{n:03d}", f"2026-01-01T00:{n // 60:02d}:{n % 60:02d}Z"))
+        return fake_youtube, upload
+
+    def test_first_sync_then_delta(self, mock_config, uploads):
+        from youtube_toolkit.tools.youtube_channel import youtube_sync_channel_videos
+
+        api, upload = uploads
+        upload(120)
+        first = json.loads(youtube_sync_channel_videos('UCchanchanchanchanchan00', max_new=60).text)
+
+        assert first['sync']['first_sync'] is True
+        assert first['sync']['complete'] is False
+        assert len(first['videos']) == 60
+        assert first['new_videos'][0]['duration_seconds'] == 180
+
+        upload(2)
+        api.calls.clear()
+        second = json.loads(youtube_sync_channel_videos('UCchanchanchanchanchan00').text)
+
+        assert [v['video_id'] for v in second['new_videos']] == ['v121', 'v120']
+        assert second['sync']['first_sync'] is False
+        assert second['sync']['previous_synced_at'] is not None
+        assert (second['sync']['new_count'], second['sync']['known_count']) == (2, 60)
+        assert second['sync']['complete'] is True
+        assert len(second['videos']) == 62
+        assert second['_metadata']['api_quota_cost'] == 2
+        assert api.count('youtube.playlistItems.list') == 1
+
+    def test_no_changes(self, mock_config, uploads):
+        from youtube_toolkit.tools.youtube_channel import youtube_sync_channel_videos
+
+        api, upload = uploads
+        upload(3)
+        youtube_sync_channel_videos('UCchanchanchanchanchan00')
+        api.calls.clear()
+        result = json.loads(youtube_sync_channel_videos('UCchanchanchanchanchan00').text)
+
+        assert result['new_videos'] == []
+        assert len(result['videos']) == 3
+        assert api.count('youtube.videos.list') == 0
+
+class TestMultiSearch:
+    """Test fan-out search with cross-query dedup"""
+
+    @pytest.fixture
+    def niche_api(self, fake_youtube):
+        by_query = {
+            'python tips': ['v1', 'v2', 'v3'],
+            'python tricks': ['v2', 'v3', 'v4'],
+            'python basics': ['v5'],
+        }
+
+        def search(q, **params):
+            return {'items': [_search_item(v) for v in by_query[q]]}
+
+        def videos(id, part, **params):
+            return {'items': [
+                {'id': v, 'statistics': {'viewCount': '1'}, 'contentDetails': {'duration': 'PT1M'}}
+                for v in id.split(',')
+            ]}
+
+        fake_youtube.handlers['youtube.search.list'] = search
+        fake_youtube.handlers['youtube.videos.list'] = videos
+        return fake_youtube
+
+    def test_union_details_fetched_once(self, mock_config, niche_api):
+        from youtube_toolkit.tools.youtube_search import youtube_search_videos_multi
+
+        result = json.loads(youtube_search_videos_multi(['python tips', 'python tricks', 'Python  Tips']).text)
+
+        assert [q['query'] for q in result['queries']] == ['python tips', 'python tricks']
+        assert [r['id'] for r in result['queries'][1]['results']] == ['v2', 'v3', 'v4']
+        assert result['unique_videos'] == 4
+        assert {o['id'] for o in result['overlap']} == {'v2', 'v3'}
+        assert niche_api.count('youtube.search.list') == 2
+        assert niche_api.calls[-1] == ('youtube.videos.list', {'part': 'statistics,contentDetails', 'id': 'v1,v2,v3,v4'})
+        assert result['_metadata']['api_quota_cost'] == 201
+
+    def test_shares_cache_with_single_search(self, mock_config, niche_api):
+        from youtube_toolkit.tools.youtube_search import youtube_search_videos_multi
+
+        youtube_search_videos('python tips')
+        niche_api.calls.clear()
+        result = json.loads(youtube_search_videos_multi(['python tips', 'python basics']).text)
+
+        assert [q['cache'] for q in result['queries']] == ['hit', 'miss']
+        assert niche_api.count('youtube.search.list') == 1
+        assert json.loads(youtube_search_videos('python basics').text)['_metadata']['cache'] == 'hit'
+
+    def test_quota_budget(self, mock_config, niche_api):
+        from youtube_toolkit.tools.youtube_search import youtube_search_videos_multi
+
+        result = json.loads(youtube_search_videos_multi(
+            ['python tips', 'python tricks', 'python basics'], quota_budget=250
+        ).text)
+
+        assert result['skipped_queries'] == ['python basics']
+        assert result['queries'][2]['cache'] == 'skipped'
+        assert result['_metadata']['api_quota_cost'] <= 250
@@ -1,11 +1,17 @@
 """Tests for YouTube tools that don't require API key"""
 import pytest
 import json
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from youtube_toolkit.tools.youtube_base import (
     parse_video_id, parse_duration, TranscriptCache,
-    extract_intro, extract_outro, extract_main_samples
+    extract_intro, extract_outro, extract_main_samples,
+    tokenize, compute_transcript_features, stale_feature_groups,
+    TRANSCRIPT_FEATURE_VERSIONS, SingleFlight, execute_api_request, single_flight,
+    ScrapeRateController, CircuitOpenError, format_error_response,
+    track_api_retries, api_retry_count
 )
 
 class TestVideoIdParsing:
@@ -111,6 +117,7 @@ class TestTranscriptCache:
         )
         
         monkeypatch.setattr('youtube_toolkit.config.load_config', lambda: mock_config)
+        monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: mock_config)
         return TranscriptCache()
     
     def test_cache_set_and_get(self, cache):
@@ -195,6 +202,393 @@ class TestTranscriptCache:
         specific_info = cache.get_info('test1')
         assert specific_info['video_id'] == 'test1'
         assert specific_info['cached'] is True
+    
+    def test_ensure_features_recomputes_only_stale_groups(self, cache, monkeypatch):
+        """Test that a schema bump recomputes just the affected feature group"""
+        transcript = [
+            {'text': 'python decorators explained', 'start': 0, 'duration': 30},
+            {'text': 'python decorators in practice', 'start': 30, 'duration': 30}
+        ]
+        features = compute_transcript_features(transcript, 60)
+        features['ngrams'] = {'marker': True}
+        cache.set('feat1', {'full_transcript': transcript, 'duration': 60, 'features': features})
+        fetched_at = cache.get('feat1')['fetched_at']
+        
+        bumped = dict(TRANSCRIPT_FEATURE_VERSIONS, pace=TRANSCRIPT_FEATURE_VERSIONS['pace'] + 1)
+        monkeypatch.setattr('youtube_toolkit.tools.youtube_base.TRANSCRIPT_FEATURE_VERSIONS', bumped)
+        
+        data = cache.ensure_features('feat1', cache.get('feat1'))
+        
+        assert data['features']['schema_versions']['pace'] == bumped['pace']
+        # Untouched group kept its stored value
+        assert data['features']['ngrams'] == {'marker': True}
+        stored = cache.get('feat1')
+        assert stored['features']['schema_versions']['pace'] == bumped['pace']
+        assert stored['fetched_at'] == fetched_at
+
+class TestNegativeCache:
+    """Test negative caching of videos without usable transcripts"""
+    
+    @pytest.fixture
+    def mock_config(self, tmp_path, monkeypatch):
+        from youtube_toolkit.config import ServerConfig
+        
+        config = ServerConfig(
+            name="Test",
+            log_level="INFO",
+            youtube_api_key=None,
+            transcript_cache_dir=str(tmp_path / "cache"),
+            default_transcript_delay=1.0,
+            max_cache_age_days=30,
+            negative_cache_ttl_hours=24,
+            blocked_cache_ttl_minutes=5
+        )
+        monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+        monkeypatch.setattr('youtube_toolkit.tools.youtube_video.load_config', lambda: config)
+        monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+        monkeypatch.setattr(
+            'youtube_toolkit.tools.youtube_video.scrape_controller',
+            ScrapeRateController(initial_delay=1.0, min_delay=1.0, max_delay=60, breaker_cooldown=60)
+        )
+        return config
+    
+    def test_negative_entries_have_separate_ttls(self, mock_config):
+        cache = TranscriptCache()
+        disabled = cache.set_negative('v1', 'disabled')
+        blocked = cache.set_negative('v2', 'blocked')
+        
+        assert cache.get_negative('v1')['reason'] == 'disabled'
+        disabled_ttl = datetime.fromisoformat(disabled['expires_at']) - datetime.fromisoformat(disabled['fetched_at'])
+        blocked_ttl = datetime.fromisoformat(blocked['expires_at']) - datetime.fromisoformat(blocked['fetched_at'])
+        assert disabled_ttl == timedelta(hours=24)
+        assert blocked_ttl == timedelta(minutes=5)
+        
+        info = cache.get_info()
+        assert info['negative_entries'] == {'disabled': 1, 'blocked': 1, 'expired': 0}
+        assert info['total_files'] == 0
+        assert cache.get_info('v1')['negative']['reason'] == 'disabled'
+    
+    def test_expired_and_superseded_entries(self, mock_config):
+        cache = TranscriptCache()
+        entry = cache.set_negative('v1', 'blocked')
+        entry['expires_at'] = (datetime.now() - timedelta(seconds=1)).isoformat()
+        with open(cache.get_negative_path('v1'), 'w') as f:
+            json.dump(entry, f)
+        assert cache.get_negative('v1') is None
+        assert cache.get_info()['negative_entries']['expired'] == 1
+        
+        cache.set_negative('v2', 'disabled')
+        cache.set('v2', {'video_id': 'v2'})
+        assert cache.get_negative('v2') is None
+        
+        cache.set_negative('v3', 'disabled')
+        cache.clear(video_id='v3')
+        assert cache.get_negative('v3') is None
+    
+    def test_transcript_tool_uses_negative_cache(self, mock_config, monkeypatch):
+        from youtube_transcript_api import TranscriptsDisabled
+        from youtube_toolkit.tools import youtube_video
+        
+        fetches = []
+        class DisabledApi:
+            def fetch(self, video_id):
+                fetches.append(video_id)
+                raise TranscriptsDisabled(video_id)
+        monkeypatch.setattr(youtube_video, 'YouTubeTranscriptApi', DisabledApi)
+        
+        first = json.loads(youtube_video.youtube_get_video_transcript('nocaps').text)
+        second = json.loads(youtube_video.youtube_get_video_transcript('nocaps').text)
+        
+        assert fetches == ['nocaps']
+        assert first['error']['type'] == second['error']['type'] == 'no_transcript'
+        assert first['error']['details']['negative_cache']['hit'] is False
+        assert second['error']['details']['negative_cache']['hit'] is True
+        
+        # Bypassing the cache retries the scrape
+        youtube_video.youtube_get_video_transcript('nocaps', use_cache=False)
+        assert fetches == ['nocaps', 'nocaps']
+
+class TestTranscriptFeatures:
+    """Test precomputed transcript analytics features"""
+    
+    def test_tokenize(self):
+        assert tokenize("Don't PANIC, it's 42!") == ["don't", "panic", "it's", "42"]
+        assert tokenize("") == []
+    
+    def test_compute_transcript_features(self):
+        transcript = [
+            {'text': 'welcome to the python course', 'start': 0, 'duration': 30},
+            {'text': 'python decorators wrap functions', 'start': 30, 'duration': 30},
+            {'text': 'decorators are functions too', 'start': 60, 'duration': 30},
+            {'text': 'thanks for watching bye', 'start': 90, 'duration': 30}
+        ]
+        features = compute_transcript_features(transcript, 120)
+        
+        assert features['vocabulary']['word_count'] == 17
+        assert features['pace']['words_per_minute'] == 8.5
+        assert features['segments']['segment_count'] == 4
+        assert features['segments']['segments_per_minute'] == 2.0
+        top_unigrams = {g['ngram']: g['count'] for g in features['ngrams']['top_unigrams']}
+        assert top_unigrams['python'] == 2
+        assert 'the' not in top_unigrams
+        assert {g['ngram'] for g in features['ngrams']['top_bigrams']} >= {'python decorators'}
+        assert stale_feature_groups(features) == []
+    
+    def test_compute_features_empty_transcript(self):
+        features = compute_transcript_features([], 0)
+        
+        assert features['pace']['words_per_minute'] == 0.0
+        assert features['pace']['intro_outro_pace_ratio'] is None
+        assert features['vocabulary']['type_token_ratio'] == 0.0
+    
+    def test_stale_feature_groups(self):
+        assert set(stale_feature_groups(None)) == set(TRANSCRIPT_FEATURE_VERSIONS)
+        assert stale_feature_groups({'schema_versions': {}, 'pace': {}}) != []
+class TestSingleFlight:
+    """Test coalescing of concurrent identical fetches"""
+    
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        executions = []
+        started = threading.Event()
+        
+        def slow_fetch():
+            executions.append(1)
+            started.set()
+            time.sleep(0.1)
+            return {'items': ['video']}
+        
+        results = []
+        def caller():
+            results.append(flight.do(('videos.list', 'id=abc'), slow_fetch))
+        
+        leader = threading.Thread(target=caller)
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=caller) for _ in range(3)]
+        for t in followers:
+            t.start()
+        for t in [leader] + followers:
+            t.join()
+        
+        assert len(executions) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert all(result == {'items': ['video']} for result, _ in results)
+        # Followers get independent copies
+        assert len({id(result) for result, _ in results}) == 4
+        stats = flight.get_stats()
+        assert stats['operations']['videos.list'] == {'calls': 4, 'executions': 1, 'coalesced': 3}
+        assert stats['in_flight'] == 0
+    
+    def test_errors_are_shared_and_not_cached(self):
+        flight = SingleFlight()
+        
+        def failing():
+            raise RuntimeError("boom")
+        
+        with pytest.raises(RuntimeError):
+            flight.do(('transcript', 'x'), failing)
+        assert flight.do(('transcript', 'x'), lambda: 'ok') == ('ok', False)
+    
+    def test_execute_api_request_coalesces_gets(self):
+        class FakeRequest:
+            method = 'GET'
+            methodId = 'youtube.test.list'
+            uri = 'https://example.invalid/youtube/v3/test?id=1'
+            calls = 0
+            
+            def execute(self, http=None):
+                FakeRequest.calls += 1
+                time.sleep(0.1)
+                return {'items': []}
+        
+        threads = [threading.Thread(target=execute_api_request, args=(FakeRequest(),)) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert FakeRequest.calls == 1
+        assert single_flight.get_stats()['operations']['youtube.test.list']['coalesced'] == 2
+
+class TestScrapeRateController:
+    """Test adaptive scrape pacing and the circuit breaker"""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock that sleeping advances"""
+        now = [1000.0]
+        monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr(time, 'sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+        return now
+    
+    @pytest.fixture
+    def controller(self, clock):
+        return ScrapeRateController(initial_delay=10, min_delay=1, max_delay=100, breaker_cooldown=60)
+    
+    def test_spacing_adapts_to_success(self, controller):
+        assert controller.acquire() == 0
+        controller.record_success()
+        assert controller.acquire() == pytest.approx(10)
+        assert controller.delay == pytest.approx(9)
+        
+        for _ in range(50):
+            controller.record_success()
+        assert controller.delay == 1
+        
+        # A caller-requested delay is a floor on top of the adaptive delay
+        controller.acquire()
+        assert controller.acquire(min_delay=5) == pytest.approx(1)
+        assert controller.acquire() == pytest.approx(5)
+    
+    def test_block_opens_breaker(self, controller, clock):
+        controller.acquire()
+        controller.record_block()
+        status = controller.get_status()
+        
+        assert status['state'] == 'open'
+        assert status['delay_seconds'] == 20
+        assert status['retry_at'] is not None
+        with pytest.raises(CircuitOpenError):
+            controller.acquire()
+        
+        # Cool-down is 60s with up to 50% jitter; then one trial is let through
+        clock[0] += 91
+        assert controller.get_status()['state'] == 'half_open'
+        controller.acquire()
+        with pytest.raises(CircuitOpenError):
+            controller.acquire()
+        
+        # Another block doubles the cool-down
+        controller.record_block()
+        clock[0] += 91
+        assert controller.get_status()['state'] == 'open'
+        clock[0] += 90
+        controller.acquire()
+        controller.record_success()
+        
+        status = controller.get_status()
+        assert status['state'] == 'closed'
+        assert status['stats']['blocks'] == 2
+        assert status['stats']['rejected'] == 2
+    
+    def test_transcript_tool_fails_fast_while_open(self, tmp_path, monkeypatch, controller):
+        from youtube_toolkit.config import ServerConfig
+        from youtube_toolkit.tools import youtube_video
+        
+        config = ServerConfig(transcript_cache_dir=str(tmp_path / "cache"))
+        monkeypatch.setattr('youtube_toolkit.tools.youtube_base.load_config', lambda: config)
+        monkeypatch.setattr(youtube_video, 'load_config', lambda: config)
+        monkeypatch.setattr(youtube_video, 'scrape_controller', controller)
+        class BlockedApi:
+            def fetch(self, video_id):
+                raise AssertionError("should not scrape while the breaker is open")
+        monkeypatch.setattr(youtube_video, 'YouTubeTranscriptApi', BlockedApi)
+        
+        TranscriptCache().set('cached', {
+            'video_id': 'cached', 'duration': 0, 'full_transcript': [],
+            'intro': [], 'outro': [], 'main_samples': [], 'transcript_length': 0
+        })
+        controller.record_block()
+        
+        result = json.loads(youtube_video.youtube_get_video_transcript('uncached').text)
+        assert result['error']['type'] == 'transcript_blocked'
+        assert result['error']['details']['circuit_breaker']['state'] == 'open'
+        
+        cached = json.loads(youtube_video.youtube_get_video_transcript('cached').text)
+        assert cached['_metadata']['cache_hit'] is True
+
+def _http_error(status, reason=None):
+    """Build an HttpError the way the API client raises it"""
+    from googleapiclient.errors import HttpError
+    
+    class Resp(dict):
+        pass
+    resp = Resp()
+    resp.status = status
+    resp.reason = 'error'
+    errors = [{'reason': reason}] if reason else []
+    content = json.dumps({'error': {'code': status, 'message': 'error', 'errors': errors}}).encode()
+    return HttpError(resp, content)
+
+class TestApiRetries:
+    """Test retry with backoff for transient Data API failures"""
+    
+    @pytest.fixture
+    def no_sleep(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+        return sleeps
+    
+    def _request(self, outcomes):
+        class FakeRequest:
+            method = 'GET'
+            methodId = 'youtube.retry.list'
+            uri = f'https://example.invalid/youtube/v3/retry?n={id(outcomes)}'
+            calls = 0
+            
+            def execute(self, http=None):
+                FakeRequest.calls += 1
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+        return FakeRequest
+    
+    def test_transient_errors_are_retried(self, no_sleep):
+        FakeRequest = self._request([
+            _http_error(500, 'backendError'), _http_error(403, 'rateLimitExceeded'), {'items': [1]}
+        ])
+        
+        @track_api_retries
+        def tool():
+            response = execute_api_request(FakeRequest())
+            return response, api_retry_count()
+        
+        assert tool() == ({'items': [1]}, 2)
+        assert FakeRequest.calls == 3
+        assert len(no_sleep) == 2
+        assert all(0 <= s <= 2 for s in no_sleep)
+    
+    def test_quota_errors_are_not_retried(self, no_sleep):
+        FakeRequest = self._request([_http_error(403, 'quotaExceeded'), {'items': []}])
+        
+        with pytest.raises(Exception) as exc_info:
+            execute_api_request(FakeRequest())
+        
+        assert FakeRequest.calls == 1
+        assert format_error_response(exc_info.value)['error']['type'] == 'quota_exceeded'
+    
+    def test_deadline_stops_retries(self, no_sleep):
+        FakeRequest = self._request([_http_error(503), _http_error(503), {'items': []}])
+        
+        with pytest.raises(Exception):
+            execute_api_request(FakeRequest(), deadline_seconds=0)
+        assert FakeRequest.calls == 1
+    
+    def test_nested_tracking_adds_up(self, no_sleep):
+        FakeRequest = self._request([_http_error(429), {'items': []}])
+        
+        @track_api_retries
+        def inner():
+            execute_api_request(FakeRequest())
+        
+        @track_api_retries
+        def outer():
+            inner()
+            return api_retry_count()
+        
+        assert outer() == 1
+        assert api_retry_count() == 0
+    
+    def test_error_classification(self):
+        assert format_error_response(_http_error(403, 'quotaExceeded'))['error']['type'] == 'quota_exceeded'
+        assert format_error_response(_http_error(403, 'rateLimitExceeded'))['error']['type'] == 'rate_limited'
+        assert format_error_response(_http_error(403, 'forbidden'))['error']['type'] == 'forbidden'
+        assert format_error_response(_http_error(403))['error']['type'] == 'quota_exceeded'
+        backend = format_error_response(_http_error(503, 'backendError'))['error']
+        assert backend['type'] == 'api_error_503'
+        assert backend['retryable'] is True
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -19,6 +19,32 @@ class ServerConfig:
     transcript_cache_dir: str = os.getenv("TRANSCRIPT_CACHE_DIR", "./transcript_cache")
     default_transcript_delay: float = float(os.getenv("DEFAULT_TRANSCRIPT_DELAY", "10.0"))
     max_cache_age_days: int = int(os.getenv("MAX_CACHE_AGE_DAYS", "30"))
+    # Negative cache TTLs: captions disabled/missing vs. transient blocking
+    negative_cache_ttl_hours: float = float(os.getenv("NEGATIVE_CACHE_TTL_HOURS", "168"))
+    blocked_cache_ttl_minutes: float = float(os.getenv("BLOCKED_CACHE_TTL_MINUTES", "15"))
+    # Defaults to a "metadata" directory inside the transcript cache
+    metadata_cache_dir: Optional[str] = os.getenv("METADATA_CACHE_DIR", None)
+    # How long a resolved handle/username -> channel ID mapping is trusted
+    channel_alias_ttl_days: float = float(os.getenv("CHANNEL_ALIAS_TTL_DAYS", "30"))
+    # How long youtube_search_videos results are reused before searching again
+    search_cache_ttl_minutes: float = float(os.getenv("SEARCH_CACHE_TTL_MINUTES", "60"))
+    # How long cached comments are served before an incremental refresh
+    comment_cache_ttl_minutes: float = float(os.getenv("COMMENT_CACHE_TTL_MINUTES", "60"))
+    # Seconds to pause prefetching after transcript blocking (doubles on repeats)
+    prefetch_block_cooldown: float = float(os.getenv("PREFETCH_BLOCK_COOLDOWN", "900"))
+    # Data API retries for transient failures, within a per-call deadline (seconds)
+    api_max_retries: int = int(os.getenv("API_MAX_RETRIES", "4"))
+    api_call_deadline: float = float(os.getenv("API_CALL_DEADLINE", "60"))
+    # Adaptive transcript scrape pacing: delay bounds and circuit-breaker cool-down
+    scrape_min_delay: float = float(os.getenv("SCRAPE_MIN_DELAY", "1.0"))
+    scrape_max_delay: float = float(os.getenv("SCRAPE_MAX_DELAY", "120"))
+    scrape_breaker_cooldown: float = float(os.getenv("SCRAPE_BREAKER_COOLDOWN", "300"))
+    # Concurrent transcript scrapes per priority class (interactive requests go first)
+    scrape_interactive_concurrency: int = int(os.getenv("SCRAPE_INTERACTIVE_CONCURRENCY", "2"))
+    scrape_harvest_concurrency: int = int(os.getenv("SCRAPE_HARVEST_CONCURRENCY", "1"))
+    scrape_prefetch_concurrency: int = int(os.getenv("SCRAPE_PREFETCH_CONCURRENCY", "1"))
+    # Concurrent background jobs (harvests)
+    job_max_workers: int = int(os.getenv("JOB_MAX_WORKERS", "2"))
 
 
 def load_config() -> ServerConfig:
@@ -29,5 +55,21 @@ def load_config() -> ServerConfig:
         youtube_api_key=os.getenv("YOUTUBE_API_KEY", None),
         transcript_cache_dir=os.getenv("TRANSCRIPT_CACHE_DIR", "./transcript_cache"),
         default_transcript_delay=float(os.getenv("DEFAULT_TRANSCRIPT_DELAY", "10.0")),
-        max_cache_age_days=int(os.getenv("MAX_CACHE_AGE_DAYS", "30"))
+        max_cache_age_days=int(os.getenv("MAX_CACHE_AGE_DAYS", "30")),
+        negative_cache_ttl_hours=float(os.getenv("NEGATIVE_CACHE_TTL_HOURS", "168")),
+        blocked_cache_ttl_minutes=float(os.getenv("BLOCKED_CACHE_TTL_MINUTES", "15")),
+        metadata_cache_dir=os.getenv("METADATA_CACHE_DIR", None),
+        channel_alias_ttl_days=float(os.getenv("CHANNEL_ALIAS_TTL_DAYS", "30")),
+        search_cache_ttl_minutes=float(os.getenv("SEARCH_CACHE_TTL_MINUTES", "60")),
+        comment_cache_ttl_minutes=float(os.getenv("COMMENT_CACHE_TTL_MINUTES", "60")),
+        prefetch_block_cooldown=float(os.getenv("PREFETCH_BLOCK_COOLDOWN", "900")),
+        api_max_retries=int(os.getenv("API_MAX_RETRIES", "4")),
+        api_call_deadline=float(os.getenv("API_CALL_DEADLINE", "60")),
+        scrape_min_delay=float(os.getenv("SCRAPE_MIN_DELAY", "1.0")),
+        scrape_max_delay=float(os.getenv("SCRAPE_MAX_DELAY", "120")),
+        scrape_breaker_cooldown=float(os.getenv("SCRAPE_BREAKER_COOLDOWN", "300")),
+        scrape_interactive_concurrency=int(os.getenv("SCRAPE_INTERACTIVE_CONCURRENCY", "2")),
+        scrape_harvest_concurrency=int(os.getenv("SCRAPE_HARVEST_CONCURRENCY", "1")),
+        scrape_prefetch_concurrency=int(os.getenv("SCRAPE_PREFETCH_CONCURRENCY", "1")),
+        job_max_workers=int(os.getenv("JOB_MAX_WORKERS", "2"))
     )
@@ -1,9 +1,10 @@
 """MCP server implementation for YouTube toolkit"""
 
 import asyncio
+import json
 import sys
 import click
-from typing import Optional
+from typing import List, Optional
 
 from mcp import types
 from mcp.server.fastmcp import FastMCP
@@ -13,13 +14,35 @@ from youtube_toolkit.logging_config import setup_logging, logger
 # YouTube tool imports
 from youtube_toolkit.tools.youtube_video import (
     youtube_get_video_metadata,
-    youtube_get_video_transcript
+    youtube_get_video_transcript,
+    youtube_refresh_statistics
 )
 from youtube_toolkit.tools.youtube_channel import (
     youtube_get_channel_videos,
-    youtube_get_channel_metadata
+    youtube_get_channel_metadata,
+    youtube_get_channels_metadata,
+    youtube_sync_channel_videos
+)
+from youtube_toolkit.tools.youtube_playlist import youtube_get_playlist_videos
+from youtube_toolkit.tools.youtube_comments import youtube_get_video_comments
+from youtube_toolkit.tools.youtube_search import youtube_search_videos, youtube_search_videos_multi
+from youtube_toolkit.tools.youtube_analysis import (
+    youtube_analyze_videos,
+    youtube_find_duplicate_videos
+)
+from youtube_toolkit.tools.youtube_status import youtube_get_toolkit_status
+from youtube_toolkit.tools.youtube_history import youtube_get_stats_history
+from youtube_toolkit.tools.youtube_export import youtube_export_catalog
+from youtube_toolkit.tools.youtube_jobs import (
+    youtube_submit_channel_harvest,
+    youtube_get_job_status,
+    youtube_get_job_result
+)
+from youtube_toolkit.tools.youtube_prefetch import (
+    PrefetchQueue,
+    youtube_prefetch_transcripts,
+    youtube_get_prefetch_status
 )
-from youtube_toolkit.tools.youtube_search import youtube_search_videos
 
 
 def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
@@ -60,6 +83,27 @@ API quota cost: 3 units"""
         """Fetch YouTube video metadata"""
         return youtube_get_video_metadata(video_id, include_statistics)
 
+    @mcp_server.tool(
+        name="youtube_refresh_statistics",
+        description="""Refresh view, like and comment counts for many known videos in bulk.
+
+Parameters:
+- video_ids (optional): List of video IDs or URLs
+- channel_ids (optional): Refresh every video cached for these channels (from earlier listing or metadata calls)
+- max_concurrency (optional, default: 4): videos.list batches in flight at once
+
+Returns: Per-video counts with view_change since the cached value, updated count, not_found (deleted or private videos)
+Note: Requests only part=statistics, 50 videos per call. Results are written to the metadata cache and statistics history as each batch arrives
+API quota cost: 1 unit per 50 videos"""
+    )
+    def youtube_refresh_statistics_tool(
+        video_ids: Optional[List[str]] = None,
+        channel_ids: Optional[List[str]] = None,
+        max_concurrency: int = 4
+    ) -> types.TextContent:
+        """Bulk-refresh video statistics"""
+        return youtube_refresh_statistics(video_ids, channel_ids, max_concurrency)
+
     @mcp_server.tool(
         name="youtube_get_video_transcript",
         description="""Fetch and intelligently cache video transcripts with flexible extraction modes.
@@ -71,8 +115,9 @@ Parameters:
   * 'analysis': Intro (first 60s) + outro (last 60s) + 3 main content samples
   * 'intro_only': First 60 seconds only
   * 'outro_only': Last 60 seconds only
-- use_cache (optional, default: true): Use cached transcript if available
-- delay_seconds (optional, default: 10): Seconds to wait before scraping (minimum 1s recommended to avoid IP blocking)
+  * 'features': Precomputed analytics only (words per minute, segment density, vocabulary size, top n-grams, intro vs outro pace)
+- use_cache (optional, default: true): Use cached transcript if available; also reuses remembered 'no transcript' and 'blocked' results until they expire
+- delay_seconds (optional): Minimum seconds between scrapes (minimum 1s). By default scrapes are paced adaptively, starting at 10s and speeding up while YouTube answers normally
 
 Returns: Transcript text with timing data, metadata including cache status
 Note: Uses web scraping; delays prevent IP blocking by YouTube"""
@@ -92,14 +137,15 @@ Note: Uses web scraping; delays prevent IP blocking by YouTube"""
         description="""List recent videos from a YouTube channel with detailed metadata.
 
 Parameters:
-- channel_id (required): YouTube channel ID (must start with 'UC', e.g., 'UCuAXFkgsw1L7xaCfnd5JJOw')
-- max_results (optional, default: 10): Number of videos to return (1-50)
+- channel_id (required): YouTube channel ID (e.g., 'UCuAXFkgsw1L7xaCfnd5JJOw'), '@handle', username, or channel URL; names are resolved once and cached
+- max_results (optional, default: 10): Number of videos to return (pages of 50 beyond that)
 - include_transcripts (optional, default: false): Fetch transcript for each video
 - use_cache (optional, default: true): Use cached transcripts when available
-- delay_seconds (optional, default: 10): Seconds to wait between transcript fetches (minimum 1s recommended to avoid IP blocking)
+- delay_seconds (optional): Minimum seconds between transcript fetches (minimum 1s); adaptive pacing when omitted
+- skip_likely_duplicates (optional, default: false): Skip transcript scraping for videos whose title and duration match a video with a known transcript (reuploads); such videos get 'duplicate_of'
 
 Returns: Channel info with subscriber count, array of videos with metadata, transcript data if requested
-Note: Including transcripts significantly increases processing time. First video has no delay, subsequent videos use delay_seconds.
+Note: Including transcripts significantly increases processing time. If YouTube blocks scraping, the remaining videos are returned with cached transcripts only.
 API quota cost: 101+ units (1 channel + 100 search + details)"""
     )
     def youtube_get_channel_videos_tool(
@@ -107,10 +153,96 @@ API quota cost: 101+ units (1 channel + 100 search + details)"""
         max_results: int = 10,
         include_transcripts: bool = False,
         use_cache: bool = True,
-        delay_seconds: Optional[float] = None
+        delay_seconds: Optional[float] = None,
+        skip_likely_duplicates: bool = False
     ) -> types.TextContent:
         """List videos from a YouTube channel"""
-        return youtube_get_channel_videos(channel_id, max_results, include_transcripts, use_cache, delay_seconds)
+        return youtube_get_channel_videos(
+            channel_id, max_results, include_transcripts, use_cache, delay_seconds, skip_likely_duplicates
+        )
+
+    @mcp_server.tool(
+        name="youtube_sync_channel_videos",
+        description="""Incrementally sync a channel: fetch only uploads added since the last sync.
+
+Parameters:
+- channel_id (required): YouTube channel ID (starts with 'UC'), '@handle', username, or channel URL
+- max_new (optional, default: 50): Most new videos to fetch per sync (also the size of the first sync)
+- include_transcripts (optional, default: false): Fetch (and cache) transcripts for new videos only
+- use_cache (optional, default: true): Use cached transcripts when available
+- delay_seconds (optional): Minimum seconds between transcript fetches; adaptive pacing when omitted
+
+Returns: new_videos (the delta), videos (merged view of all known videos, newest first), sync info (first_sync, previous_synced_at, new_count, known_count, complete)
+Note: The per-channel snapshot is stored on disk. Statistics of previously synced videos are as of their sync.
+API quota cost: 1 unit per 50 uploads scanned plus 1 per 50 new videos (usually 2 units when little changed)"""
+    )
+    def youtube_sync_channel_videos_tool(
+        channel_id: str,
+        max_new: int = 50,
+        include_transcripts: bool = False,
+        use_cache: bool = True,
+        delay_seconds: Optional[float] = None
+    ) -> types.TextContent:
+        """Sync new uploads from a YouTube channel"""
+        return youtube_sync_channel_videos(channel_id, max_new, include_transcripts, use_cache, delay_seconds)
+
+    # YouTube Comment Tools
+    @mcp_server.tool(
+        name="youtube_get_video_comments",
+        description="""Fetch comment threads (newest first) for one or more videos, e.g. for audience analysis.
+
+Parameters:
+- video_ids (required): List of video IDs or URLs
+- max_comments (optional, default: 100): Most comment threads per video; pagination stops once reached
+- include_replies (optional, default: false): Include up to 5 replies per thread (no extra quota)
+- use_cache (optional, default: true): Use and incrementally refresh cached comments
+- max_concurrency (optional, default: 4): Videos fetched at once
+
+Comments are cached per video. Within COMMENT_CACHE_TTL_MINUTES (default: 60) cached comments are returned without API calls; after that only threads newer than the newest cached one are fetched.
+
+Returns: Per video: threads (author, text, like count, reply count, published time, optional replies), complete flag and cache status (hit, refresh, miss); per-video errors such as comments_disabled
+API quota cost: 1 unit per page of up to 100 threads; 0 for cache hits"""
+    )
+    def youtube_get_video_comments_tool(
+        video_ids: List[str],
+        max_comments: int = 100,
+        include_replies: bool = False,
+        use_cache: bool = True,
+        max_concurrency: int = 4
+    ) -> types.TextContent:
+        """Get comments for YouTube videos"""
+        return youtube_get_video_comments(video_ids, max_comments, include_replies, use_cache, max_concurrency)
+
+    # YouTube Playlist Tools
+    @mcp_server.tool(
+        name="youtube_get_playlist_videos",
+        description="""List the videos of a playlist (e.g., a course) in playlist order with metadata and optional transcripts.
+
+Parameters:
+- playlist_id (required): Playlist ID (e.g., 'PLxxxxxxxx') or a URL with a list= parameter
+- max_results (optional, default: 50): Maximum number of videos to return
+- include_transcripts (optional, default: false): Add each video's transcript text
+- use_cache (optional, default: true): Use cached transcripts when available
+- scrape_missing (optional, default: true): Scrape transcripts that aren't cached (rate limited); false returns cached transcripts only
+- delay_seconds (optional): Minimum seconds between transcript scrapes; adaptive pacing when omitted
+
+Pages are listed 50 at a time while each page's durations and statistics load in the background, so large playlists take a few round trips.
+
+Returns: Playlist info (title, channel, item count) and videos with position, title, description, duration, view/like/comment counts and transcript. Deleted or private entries are marked unavailable.
+API quota cost: 1 unit + 2 units per 50 videos"""
+    )
+    def youtube_get_playlist_videos_tool(
+        playlist_id: str,
+        max_results: int = 50,
+        include_transcripts: bool = False,
+        use_cache: bool = True,
+        scrape_missing: bool = True,
+        delay_seconds: Optional[float] = None
+    ) -> types.TextContent:
+        """Get videos from a YouTube playlist"""
+        return youtube_get_playlist_videos(
+            playlist_id, max_results, include_transcripts, use_cache, scrape_missing, delay_seconds
+        )
 
 
     # YouTube Search Tools
@@ -120,32 +252,68 @@ API quota cost: 101+ units (1 channel + 100 search + details)"""
 
 Parameters:
 - query (required): Search terms (e.g., 'python tutorial')
-- max_results (optional, default: 10): Number of results (1-50)
+- max_results (optional, default: 10): Number of results (pages of 50 beyond that)
 - order (optional, default: 'relevance'): Sort by 'relevance', 'date', 'viewCount', or 'rating'
 - published_after (optional): ISO 8601 date string (e.g., '2024-01-01T00:00:00Z')
+- use_cache (optional, default: true): Reuse the result of an identical search made within the cache TTL (default 60 minutes)
+- refresh_statistics (optional, default: false): On a cache hit, update view and like counts with a cheap videos.list call
 
-Returns: Search query echo, array of video results with metadata including title, description, channel, duration, view count
-API quota cost: 100 units per search"""
+Returns: Search query echo, array of video results with metadata including title, description, channel, duration, view count; _metadata.cache is 'hit', 'refresh' or 'miss'
+API quota cost: 100 units per search; 0 on a cache hit, 1 unit per 50 results for a statistics refresh"""
     )
     def youtube_search_videos_tool(
         query: str,
         max_results: int = 10,
         order: str = "relevance",
-        published_after: Optional[str] = None
+        published_after: Optional[str] = None,
+        use_cache: bool = True,
+        refresh_statistics: bool = False
     ) -> types.TextContent:
         """Search YouTube videos"""
-        return youtube_search_videos(query, max_results, order, published_after)
+        return youtube_search_videos(query, max_results, order, published_after, use_cache, refresh_statistics)
+
+    @mcp_server.tool(
+        name="youtube_search_videos_multi",
+        description="""Run several related searches at once (e.g., keyword variations when researching a niche) with results grouped by query.
+
+Parameters:
+- queries (required): List of search queries
+- max_results_per_query (optional, default: 10): Results per query
+- order (optional, default: 'relevance'): Sort by 'relevance', 'date', 'viewCount', or 'rating'
+- published_after (optional): ISO 8601 date string
+- quota_budget (optional): Most quota units to spend; queries that don't fit are skipped and listed
+- use_cache (optional, default: true): Reuse cached results (shared with youtube_search_videos)
+- max_concurrency (optional, default: 4): Searches in flight at once
+
+Searches run concurrently. Videos found by several queries have their details fetched once: a single videos.list pass covers the union of all results.
+
+Returns: Per query: cache status and results (same fields as youtube_search_videos); unique_videos; overlap (videos found by more than one query, with their queries); skipped_queries
+API quota cost: 100 units per query not in the cache (per 50 results), plus 1 unit per 50 unique videos"""
+    )
+    def youtube_search_videos_multi_tool(
+        queries: List[str],
+        max_results_per_query: int = 10,
+        order: str = "relevance",
+        published_after: Optional[str] = None,
+        quota_budget: Optional[int] = None,
+        use_cache: bool = True,
+        max_concurrency: int = 4
+    ) -> types.TextContent:
+        """Search YouTube for several queries"""
+        return youtube_search_videos_multi(
+            queries, max_results_per_query, order, published_after, quota_budget, use_cache, max_concurrency
+        )
 
     @mcp_server.tool(
         name="youtube_get_channel_metadata",
         description="""Fetch comprehensive channel information including statistics, branding, and configuration.
 
 Parameters:
-- channel_id (required): Channel ID, username, or handle (e.g., 'UCBJycsmduvYEL83R_U4JriQ', 'mkbhd', '@mkbhd')
+- channel_id (required): Channel ID, handle, username, or channel URL (e.g., 'UCBJycsmduvYEL83R_U4JriQ', '@mkbhd', 'mkbhd', 'youtube.com/@mkbhd')
 
 Returns: Channel title, handle, custom URL, description, country, creation date, statistics (subscribers, views, video count), branding (keywords, banner URL), content playlists, and channel status
 
-API quota cost: 3 units (direct ID) or 103 units (username/handle lookup requires search)"""
+API quota cost: 1 unit (direct ID or '@handle'), 2 units (bare name: handle and username are tried together), 0 extra for names resolved before (persistent alias cache); search (100 units) only if neither matches"""
     )
     def youtube_get_channel_metadata_tool(
         channel_id: str
@@ -153,12 +321,254 @@ API quota cost: 3 units (direct ID) or 103 units (username/handle lookup require
         """Get detailed channel metadata"""
         return youtube_get_channel_metadata(channel_id)
 
+    @mcp_server.tool(
+        name="youtube_get_channels_metadata",
+        description="""Fetch metadata for many channels at once (e.g., 50-200 channels for a competitive comparison).
+
+Parameters:
+- channel_ids (required): Channel IDs, handles, usernames, or channel URLs, mixed freely
+- max_concurrency (optional, default: 4): API calls in flight at once
+
+Channel IDs and previously resolved names need no lookup; other names are resolved concurrently and cached. All channels are then fetched 50 per channels.list call, so 200 channels take about 4 calls in a single round trip.
+
+Returns: One entry per input, in order, with either 'channel' (same fields as youtube_get_channel_metadata) or 'error' (e.g., channel_not_found); plus found/failed counts
+
+API quota cost: 1 unit per 50 channels, plus 1-2 units per name not resolved before"""
+    )
+    def youtube_get_channels_metadata_tool(
+        channel_ids: List[str],
+        max_concurrency: int = 4
+    ) -> types.TextContent:
+        """Get metadata for many channels"""
+        return youtube_get_channels_metadata(channel_ids, max_concurrency)
+
+    @mcp_server.tool(
+        name="youtube_export_catalog",
+        description="""Stream every video of a channel or playlist to an NDJSON or CSV file on disk, for offline analysis of large catalogs (5,000+ uploads).
+
+Parameters:
+- channel_id (optional): Channel ID, handle, username, or channel URL; exports its uploads
+- playlist_id (optional): Playlist ID (use instead of channel_id)
+- output_path (optional): File to write (default: exports/<playlist id>.<format> in the cache directory)
+- output_format (optional, default: 'ndjson'): 'ndjson' (one JSON object per line) or 'csv'
+- max_videos (optional): Write at most this many videos in this call; call again to continue
+- include_details (optional, default: true): Add duration, views, likes and comments
+- restart (optional, default: false): Discard the checkpoint and start a new file
+
+Videos are written page by page with constant memory; each page's details load while the next page is listed. Progress is checkpointed after every page, so an interrupted or partial export resumes where it stopped when called again with the same output path.
+
+Returns: Output path, total videos written, videos written by this call, and whether the catalog is complete
+
+API quota cost: 1 unit per 50 videos listed, plus 1 unit per 50 videos for details"""
+    )
+    def youtube_export_catalog_tool(
+        channel_id: Optional[str] = None,
+        playlist_id: Optional[str] = None,
+        output_path: Optional[str] = None,
+        output_format: str = "ndjson",
+        max_videos: Optional[int] = None,
+        include_details: bool = True,
+        restart: bool = False
+    ) -> types.TextContent:
+        """Export a channel or playlist catalog"""
+        return youtube_export_catalog(
+            channel_id, playlist_id, output_path, output_format, max_videos, include_details, restart
+        )
+
+    # Analysis Tools
+    @mcp_server.tool(
+        name="youtube_analyze_videos",
+        description="""Compare cached videos server-side using TF-IDF over titles, descriptions and transcripts.
+
+Parameters:
+- video_ids (optional): Video IDs to include (must have been fetched before)
+- channel_ids (optional): Include every cached video from these channels
+- fields (optional, default: all): Any of 'title', 'description', 'transcript'
+- top_terms (optional, default: 10): Terms returned per creator
+- max_videos (optional, default: 200): Maximum videos to analyze
+
+Returns: Video-by-video similarity matrix, most similar pairs, distinctive terms per creator and topic-coverage gaps (terms other creators cover that a creator does not)
+Note: Uses metadata cached by youtube_get_channel_videos/youtube_get_video_metadata and cached transcripts only
+API quota cost: 0 units"""
+    )
+    def youtube_analyze_videos_tool(
+        video_ids: Optional[List[str]] = None,
+        channel_ids: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        top_terms: int = 10,
+        max_videos: int = 200
+    ) -> types.TextContent:
+        """Analyze cached videos"""
+        return youtube_analyze_videos(video_ids, channel_ids, fields, top_terms, max_videos)
+
+    @mcp_server.tool(
+        name="youtube_find_duplicate_videos",
+        description="""Find cached videos whose transcripts near-duplicate a given video (reuploads, clips, compilations).
+
+Parameters:
+- video_id (required): YouTube video ID or URL; its transcript must already be cached
+- threshold (optional, default: 0.7): Minimum estimated transcript similarity (0-1)
+- backfill_index (optional, default: false): Index transcripts cached before duplicate detection existed
+
+Returns: Matching video IDs with estimated similarity, title and channel when known
+Note: Uses a MinHash/LSH index built as transcripts are cached, so no pairwise comparison against the whole cache
+API quota cost: 0 units"""
+    )
+    def youtube_find_duplicate_videos_tool(
+        video_id: str,
+        threshold: float = 0.7,
+        backfill_index: bool = False
+    ) -> types.TextContent:
+        """Find near-duplicate videos"""
+        return youtube_find_duplicate_videos(video_id, threshold, backfill_index)
+
+    @mcp_server.tool(
+        name="youtube_get_stats_history",
+        description="""Report how video or channel statistics changed over time, from locally recorded snapshots.
+
+Parameters:
+- entity_ids (required): List of video IDs or channel IDs
+- kind (optional, default: 'video'): 'video' (views, likes, comments) or 'channel' (subscribers, views, video count)
+- since (optional): ISO 8601 start of the query window (default: all history)
+- until (optional): ISO 8601 end of the query window (default: now)
+- include_points (optional, default: false): Include every snapshot in the window
+
+Returns: Per entity: latest values, growth over the window (start, end, change, change_pct, per_day) and over the last 24h/7d/30d; missing lists IDs without history
+Note: A snapshot is recorded whenever youtube_get_video_metadata, youtube_get_channel_metadata, youtube_get_channel_videos or youtube_sync_channel_videos fetch statistics
+API quota cost: 0 units"""
+    )
+    def youtube_get_stats_history_tool(
+        entity_ids: List[str],
+        kind: str = "video",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        include_points: bool = False
+    ) -> types.TextContent:
+        """Query statistics history"""
+        return youtube_get_stats_history(entity_ids, kind, since, until, include_points)
+
+    # Background Job Tools
+    @mcp_server.tool(
+        name="youtube_submit_channel_harvest",
+        description="""Start a youtube_get_channel_videos harvest in the background and return a job ID immediately.
+
+Parameters:
+- channel_id (required): YouTube channel ID (starts with 'UC'), '@handle', username, or channel URL
+- max_results (optional, default: 10): Number of videos to harvest
+- include_transcripts (optional, default: true): Fetch transcript for each video
+- use_cache (optional, default: true): Use cached transcripts when available
+- delay_seconds (optional): Minimum seconds between transcript fetches; adaptive pacing when omitted
+- skip_likely_duplicates (optional, default: false): Skip transcript scraping for likely reuploads
+
+Returns: job_id and status ('queued')
+Note: Poll youtube_get_job_status for progress and fetch the output with youtube_get_job_result. Results are persisted and survive reconnects; jobs interrupted by a server restart are requeued.
+API quota cost: same as youtube_get_channel_videos, charged as the job runs"""
+    )
+    def youtube_submit_channel_harvest_tool(
+        channel_id: str,
+        max_results: int = 10,
+        include_transcripts: bool = True,
+        use_cache: bool = True,
+        delay_seconds: Optional[float] = None,
+        skip_likely_duplicates: bool = False
+    ) -> types.TextContent:
+        """Submit a background channel harvest"""
+        return youtube_submit_channel_harvest(
+            channel_id, max_results, include_transcripts, use_cache, delay_seconds, skip_likely_duplicates
+        )
+
+    @mcp_server.tool(
+        name="youtube_get_job_status",
+        description="""Get status and progress of a background job.
+
+Parameters:
+- job_id (optional): Job to inspect; omit to list recent jobs
+
+Returns: Status ('queued', 'running', 'completed', 'failed'), progress (completed/total videos), timings and error if any
+API quota cost: 0 units"""
+    )
+    def youtube_get_job_status_tool(
+        job_id: Optional[str] = None
+    ) -> types.TextContent:
+        """Get background job status"""
+        return youtube_get_job_status(job_id)
+
+    @mcp_server.tool(
+        name="youtube_get_job_result",
+        description="""Fetch the result of a finished background job.
+
+Parameters:
+- job_id (required): Job ID returned by a submit tool
+
+Returns: The harvest result (same shape as youtube_get_channel_videos) plus a '_job' summary, or a 'job_not_finished' error with current progress
+API quota cost: 0 units"""
+    )
+    def youtube_get_job_result_tool(
+        job_id: str
+    ) -> types.TextContent:
+        """Get background job result"""
+        return youtube_get_job_result(job_id)
+
+    # Cache Warming Tools
+    @mcp_server.tool(
+        name="youtube_prefetch_transcripts",
+        description="""Queue channels, playlists or videos for background transcript cache warming.
+
+Parameters:
+- channel_ids (optional): Channel IDs whose recent uploads should be cached
+- playlist_ids (optional): Playlist IDs whose videos should be cached
+- video_ids (optional): Individual video IDs or URLs
+- max_videos_per_source (optional, default: 50): Videos taken from each channel/playlist
+- delay_seconds (optional): Minimum seconds between transcript scrapes; adaptive pacing when omitted
+- start (optional, default: true): Start or resume the background worker
+
+Returns: Queue status (state, per-status video counts, sources, block cool-down)
+Note: The queue is persisted and checkpointed after every video. A rate-limit block pauses the worker with a cool-down instead of losing progress; call again to resume.
+API quota cost: 1 unit per 50 videos when expanding channels/playlists"""
+    )
+    def youtube_prefetch_transcripts_tool(
+        channel_ids: Optional[List[str]] = None,
+        playlist_ids: Optional[List[str]] = None,
+        video_ids: Optional[List[str]] = None,
+        max_videos_per_source: int = 50,
+        delay_seconds: Optional[float] = None,
+        start: bool = True
+    ) -> types.TextContent:
+        """Queue transcript prefetching"""
+        return youtube_prefetch_transcripts(
+            channel_ids, playlist_ids, video_ids, max_videos_per_source, delay_seconds, start
+        )
+
+    @mcp_server.tool(
+        name="youtube_get_prefetch_status",
+        description="""Report progress of the transcript prefetch queue.
+
+Returns: State ('running', 'blocked', 'paused' or 'complete'), video counts by status (pending, done, cached, no_transcript, failed), sources, block cool-down end time and lifetime totals
+API quota cost: 0 units"""
+    )
+    def youtube_get_prefetch_status_tool() -> types.TextContent:
+        """Get prefetch queue status"""
+        return youtube_get_prefetch_status()
+
+    # Status Tools
+    @mcp_server.tool(
+        name="youtube_get_toolkit_status",
+        description="""Report runtime metrics of the toolkit's shared fetch machinery.
+
+Returns: Request coalescing per operation: calls, executions and coalesced calls (concurrent identical transcript scrapes or Data API requests that shared one in-flight fetch)
+- transcript_scraping: adaptive scrape delay, circuit breaker state ('closed', 'open' or 'half_open'), retry time while open, and scrape/block counters
+API quota cost: 0 units"""
+    )
+    def youtube_get_toolkit_status_tool() -> types.TextContent:
+        """Get toolkit runtime status"""
+        return youtube_get_toolkit_status()
+
 
 # Create a server instance that can be imported by the MCP CLI
 server = create_mcp_server()
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--port", default=3001, help="Port to listen on for SSE")
 @click.option(
     "--transport",
@@ -166,8 +576,11 @@ server = create_mcp_server()
     default="stdio",
     help="Transport type (stdio or sse)",
 )
-def main(port: int, transport: str) -> int:
+@click.pass_context
+def main(ctx: click.Context, port: int, transport: str) -> int:
     """Run the server with specified transport."""
+    if ctx.invoked_subcommand is not None:
+        return 0
     try:
         if transport == "stdio":
             asyncio.run(server.run_stdio_async())
@@ -183,5 +596,47 @@ def main(port: int, transport: str) -> int:
         return 1
 
 
+@main.command()
+@click.option("--channel", "channel_ids", multiple=True, help="Channel ID to prefetch (repeatable)")
+@click.option("--playlist", "playlist_ids", multiple=True, help="Playlist ID to prefetch (repeatable)")
+@click.option("--video", "video_ids", multiple=True, help="Video ID or URL to prefetch (repeatable)")
+@click.option("--max-videos-per-source", default=50, help="Videos taken from each channel/playlist")
+@click.option("--max-videos", type=int, default=None, help="Stop after processing this many videos")
+@click.option("--delay", "delay_seconds", type=float, default=None, help="Seconds between transcript scrapes")
+@click.option("--wait-on-block/--stop-on-block", default=True,
+              help="Sleep through rate-limit cool-downs instead of stopping")
+def prefetch(channel_ids, playlist_ids, video_ids, max_videos_per_source, max_videos,
+             delay_seconds, wait_on_block) -> None:
+    """Warm the transcript cache. Progress is checkpointed; rerun to resume."""
+    queue = PrefetchQueue.get_instance()
+    queue.enqueue(list(channel_ids), list(playlist_ids), list(video_ids), max_videos_per_source)
+    try:
+        status = queue.run(max_videos=max_videos, delay_seconds=delay_seconds, wait_on_block=wait_on_block)
+    except KeyboardInterrupt:
+        logger.info("Prefetch interrupted; progress is saved")
+        status = queue.status()
+    click.echo(json.dumps(status, indent=2))
+
+
+@main.command()
+@click.option("--channel", "channel_id", default=None, help="Channel ID, handle, or URL whose uploads to export")
+@click.option("--playlist", "playlist_id", default=None, help="Playlist ID to export")
+@click.option("--output", "output_path", default=None, help="File to write (default: exports/ in the cache directory)")
+@click.option("--format", "output_format", type=click.Choice(["ndjson", "csv"]), default="ndjson", help="Output format")
+@click.option("--max-videos", type=int, default=None, help="Stop after writing this many videos")
+@click.option("--details/--no-details", "include_details", default=True, help="Include duration and statistics")
+@click.option("--restart", is_flag=True, help="Discard the checkpoint and start over")
+def export(channel_id, playlist_id, output_path, output_format, max_videos, include_details, restart) -> None:
+    """Export a full channel or playlist catalog. Progress is checkpointed; rerun to resume."""
+    try:
+        response = youtube_export_catalog(
+            channel_id, playlist_id, output_path, output_format, max_videos, include_details, restart
+        )
+    except KeyboardInterrupt:
+        logger.info("Export interrupted; progress is saved")
+        return
+    click.echo(response.text)
+
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -3,18 +3,55 @@
 # Export all YouTube tools
 from youtube_toolkit.tools.youtube_video import (
     youtube_get_video_metadata,
-    youtube_get_video_transcript
+    youtube_get_video_transcript,
+    youtube_refresh_statistics
 )
 from youtube_toolkit.tools.youtube_channel import (
     youtube_get_channel_videos,
-    youtube_get_channel_metadata
+    youtube_get_channel_metadata,
+    youtube_get_channels_metadata,
+    youtube_sync_channel_videos
 )
-from youtube_toolkit.tools.youtube_search import youtube_search_videos
+from youtube_toolkit.tools.youtube_playlist import youtube_get_playlist_videos
+from youtube_toolkit.tools.youtube_comments import youtube_get_video_comments
+from youtube_toolkit.tools.youtube_search import youtube_search_videos, youtube_search_videos_multi
+from youtube_toolkit.tools.youtube_analysis import (
+    youtube_analyze_videos,
+    youtube_find_duplicate_videos
+)
+from youtube_toolkit.tools.youtube_prefetch import (
+    youtube_prefetch_transcripts,
+    youtube_get_prefetch_status
+)
+from youtube_toolkit.tools.youtube_jobs import (
+    youtube_submit_channel_harvest,
+    youtube_get_job_status,
+    youtube_get_job_result
+)
+from youtube_toolkit.tools.youtube_status import youtube_get_toolkit_status
+from youtube_toolkit.tools.youtube_history import youtube_get_stats_history
+from youtube_toolkit.tools.youtube_export import youtube_export_catalog
 
 __all__ = [
     'youtube_get_video_metadata',
     'youtube_get_video_transcript',
+    'youtube_refresh_statistics',
     'youtube_get_channel_videos',
     'youtube_get_channel_metadata',
-    'youtube_search_videos'
+    'youtube_get_channels_metadata',
+    'youtube_sync_channel_videos',
+    'youtube_get_playlist_videos',
+    'youtube_get_video_comments',
+    'youtube_search_videos',
+    'youtube_search_videos_multi',
+    'youtube_analyze_videos',
+    'youtube_find_duplicate_videos',
+    'youtube_prefetch_transcripts',
+    'youtube_get_prefetch_status',
+    'youtube_submit_channel_harvest',
+    'youtube_get_job_status',
+    'youtube_get_job_result',
+    'youtube_get_toolkit_status',
+    'youtube_get_stats_history',
+    'youtube_export_catalog'
 ]
\ No newline at end of file
@@ -0,0 +1,355 @@
+"""Cross-video analysis tools over cached metadata and transcripts"""
+import json
+import math
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+from mcp import types
+from youtube_toolkit.tools.youtube_base import (
+    TranscriptCache, VideoMetadataCache, format_error_response,
+    parse_video_id, tokenize, STOPWORDS, cached_channel_id
+)
+from youtube_toolkit.logging_config import logger
+
+ANALYSIS_FIELDS = ("title", "description", "transcript")
+
+def _analysis_terms(text: str) -> List[str]:
+    """Tokens worth weighting: no stopwords, numbers or very short words"""
+    return [
+        t for t in tokenize(text)
+        if len(t) > 2 and t not in STOPWORDS and not t.isdigit()
+    ]
+
+def build_tfidf_vectors(documents: List[List[str]]) -> Tuple[List[str], List[Dict[int, float]]]:
+    """
+    Build L2-normalized TF-IDF vectors for a batch of tokenized documents.
+
+    Rows are sparse (column index -> weight) so the term-frequency matrix
+    stays proportional to the number of non-zero entries.
+
+    Args:
+        documents: Token lists, one per document
+
+    Returns:
+        Vocabulary (column index -> term) and one sparse row per document
+    """
+    vocabulary: Dict[str, int] = {}
+    term_counts = []
+    for tokens in documents:
+        counts = Counter()
+        for token in tokens:
+            counts[vocabulary.setdefault(token, len(vocabulary))] += 1
+        term_counts.append(counts)
+
+    # Document frequency per column, then smoothed IDF
+    document_frequency = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+    n_docs = len(documents)
+    idf = {
+        col: math.log((1 + n_docs) / (1 + df)) + 1
+        for col, df in document_frequency.items()
+    }
+
+    rows = []
+    for counts in term_counts:
+        # Sublinear TF keeps long transcripts from drowning out titles
+        row = {col: (1 + math.log(tf)) * idf[col] for col, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in row.values()))
+        rows.append({col: w / norm for col, w in row.items()} if norm else {})
+
+    terms = [None] * len(vocabulary)
+    for term, col in vocabulary.items():
+        terms[col] = term
+    return terms, rows
+
+def similarity_matrix(rows: List[Dict[int, float]]) -> List[List[float]]:
+    """
+    Cosine similarity between all rows (rows must be L2-normalized).
+
+    Computes the product X·Xᵀ through per-term posting lists, so only
+    documents sharing a term are ever multiplied together.
+    """
+    postings = defaultdict(list)
+    for i, row in enumerate(rows):
+        for col, weight in row.items():
+            postings[col].append((i, weight))
+
+    n = len(rows)
+    matrix = [[0.0] * n for _ in range(n)]
+    for posting in postings.values():
+        for i, wi in posting:
+            matrix_i = matrix[i]
+            for j, wj in posting:
+                matrix_i[j] += wi * wj
+
+    return [[round(min(value, 1.0), 4) for value in row] for row in matrix]
+
+def _centroid(rows: List[Dict[int, float]]) -> Dict[int, float]:
+    """Mean of sparse rows"""
+    total = defaultdict(float)
+    for row in rows:
+        for col, weight in row.items():
+            total[col] += weight
+    return {col: weight / len(rows) for col, weight in total.items()} if rows else {}
+
+def _collect_documents(
+    video_ids: Optional[List[str]],
+    channel_ids: Optional[List[str]],
+    fields: List[str],
+    max_videos: int
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Load cached metadata/transcripts and build per-video token lists"""
+    metadata_cache = VideoMetadataCache()
+    transcript_cache = TranscriptCache()
+
+    entries = []
+    missing = []
+    if video_ids:
+        for video_id in video_ids:
+            entry = metadata_cache.get(video_id)
+            if entry is None and transcript_cache.get(video_id) is None:
+                missing.append(video_id)
+                continue
+            entries.append(entry or {'video_id': video_id})
+    if channel_ids:
+        seen = {e['video_id'] for e in entries}
+        for channel_id in channel_ids:
+            channel_entries = metadata_cache.list(cached_channel_id(channel_id) or channel_id)
+            if not channel_entries:
+                missing.append(channel_id)
+            entries.extend(e for e in channel_entries if e['video_id'] not in seen)
+
+    documents = []
+    for entry in entries[:max_videos]:
+        video_id = entry['video_id']
+        tokens = []
+        used_fields = []
+        if 'title' in fields and entry.get('title'):
+            tokens += _analysis_terms(entry['title'])
+            used_fields.append('title')
+        if 'description' in fields and entry.get('description'):
+            tokens += _analysis_terms(entry['description'])
+            used_fields.append('description')
+        if 'transcript' in fields:
+            cached = transcript_cache.get(video_id)
+            if cached and cached.get('full_transcript'):
+                tokens += _analysis_terms(' '.join(e['text'] for e in cached['full_transcript']))
+                used_fields.append('transcript')
+        documents.append({
+            'video_id': video_id,
+            'title': entry.get('title'),
+            'channel_id': entry.get('channel_id') or 'unknown',
+            'channel_title': entry.get('channel_title'),
+            'fields_used': used_fields,
+            'tokens': tokens
+        })
+    return documents, missing
+
+def youtube_analyze_videos(
+    video_ids: Optional[List[str]] = None,
+    channel_ids: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    top_terms: int = 10,
+    max_videos: int = 200
+) -> types.TextContent:
+    """
+    Compare cached videos with TF-IDF over titles, descriptions and transcripts.
+
+    Args:
+        video_ids: Videos to include (must already be cached)
+        channel_ids: Include every cached video of these channels
+        fields: Text fields to analyze (title, description, transcript)
+        top_terms: Number of terms per creator in term/gap lists
+        max_videos: Maximum number of videos to analyze
+
+    Returns:
+        Similarity matrix, distinctive terms per creator and topic-coverage gaps
+    """
+    try:
+        fields = fields or list(ANALYSIS_FIELDS)
+        invalid = [f for f in fields if f not in ANALYSIS_FIELDS]
+        if invalid:
+            raise ValueError(f"Unknown fields {invalid}; use {list(ANALYSIS_FIELDS)}")
+        if not video_ids and not channel_ids:
+            raise ValueError("Provide video_ids and/or channel_ids")
+
+        documents, missing = _collect_documents(video_ids, channel_ids, fields, max_videos)
+        terms, rows = build_tfidf_vectors([d['tokens'] for d in documents])
+        matrix = similarity_matrix(rows)
+
+        # Most similar distinct pairs
+        pairs = sorted(
+            (
+                (matrix[i][j], i, j)
+                for i in range(len(documents))
+                for j in range(i + 1, len(documents))
+                if matrix[i][j] > 0
+            ),
+            reverse=True
+        )[:top_terms]
+
+        # Group rows by creator and compare centroids
+        creator_rows = defaultdict(list)
+        for document, row in zip(documents, rows):
+            creator_rows[document['channel_id']].append(row)
+        centroids = {creator: _centroid(r) for creator, r in creator_rows.items()}
+
+        creators = {}
+        for creator, centroid in centroids.items():
+            others = [c for other, c in centroids.items() if other != creator]
+            other_mean = _centroid(others)
+
+            distinctive = sorted(
+                ((weight - other_mean.get(col, 0.0), col) for col, weight in centroid.items()),
+                reverse=True
+            )
+
+            # Terms other creators cover that this creator never uses
+            gap_scores = defaultdict(float)
+            covered_by = defaultdict(list)
+            for other, other_centroid in centroids.items():
+                if other == creator:
+                    continue
+                for col, weight in other_centroid.items():
+                    if col not in centroid:
+                        gap_scores[col] += weight
+                        covered_by[col].append(other)
+            gaps = sorted(((score, col) for col, score in gap_scores.items()), reverse=True)
+
+            sample = next(d for d in documents if d['channel_id'] == creator)
+            creators[creator] = {
+                "channel_title": sample['channel_title'],
+                "video_count": len(creator_rows[creator]),
+                "distinctive_terms": [
+                    {"term": terms[col], "score": round(score, 4)}
+                    for score, col in distinctive[:top_terms] if score > 0
+                ],
+                "coverage_gaps": [
+                    {"term": terms[col], "score": round(score, 4), "covered_by": covered_by[col]}
+                    for score, col in gaps[:top_terms]
+                ]
+            }
+
+        result = {
+            "videos": [
+                {
+                    "video_id": d['video_id'],
+                    "title": d['title'],
+                    "channel_id": d['channel_id'],
+                    "fields_used": d['fields_used'],
+                    "term_count": len(d['tokens'])
+                }
+                for d in documents
+            ],
+            "similarity": {
+                "video_ids": [d['video_id'] for d in documents],
+                "matrix": matrix
+            },
+            "most_similar_pairs": [
+                {
+                    "video_ids": [documents[i]['video_id'], documents[j]['video_id']],
+                    "similarity": score
+                }
+                for score, i, j in pairs
+            ],
+            "creators": creators,
+            "missing": missing,
+            "_metadata": {
+                "api_quota_cost": 0,  # Works entirely from local caches
+                "videos_analyzed": len(documents),
+                "vocabulary_size": len(terms),
+                "fields": fields,
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error analyzing videos: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
+
+def youtube_find_duplicate_videos(
+    video_id: str,
+    threshold: float = 0.7,
+    backfill_index: bool = False
+) -> types.TextContent:
+    """
+    Find cached videos whose transcripts are near-duplicates of a video.
+
+    Args:
+        video_id: YouTube video ID or URL (its transcript must be cached)
+        threshold: Minimum estimated Jaccard similarity (0-1) of transcript shingles
+        backfill_index: Index cached transcripts stored before signatures existed
+
+    Returns:
+        Near-duplicate videos sorted by similarity
+    """
+    try:
+        video_id = parse_video_id(video_id)
+        cache = TranscriptCache()
+
+        backfilled = 0
+        if backfill_index:
+            for cache_file in cache.cache_dir.glob("*.json"):
+                if cache_file.stem in cache.lsh_index:
+                    continue
+                data = cache.get(cache_file.stem)
+                if data and data.get('full_transcript'):
+                    cache.ensure_minhash(cache_file.stem, data)
+                    backfilled += 1
+
+        data = cache.get(video_id)
+        if not data or 'full_transcript' not in data:
+            return types.TextContent(
+                type="text",
+                text=json.dumps({
+                    "error": {
+                        "type": "not_cached",
+                        "message": f"No cached transcript for video {video_id}; fetch it with youtube_get_video_transcript first"
+                    }
+                })
+            )
+        data = cache.ensure_minhash(video_id, data)
+
+        metadata_cache = VideoMetadataCache()
+        duplicates = []
+        for match in cache.lsh_index.query(data['minhash'], threshold, exclude=video_id):
+            metadata = metadata_cache.get(match['video_id']) or {}
+            duplicates.append({
+                **match,
+                "title": metadata.get('title'),
+                "channel_id": metadata.get('channel_id'),
+                "duration_seconds": metadata.get('duration_seconds')
+            })
+
+        result = {
+            "video_id": video_id,
+            "threshold": threshold,
+            "duplicates": duplicates,
+            "_metadata": {
+                "api_quota_cost": 0,
+                "indexed_videos": len(cache.lsh_index.video_ids()),
+                "backfilled": backfilled,
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error finding duplicate videos: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
@@ -1,15 +1,27 @@
 """Base utilities for YouTube tools"""
 import os
+import copy
+import functools
+import hashlib
 import json
+import random
 import re
+import threading
 import time
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_toolkit.config import load_config
+from youtube_toolkit.logging_config import logger
 
 class YouTubeAPIClient:
     """Singleton YouTube API client"""
@@ -24,16 +36,532 @@ class YouTubeAPIClient:
             cls._instance = build('youtube', 'v3', developerKey=config.youtube_api_key)
         return cls._instance
 
+class SingleFlight:
+    """Coalesces concurrent identical calls into a single execution.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and share its result (or exception). Keys are tuples
+    whose first element names the operation, which is used for metrics.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[tuple, Dict[str, Any]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+    
+    def do(self, key: tuple, fn) -> tuple:
+        """
+        Run `fn` once for all concurrent callers with the same key.
+        
+        Returns:
+            (result, shared) where shared is True if this caller joined
+            another caller's in-flight execution
+        """
+        with self._lock:
+            stats = self._stats.setdefault(key[0], {"calls": 0, "executions": 0, "coalesced": 0})
+            stats["calls"] += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._in_flight[key] = call
+                stats["executions"] += 1
+            else:
+                stats["coalesced"] += 1
+        
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            # Each caller gets its own copy; tools decorate results in place
+            return copy.deepcopy(call["result"]), True
+        
+        try:
+            call["result"] = fn()
+            return call["result"], False
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call["done"].set()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Calls, executions and coalesced calls per operation"""
+        with self._lock:
+            operations = copy.deepcopy(self._stats)
+            in_flight = len(self._in_flight)
+        return {
+            "operations": operations,
+            "total_coalesced": sum(s["coalesced"] for s in operations.values()),
+            "in_flight": in_flight
+        }
+
+# Shared by the transcript scraper and the Data API client
+single_flight = SingleFlight()
+
+# Longest circuit-breaker cool-down after repeated blocking
+MAX_BREAKER_COOLDOWN = 6 * 3600
+
+class CircuitOpenError(Exception):
+    """Raised when transcript scraping is paused by the circuit breaker"""
+    
+    def __init__(self, retry_at: datetime):
+        super().__init__(f"Transcript scraping paused until {retry_at.isoformat()}")
+        self.retry_at = retry_at
+
+class ScrapeRateController:
+    """Adaptive pacing and circuit breaker shared by all transcript scrapes.
+    
+    Scrapes are spaced at least `delay` seconds apart across threads. Each
+    success shortens the delay towards `min_delay`; a block doubles it and
+    opens the breaker for a jittered, exponentially growing cool-down.
+    While open, scrapes fail fast so callers serve cached data only. When
+    the cool-down ends a single trial scrape is let through (half-open):
+    success closes the breaker, another block reopens it for longer.
+    """
+    
+    SPEEDUP_FACTOR = 0.9
+    
+    def __init__(
+        self,
+        initial_delay: Optional[float] = None,
+        min_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        breaker_cooldown: Optional[float] = None
+    ):
+        config = load_config()
+        self.min_delay = min_delay if min_delay is not None else config.scrape_min_delay
+        self.max_delay = max_delay if max_delay is not None else config.scrape_max_delay
+        self.breaker_cooldown = breaker_cooldown if breaker_cooldown is not None else config.scrape_breaker_cooldown
+        initial = initial_delay if initial_delay is not None else config.default_transcript_delay
+        self.delay = min(self.max_delay, max(self.min_delay, initial))
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._open_until: Optional[float] = None
+        self._trial_in_flight = False
+        self._consecutive_blocks = 0
+        self._stats = {"scrapes": 0, "successes": 0, "blocks": 0, "rejected": 0, "waited_seconds": 0.0}
+    
+    def _state(self, now: float) -> str:
+        if self._open_until is None:
+            return "closed"
+        return "open" if now < self._open_until else "half_open"
+    
+    def acquire(self, min_delay: Optional[float] = None) -> float:
+        """
+        Wait for the next scrape slot.
+        
+        Args:
+            min_delay: Caller-requested minimum spacing (on top of the adaptive delay)
+        
+        Returns:
+            Seconds waited
+        
+        Raises:
+            CircuitOpenError: While the breaker is open, or a half-open trial is running
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            if state == "open" or (state == "half_open" and self._trial_in_flight):
+                self._stats["rejected"] += 1
+                retry_in = max(0.0, (self._open_until or now) - now)
+                raise CircuitOpenError(datetime.now() + timedelta(seconds=retry_in))
+            if state == "half_open":
+                self._trial_in_flight = True
+            spacing = max(self.delay, min_delay or 0.0)
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + spacing
+            wait = slot - now
+            self._stats["scrapes"] += 1
+            self._stats["waited_seconds"] += wait
+        if wait > 0:
+            logger.info(f"Waiting {wait:.1f}s before fetching transcript...")
+            time.sleep(wait)
+        return wait
+    
+    def time_until_slot(self) -> float:
+        """
+        Seconds until acquire() would return without sleeping.
+        
+        Zero while the breaker is open, since acquire() then fails fast.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state(now) == "open":
+                return 0.0
+            return max(0.0, self._next_slot - now)
+    
+    def record_success(self):
+        """The scrape got a normal answer from YouTube (including 'no transcript')"""
+        with self._lock:
+            self._stats["successes"] += 1
+            self._consecutive_blocks = 0
+            self._open_until = None
+            self._trial_in_flight = False
+            self.delay = max(self.min_delay, self.delay * self.SPEEDUP_FACTOR)
+    
+    def record_block(self):
+        """YouTube blocked the scrape: slow down and open the breaker"""
+        with self._lock:
+            self._stats["blocks"] += 1
+            self._consecutive_blocks += 1
+            self._trial_in_flight = False
+            self.delay = min(self.max_delay, self.delay * 2)
+            cooldown = min(
+                MAX_BREAKER_COOLDOWN,
+                self.breaker_cooldown * 2 ** (self._consecutive_blocks - 1)
+            ) * random.uniform(1.0, 1.5)
+            now = time.monotonic()
+            self._open_until = now + cooldown
+            self._next_slot = max(self._next_slot, self._open_until)
+        logger.warning(f"Transcript scraping blocked; circuit open for {cooldown:.0f}s, delay now {self.delay:.1f}s")
+    
+    def record_failure(self):
+        """The scrape failed for a reason unrelated to blocking"""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Breaker state, current delay and counters"""
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now)
+            retry_at = None
+            if state == "open":
+                retry_at = (datetime.now() + timedelta(seconds=self._open_until - now)).isoformat()
+            return {
+                "state": state,
+                "delay_seconds": round(self.delay, 3),
+                "min_delay_seconds": self.min_delay,
+                "max_delay_seconds": self.max_delay,
+                "consecutive_blocks": self._consecutive_blocks,
+                "retry_at": retry_at,
+                "stats": {**self._stats, "waited_seconds": round(self._stats["waited_seconds"], 3)}
+            }
+
+scrape_controller = ScrapeRateController()
+
+# Transcript scrape priority classes, highest first
+SCRAPE_PRIORITIES = ("interactive", "harvest", "prefetch")
+
+class ScrapeScheduler:
+    """Hands out transcript scrape slots by priority class.
+    
+    Every scrape waits here before it reaches the rate controller. When the
+    controller's next slot comes up it goes to the oldest waiter of the
+    highest-priority class that is below its concurrency limit, so an
+    interactive request overtakes queued harvest and prefetch scrapes
+    instead of waiting behind them. A class at its limit doesn't hold back
+    lower classes, which keeps batch throughput when few people are waiting.
+    """
+    
+    def __init__(self, controller: ScrapeRateController, limits: Optional[Dict[str, int]] = None):
+        config = load_config()
+        self.controller = controller
+        self.limits = limits or {
+            "interactive": config.scrape_interactive_concurrency,
+            "harvest": config.scrape_harvest_concurrency,
+            "prefetch": config.scrape_prefetch_concurrency,
+        }
+        self._cond = threading.Condition()
+        self._queues = {priority: [] for priority in SCRAPE_PRIORITIES}
+        self._active = {priority: 0 for priority in SCRAPE_PRIORITIES}
+        self._stats = {
+            priority: {"granted": 0, "rejected": 0, "max_queue_depth": 0, "waited_seconds": 0.0}
+            for priority in SCRAPE_PRIORITIES
+        }
+    
+    def _can_run(self, priority: str) -> bool:
+        return self._active[priority] < max(1, self.limits[priority])
+    
+    def _is_next(self, priority: str, ticket: object) -> bool:
+        """Whether this waiter gets the next slot"""
+        if self._queues[priority][0] is not ticket or not self._can_run(priority):
+            return False
+        for other in SCRAPE_PRIORITIES[:SCRAPE_PRIORITIES.index(priority)]:
+            if self._queues[other] and self._can_run(other):
+                return False
+        return True
+    
+    @contextmanager
+    def slot(self, priority: str = "interactive", min_delay: Optional[float] = None):
+        """
+        Hold a scrape slot of a priority class for the duration of a scrape.
+        
+        Args:
+            priority: 'interactive', 'harvest' or 'prefetch'
+            min_delay: Caller-requested minimum spacing, passed to the rate controller
+        
+        Raises:
+            CircuitOpenError: Scraping is paused after blocking
+        """
+        if priority not in self._queues:
+            raise ValueError(f"priority must be one of {list(SCRAPE_PRIORITIES)}")
+        ticket = object()
+        queued_at = time.monotonic()
+        stats = self._stats[priority]
+        with self._cond:
+            queue = self._queues[priority]
+            queue.append(ticket)
+            stats["max_queue_depth"] = max(stats["max_queue_depth"], len(queue))
+            try:
+                while True:
+                    if self._is_next(priority, ticket):
+                        wait = self.controller.time_until_slot()
+                        if wait <= 0:
+                            # Reserves the slot without sleeping, or fails fast while open
+                            self.controller.acquire(min_delay)
+                            break
+                        self._cond.wait(timeout=wait)
+                    else:
+                        self._cond.wait()
+            except CircuitOpenError:
+                stats["rejected"] += 1
+                raise
+            finally:
+                queue.remove(ticket)
+                self._cond.notify_all()
+            self._active[priority] += 1
+            stats["granted"] += 1
+            stats["waited_seconds"] += time.monotonic() - queued_at
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active[priority] -= 1
+                self._cond.notify_all()
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Queue depth, active scrapes and wait statistics per priority class"""
+        with self._cond:
+            return {
+                priority: {
+                    "queued": len(self._queues[priority]),
+                    "active": self._active[priority],
+                    "limit": self.limits[priority],
+                    **self._stats[priority],
+                    "waited_seconds": round(self._stats[priority]["waited_seconds"], 3),
+                    "avg_wait_seconds": round(
+                        self._stats[priority]["waited_seconds"] / self._stats[priority]["granted"], 3
+                    ) if self._stats[priority]["granted"] else None
+                }
+                for priority in SCRAPE_PRIORITIES
+            }
+
+scrape_scheduler = ScrapeScheduler(scrape_controller)
+
+# Data API errors worth retrying, by the `reason` in the error body
+RETRYABLE_API_REASONS = frozenset({
+    'rateLimitExceeded', 'userRateLimitExceeded', 'backendError', 'internalError'
+})
+# Daily quota exhaustion: retrying only burns more quota
+QUOTA_API_REASONS = frozenset({'quotaExceeded', 'dailyLimitExceeded'})
+RETRYABLE_API_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Backoff between retries: 1s, 2s, 4s... capped, with full jitter
+API_RETRY_BASE_DELAY = 1.0
+API_RETRY_MAX_DELAY = 32.0
+
+_api_retries: ContextVar[Optional[List[int]]] = ContextVar('api_retries', default=None)
+
+def track_api_retries(fn):
+    """Count Data API retries made during a tool call; read with api_retry_count()"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        parent = _api_retries.get()
+        counter = [0]
+        token = _api_retries.set(counter)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _api_retries.reset(token)
+            if parent is not None:
+                parent[0] += counter[0]
+    return wrapper
+
+def api_retry_count() -> int:
+    """Data API retries so far in the current tracked tool call"""
+    counter = _api_retries.get()
+    return counter[0] if counter else 0
+
+def api_error_reason(error: HttpError) -> Optional[str]:
+    """The first `reason` in a Data API error body (e.g. 'quotaExceeded')"""
+    try:
+        data = json.loads(error.content.decode('utf-8'))
+        return data['error']['errors'][0]['reason']
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+def is_retryable_api_error(error: Exception) -> bool:
+    """Transient failures: rate limiting, backend errors and dropped connections"""
+    if isinstance(error, HttpError):
+        reason = api_error_reason(error)
+        if reason in QUOTA_API_REASONS:
+            return False
+        return reason in RETRYABLE_API_REASONS or error.resp.status in RETRYABLE_API_STATUSES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+_thread_local = threading.local()
+
+def _thread_http():
+    """Per-thread HTTP connection; httplib2 connections can't be shared across threads"""
+    if not hasattr(_thread_local, 'http'):
+        _thread_local.http = build_http()
+    return _thread_local.http
+
+def _execute_with_retries(request, max_retries: int, deadline: float):
+    """Execute a request, retrying transient failures until the deadline"""
+    attempt = 0
+    while True:
+        try:
+            return request.execute(http=_thread_http())
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable_api_error(e):
+                raise
+            backoff = random.uniform(0, min(API_RETRY_MAX_DELAY, API_RETRY_BASE_DELAY * 2 ** attempt))
+            if time.monotonic() + backoff > deadline:
+                logger.warning(f"Not retrying {getattr(request, 'methodId', 'API request')}: deadline reached")
+                raise
+            attempt += 1
+            counter = _api_retries.get()
+            if counter is not None:
+                counter[0] += 1
+            logger.warning(
+                f"Retrying {getattr(request, 'methodId', 'API request')} in {backoff:.1f}s "
+                f"(attempt {attempt}/{max_retries}): {e}"
+            )
+            time.sleep(backoff)
+
+def execute_api_request(request, deadline_seconds: Optional[float] = None) -> Dict:
+    """
+    Execute a YouTube Data API request.
+    
+    Read requests are retried on transient failures (rate limiting, 5xx,
+    dropped connections) with capped exponential backoff until
+    `deadline_seconds` (API_CALL_DEADLINE by default) has passed. Identical
+    read requests (same method and URI, so same operation and arguments)
+    that are in flight at the same time share one HTTP call.
+    """
+    if getattr(request, 'method', None) != 'GET':
+        return request.execute()
+    config = load_config()
+    deadline = time.monotonic() + (deadline_seconds if deadline_seconds is not None else config.api_call_deadline)
+    operation = getattr(request, 'methodId', None) or 'api'
+    response, _ = single_flight.do(
+        (operation, request.uri),
+        lambda: _execute_with_retries(request, config.api_max_retries, deadline)
+    )
+    return response
+
+# Shared pool for independent API lookups issued by a single tool call
+_lookup_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="youtube-lookup")
+
+def run_concurrently(*calls) -> List[Any]:
+    """
+    Run independent API lookups in parallel so a tool waits about one
+    round trip for all of them instead of one per call.
+    
+    Args:
+        calls: Zero-argument callables (typically wrapping execute_api_request)
+    
+    Returns:
+        Results in the order the calls were given
+    
+    Raises:
+        The first call's exception, in call order, after all calls finish
+    """
+    # Each call runs in a copy of the caller's context so retries are counted for its tool call
+    futures = [_lookup_executor.submit(copy_context().run, call) for call in calls]
+    return [future.result() for future in futures]
+
+# videos.list accepts at most this many IDs per request
+VIDEOS_LIST_MAX_IDS = 50
+
+class VideoDetailsFetcher:
+    """Fetches videos.list details in 50-ID chunks on background threads.
+    
+    Listing tools submit each page's IDs as soon as the page arrives, so
+    detail lookups overlap with fetching the next page instead of waiting
+    for pagination to finish. Use as a context manager; `results()` waits
+    for all submitted chunks.
+    """
+    
+    def __init__(self, youtube, part: str = 'statistics,contentDetails', max_workers: int = 4):
+        self.youtube = youtube
+        self.part = part
+        self.requests_made = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="youtube-details")
+        self._futures = []
+    
+    def __enter__(self) -> "VideoDetailsFetcher":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._executor.shutdown(wait=True)
+    
+    def _fetch(self, video_ids: List[str]) -> List[Dict]:
+        request = self.youtube.videos().list(part=self.part, id=','.join(video_ids))
+        return execute_api_request(request).get('items', [])
+    
+    def submit(self, video_ids: List[str]):
+        """Queue details for these IDs, split into chunks of at most 50"""
+        for start in range(0, len(video_ids), VIDEOS_LIST_MAX_IDS):
+            chunk = video_ids[start:start + VIDEOS_LIST_MAX_IDS]
+            # Run in a copy of the caller's context so retries are counted for its tool call
+            self._futures.append(self._executor.submit(copy_context().run, self._fetch, chunk))
+            self.requests_made += 1
+    
+    def iter_completed(self):
+        """Yield each chunk's items as soon as its request finishes"""
+        for future in as_completed(self._futures):
+            yield future.result()
+    
+    def results(self) -> Dict[str, Dict]:
+        """Wait for all submitted chunks; returns details keyed by video ID"""
+        lookup = {}
+        for items in self.iter_completed():
+            for item in items:
+                lookup[item['id']] = item
+        return lookup
+
+def resolve_cache_dir(cache_dir: Optional[str], subdir: Optional[str] = None) -> Path:
+    """
+    Resolve and create a cache directory.
+    
+    Args:
+        cache_dir: Configured directory; when None, falls back to `subdir`
+            inside the transcript cache directory
+        subdir: Subdirectory name used for the fallback
+    
+    Returns:
+        Absolute path to the (existing) directory
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(load_config().transcript_cache_dir, subdir)
+    # Expand user home directory (~) and make absolute
+    path = Path(os.path.expanduser(cache_dir)).resolve()
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 class TranscriptCache:
     """Manages transcript caching"""
     
     def __init__(self):
         config = load_config()
-        # Expand user home directory (~) and make absolute
-        cache_dir_str = os.path.expanduser(config.transcript_cache_dir)
-        self.cache_dir = Path(cache_dir_str).resolve()
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = resolve_cache_dir(config.transcript_cache_dir)
         self.max_age_days = config.max_cache_age_days
+        self.lsh_index = TranscriptLSHIndex(self.cache_dir / "lsh")
+        # Negative entries for videos without a usable transcript
+        self.negative_dir = self.cache_dir / "negative"
+        self.negative_dir.mkdir(exist_ok=True)
+        self.negative_ttls = {
+            # Captions disabled/missing rarely changes: keep it sticky
+            'disabled': timedelta(hours=config.negative_cache_ttl_hours),
+            # Blocking is transient: retry soon
+            'blocked': timedelta(minutes=config.blocked_cache_ttl_minutes),
+        }
     
     def get_cache_path(self, video_id: str) -> Path:
         """Get cache file path for a video"""
@@ -60,22 +588,120 @@ class TranscriptCache:
             return None
     
     def set(self, video_id: str, data: Dict):
-        """Cache transcript data"""
-        cache_path = self.get_cache_path(video_id)
+        """Cache transcript data and index its MinHash signature"""
         data['fetched_at'] = datetime.now().isoformat()
+        if 'full_transcript' in data:
+            data['minhash'] = compute_minhash_signature(
+                tokenize(' '.join(e['text'] for e in data['full_transcript']))
+            )
+        self._write(video_id, data)
+        if data.get('minhash'):
+            self.lsh_index.add(video_id, data['minhash'])
+        # A transcript now exists, so any negative entry is stale
+        negative_path = self.get_negative_path(video_id)
+        if negative_path.exists():
+            negative_path.unlink()
+    
+    def get_negative_path(self, video_id: str) -> Path:
+        """Get negative cache file path for a video"""
+        return self.negative_dir / f"{video_id}.json"
+    
+    def get_negative(self, video_id: str) -> Optional[Dict]:
+        """Get the negative entry for a video if one exists and has not expired"""
+        negative_path = self.get_negative_path(video_id)
+        if not negative_path.exists():
+            return None
+        
+        try:
+            with open(negative_path, 'r') as f:
+                entry = json.load(f)
+            if datetime.now() >= datetime.fromisoformat(entry['expires_at']):
+                return None
+            return entry
+        except Exception:
+            return None
+    
+    def set_negative(self, video_id: str, reason: str, message: str = "") -> Dict:
+        """
+        Record that a video has no usable transcript.
+        
+        Args:
+            video_id: YouTube video ID
+            reason: 'disabled' (captions off/missing, long TTL) or 'blocked' (transient, short TTL)
+            message: Error message from the failed fetch
+        
+        Returns:
+            The stored entry
+        """
+        if reason not in self.negative_ttls:
+            raise ValueError(f"Unknown negative cache reason '{reason}'")
+        now = datetime.now()
+        entry = {
+            'video_id': video_id,
+            'reason': reason,
+            'message': message,
+            'fetched_at': now.isoformat(),
+            'expires_at': (now + self.negative_ttls[reason]).isoformat()
+        }
+        with open(self.get_negative_path(video_id), 'w') as f:
+            json.dump(entry, f, indent=2)
+        return entry
+    
+    def _write(self, video_id: str, data: Dict):
+        """Write a cache entry as-is (keeps its fetched_at)"""
+        cache_path = self.get_cache_path(video_id)
         with open(cache_path, 'w') as f:
             json.dump(data, f, indent=2)
     
+    def ensure_features(self, video_id: str, data: Dict) -> Dict:
+        """Bring a cached entry's analytics features up to the current schema.
+        
+        Only feature groups whose schema version changed are recomputed, and
+        the entry is rewritten without resetting its fetched_at timestamp.
+        """
+        if 'full_transcript' not in data:
+            return data
+        
+        features = data.get('features')
+        if features and not stale_feature_groups(features):
+            return data
+        
+        data['features'] = compute_transcript_features(
+            data['full_transcript'], data.get('duration', 0), features
+        )
+        try:
+            self._write(video_id, data)
+        except OSError as e:
+            # Serving the fresh features matters more than persisting them
+            logger.warning(f"Failed to persist features for {video_id}: {e}")
+        return data
+    
+    def ensure_minhash(self, video_id: str, data: Dict) -> Dict:
+        """Compute and index a MinHash signature for an entry cached without one"""
+        if 'full_transcript' not in data:
+            return data
+        if not data.get('minhash'):
+            data['minhash'] = compute_minhash_signature(
+                tokenize(' '.join(e['text'] for e in data['full_transcript']))
+            )
+            self._write(video_id, data)
+        if data['minhash'] and video_id not in self.lsh_index:
+            self.lsh_index.add(video_id, data['minhash'])
+        return data
+    
     def clear(self, video_id: Optional[str] = None, older_than_days: Optional[int] = None) -> int:
         """Clear cache entries"""
         cleared = 0
         
+        removed = []
+        
         if video_id:
             # Clear specific video
             cache_path = self.get_cache_path(video_id)
             if cache_path.exists():
                 cache_path.unlink()
                 cleared = 1
+                removed.append(video_id)
         else:
             # Clear all or by age
             for cache_file in self.cache_dir.glob("*.json"):
@@ -88,12 +714,32 @@ class TranscriptCache:
                         if age.days > older_than_days:
                             cache_file.unlink()
                             cleared += 1
+                            removed.append(cache_file.stem)
                     except Exception:
                         pass
                 else:
                     cache_file.unlink()
                     cleared += 1
         
+        if video_id or older_than_days:
+            self.lsh_index.remove(removed)
+        else:
+            self.lsh_index.reset()
+        
+        # Negative entries expire on their own TTL; clear them with their videos
+        for negative_file in self.negative_dir.glob("*.json"):
+            if video_id and negative_file.stem != video_id:
+                continue
+            if older_than_days:
+                try:
+                    with open(negative_file, 'r') as f:
+                        fetched_at = datetime.fromisoformat(json.load(f)['fetched_at'])
+                    if (datetime.now() - fetched_at).days <= older_than_days:
+                        continue
+                except Exception:
+                    pass
+            negative_file.unlink()
+        
         return cleared
     
     def get_info(self, video_id: Optional[str] = None) -> Dict:
@@ -109,7 +755,11 @@ class TranscriptCache:
                     "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
                 }
             else:
-                return {"video_id": video_id, "cached": False}
+                return {
+                    "video_id": video_id,
+                    "cached": False,
+                    "negative": self.get_negative(video_id)
+                }
         
         # Get all cache info
         total_size = 0
@@ -126,13 +776,576 @@ class TranscriptCache:
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
             })
         
+        # Negative entries by reason (expired ones are ignored by lookups)
+        negative = {reason: 0 for reason in self.negative_ttls}
+        negative['expired'] = 0
+        for negative_file in self.negative_dir.glob("*.json"):
+            entry = self.get_negative(negative_file.stem)
+            if entry:
+                negative[entry['reason']] += 1
+            else:
+                negative['expired'] += 1
+        
         return {
             "cache_dir": str(self.cache_dir),
             "total_files": len(cache_files),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / 1024 / 1024, 2),
-            "cached_videos": cached_videos
+            "cached_videos": cached_videos,
+            "negative_entries": negative,
+            "negative_ttls_seconds": {
+                reason: ttl.total_seconds() for reason, ttl in self.negative_ttls.items()
+            }
+        }
+
+# MinHash/LSH parameters: 16 bands of 8 rows puts the 50% detection
+# probability at a Jaccard similarity of about 0.7
+MINHASH_PERMUTATIONS = 128
+LSH_BANDS = 16
+SHINGLE_SIZE = 5
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_MINHASH_COEFFICIENTS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+
+def compute_minhash_signature(tokens: List[str]) -> List[int]:
+    """
+    MinHash signature over word shingles of a transcript.
+    
+    Args:
+        tokens: Transcript word tokens
+    
+    Returns:
+        MINHASH_PERMUTATIONS minimum hash values (empty for empty input)
+    """
+    if not tokens:
+        return []
+    size = min(SHINGLE_SIZE, len(tokens))
+    shingles = {
+        zlib.crc32(' '.join(tokens[i:i + size]).encode('utf-8'))
+        for i in range(len(tokens) - size + 1)
+    }
+    return [
+        min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles)
+        for a, b in _MINHASH_COEFFICIENTS
+    ]
+
+def estimate_jaccard(signature_a: List[int], signature_b: List[int]) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures"""
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / len(signature_a)
+
+class TranscriptLSHIndex:
+    """Locality-sensitive hash index over transcript MinHash signatures.
+    
+    Signatures are kept in an append-only NDJSON log so adding a transcript
+    never rewrites the index; band buckets are rebuilt in memory on load.
+    """
+    
+    def __init__(self, index_dir: Path):
+        index_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = index_dir / "signatures.ndjson"
+        self._signatures: Optional[Dict[str, List[int]]] = None
+        self._buckets: Dict[tuple, set] = {}
+    
+    def _load(self):
+        if self._signatures is not None:
+            return
+        self._signatures = {}
+        if self.index_path.exists():
+            with open(self.index_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get('removed'):
+                        self._signatures.pop(record['video_id'], None)
+                    else:
+                        self._signatures[record['video_id']] = record['signature']
+        self._buckets = {}
+        for video_id, signature in self._signatures.items():
+            self._add_to_buckets(video_id, signature)
+    
+    def _bands(self, signature: List[int]) -> List[tuple]:
+        rows = len(signature) // LSH_BANDS
+        return [
+            (band, hash(tuple(signature[band * rows:(band + 1) * rows])))
+            for band in range(LSH_BANDS)
+        ]
+    
+    def _add_to_buckets(self, video_id: str, signature: List[int]):
+        for key in self._bands(signature):
+            self._buckets.setdefault(key, set()).add(video_id)
+    
+    def _append(self, records: List[Dict]):
+        with open(self.index_path, 'a') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+    
+    def add(self, video_id: str, signature: List[int]):
+        """Index (or re-index) a video's signature"""
+        self._load()
+        if self._signatures.get(video_id) == signature:
+            return
+        if video_id in self._signatures:
+            self._discard_from_buckets(video_id)
+        self._signatures[video_id] = signature
+        self._add_to_buckets(video_id, signature)
+        self._append([{'video_id': video_id, 'signature': signature}])
+    
+    def _discard_from_buckets(self, video_id: str):
+        for key in self._bands(self._signatures[video_id]):
+            self._buckets.get(key, set()).discard(video_id)
+    
+    def remove(self, video_ids: List[str]):
+        """Drop videos from the index"""
+        self._load()
+        removed = [v for v in video_ids if v in self._signatures]
+        for video_id in removed:
+            self._discard_from_buckets(video_id)
+            del self._signatures[video_id]
+        if removed:
+            self._append([{'video_id': v, 'removed': True} for v in removed])
+    
+    def reset(self):
+        """Drop every indexed signature"""
+        if self.index_path.exists():
+            self.index_path.unlink()
+        self._signatures = {}
+        self._buckets = {}
+    
+    def __contains__(self, video_id: str) -> bool:
+        self._load()
+        return video_id in self._signatures
+    
+    def video_ids(self) -> List[str]:
+        """All indexed video IDs"""
+        self._load()
+        return list(self._signatures)
+    
+    def get_signature(self, video_id: str) -> Optional[List[int]]:
+        """Signature stored for a video"""
+        self._load()
+        return self._signatures.get(video_id)
+    
+    def query(self, signature: List[int], threshold: float = 0.7,
+              exclude: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find indexed videos whose transcripts are near-duplicates.
+        
+        Only videos sharing at least one band bucket are compared, so the
+        cost scales with the number of candidates rather than the index size.
+        
+        Args:
+            signature: MinHash signature to look up
+            threshold: Minimum estimated Jaccard similarity
+            exclude: Video ID to leave out (usually the query video)
+        
+        Returns:
+            Matches sorted by estimated similarity, highest first
+        """
+        self._load()
+        if not signature:
+            return []
+        candidates = set()
+        for key in self._bands(signature):
+            candidates |= self._buckets.get(key, set())
+        candidates.discard(exclude)
+        
+        matches = []
+        for video_id in candidates:
+            similarity = estimate_jaccard(signature, self._signatures[video_id])
+            if similarity >= threshold:
+                matches.append({'video_id': video_id, 'similarity': round(similarity, 3)})
+        return sorted(matches, key=lambda m: m['similarity'], reverse=True)
+
+class DuplicatePredictor:
+    """Predicts reuploads from title and duration before fetching a transcript"""
+    
+    def __init__(self, duration_tolerance: float = 0.01, title_threshold: float = 0.8):
+        self.duration_tolerance = duration_tolerance
+        self.title_threshold = title_threshold
+        self._by_duration: Dict[int, List[tuple]] = {}
+    
+    def _title_terms(self, title: str) -> set:
+        return {t for t in tokenize(title or '') if t not in STOPWORDS}
+    
+    def add(self, video_id: str, title: str, duration_seconds: int):
+        """Remember a video whose transcript is known"""
+        if duration_seconds <= 0:
+            return
+        self._by_duration.setdefault(duration_seconds, []).append(
+            (video_id, self._title_terms(title))
+        )
+    
+    def match(self, title: str, duration_seconds: int, exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Return the ID of a known video this one likely duplicates.
+        
+        A match needs a duration within the tolerance (at least 2 seconds)
+        and a title whose terms are mostly contained in the other title.
+        """
+        if duration_seconds <= 0:
+            return None
+        terms = self._title_terms(title)
+        if not terms:
+            return None
+        slack = max(2, int(duration_seconds * self.duration_tolerance))
+        for duration in range(duration_seconds - slack, duration_seconds + slack + 1):
+            for video_id, other_terms in self._by_duration.get(duration, []):
+                if video_id == exclude or not other_terms:
+                    continue
+                overlap = len(terms & other_terms) / min(len(terms), len(other_terms))
+                if overlap >= self.title_threshold:
+                    return video_id
+        return None
+
+class VideoMetadataCache:
+    """Stores video metadata returned by the listing tools for offline analysis"""
+    
+    def __init__(self):
+        config = load_config()
+        self.cache_dir = resolve_cache_dir(config.metadata_cache_dir, 'metadata')
+    
+    def get_cache_path(self, video_id: str) -> Path:
+        """Get cache file path for a video"""
+        return self.cache_dir / f"{video_id}.json"
+    
+    def get(self, video_id: str) -> Optional[Dict]:
+        """Get cached metadata for a video"""
+        cache_path = self.get_cache_path(video_id)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+    
+    def set(self, video_id: str, data: Dict):
+        """Cache video metadata, keeping fields from earlier fetches not present in `data`"""
+        entry = self.get(video_id) or {}
+        entry.update({k: v for k, v in data.items() if v is not None})
+        entry['video_id'] = video_id
+        entry['fetched_at'] = datetime.now().isoformat()
+        with open(self.get_cache_path(video_id), 'w') as f:
+            json.dump(entry, f, indent=2)
+    
+    def list(self, channel_id: Optional[str] = None) -> List[Dict]:
+        """List cached metadata, optionally for a single channel"""
+        entries = []
+        for cache_file in sorted(self.cache_dir.glob("*.json")):
+            entry = self.get(cache_file.stem)
+            if entry and (channel_id is None or entry.get('channel_id') == channel_id):
+                entries.append(entry)
+        return entries
+
+_CHANNEL_ID_PATTERN = re.compile(r'UC[\w-]{22}')
+_alias_lock = threading.Lock()
+
+def normalize_channel_alias(identifier: str) -> str:
+    """
+    Normalize a handle, username or channel URL for alias lookups.
+    
+    '@Name', 'youtube.com/@name/videos' and 'https://www.youtube.com/@NAME'
+    all become '@name'; '/c/Name' and '/user/Name' URLs become 'name'.
+    """
+    alias = identifier.strip()
+    alias = re.sub(r'^(https?://)?(www\.|m\.)?youtube\.com/', '', alias, flags=re.IGNORECASE)
+    alias = re.sub(r'^(c|user)/', '', alias)
+    return alias.split('/')[0].split('?')[0].lower()
+
+class ChannelAliasCache:
+    """Persistent mapping of handles, usernames and custom URLs to channel IDs.
+    
+    Shared by all channel tools so a handle costs one API lookup the first
+    time and nothing afterwards. Entries expire after CHANNEL_ALIAS_TTL_DAYS
+    since handles can be changed or reassigned.
+    """
+    
+    def __init__(self):
+        config = load_config()
+        self.path = resolve_cache_dir(None, 'aliases') / "channel_aliases.json"
+        self.ttl = timedelta(days=config.channel_alias_ttl_days)
+    
+    def _load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+    
+    def get(self, alias: str) -> Optional[str]:
+        """Channel ID for a normalized alias, if known and fresh"""
+        entry = self._load().get(alias)
+        if not entry or datetime.now() - datetime.fromisoformat(entry['resolved_at']) > self.ttl:
+            return None
+        return entry['channel_id']
+    
+    def set(self, alias: str, channel_id: str, resolved_via: str):
+        """Remember an alias"""
+        with _alias_lock:
+            aliases = self._load()
+            aliases[alias] = {
+                "channel_id": channel_id,
+                "resolved_via": resolved_via,
+                "resolved_at": datetime.now().isoformat()
+            }
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(aliases, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+def parse_channel_id(identifier: str) -> Optional[str]:
+    """Channel ID from a 'UC...' ID or a /channel/ URL, else None"""
+    match = _CHANNEL_ID_PATTERN.search(identifier)
+    if match and (identifier.strip() == match.group(0) or '/channel/' in identifier):
+        return match.group(0)
+    return None
+
+def cached_channel_id(identifier: str) -> Optional[str]:
+    """Channel ID for an identifier without any API calls (ID, URL or cached alias)"""
+    return parse_channel_id(identifier) or ChannelAliasCache().get(normalize_channel_alias(identifier))
+
+def resolve_channel(youtube, identifier: str, part: str = 'id') -> Optional[Dict[str, Any]]:
+    """
+    Resolve a channel ID, handle, username or channel URL to a channel ID.
+    
+    Channel IDs resolve without API calls and known aliases from the alias
+    cache. Handles use channels.list(forHandle) and bare names try
+    forHandle and forUsername together (1 unit each); search.list (100
+    units) is only the last resort. New resolutions are cached.
+    
+    Args:
+        youtube: YouTube API client instance
+        identifier: 'UC...' ID, '@handle', username, or channel URL
+        part: Parts to request when a channels.list lookup is needed, so
+            callers that want the channel resource can skip a second call
+    
+    Returns:
+        {"channel_id", "channel" (the resource if one was fetched, else None),
+        "resolved_via", "quota_cost"}, or None if no channel matches
+    """
+    channel_id = parse_channel_id(identifier)
+    if channel_id:
+        return {"channel_id": channel_id, "channel": None, "resolved_via": "id", "quota_cost": 0}
+    
+    alias = normalize_channel_alias(identifier)
+    if not alias or alias == '@':
+        return None
+    alias_cache = ChannelAliasCache()
+    cached_id = alias_cache.get(alias)
+    if cached_id:
+        return {"channel_id": cached_id, "channel": None, "resolved_via": "cache", "quota_cost": 0}
+    
+    quota_cost = 0
+    if alias.startswith('@'):
+        response = execute_api_request(youtube.channels().list(part=part, forHandle=alias))
+        quota_cost += 1
+        candidates = [(response, 'handle')]
+    else:
+        # A bare name may be a handle typed without '@' or a legacy username
+        handle_request = youtube.channels().list(part=part, forHandle='@' + alias)
+        username_request = youtube.channels().list(part=part, forUsername=alias)
+        handle_response, username_response = run_concurrently(
+            lambda: execute_api_request(handle_request),
+            lambda: execute_api_request(username_request)
+        )
+        quota_cost += 2
+        candidates = [(handle_response, 'handle'), (username_response, 'username')]
+    
+    for response, resolved_via in candidates:
+        if response.get('items'):
+            channel = response['items'][0]
+            alias_cache.set(alias, channel['id'], resolved_via)
+            return {"channel_id": channel['id'], "channel": channel, "resolved_via": resolved_via, "quota_cost": quota_cost}
+    
+    # Last resort: custom URLs and names only search can find
+    search_response = execute_api_request(youtube.search().list(
+        part='snippet',
+        q=identifier,
+        type='channel',
+        maxResults=1
+    ))
+    quota_cost += 100
+    if not search_response.get('items'):
+        return None
+    channel_id = search_response['items'][0]['snippet']['channelId']
+    alias_cache.set(alias, channel_id, 'search')
+    return {"channel_id": channel_id, "channel": None, "resolved_via": "search", "quota_cost": quota_cost}
+
+class ChannelSnapshotStore:
+    """Persisted per-channel upload snapshots for incremental sync.
+    
+    A snapshot holds the newest known video (ID and publish time) and the
+    merged list of videos seen so far, newest first, so a sync only has to
+    page through uploads until it reaches a known video.
+    """
+    
+    def __init__(self):
+        self.cache_dir = resolve_cache_dir(None, 'channels')
+    
+    def get_cache_path(self, channel_id: str) -> Path:
+        """Get snapshot file path for a channel"""
+        return self.cache_dir / f"{channel_id}.json"
+    
+    def get(self, channel_id: str) -> Optional[Dict]:
+        """Load a channel snapshot"""
+        cache_path = self.get_cache_path(channel_id)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+    
+    def set(self, channel_id: str, snapshot: Dict):
+        """Atomically store a channel snapshot"""
+        tmp_path = self.get_cache_path(channel_id).with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp_path, self.get_cache_path(channel_id))
+
+class SearchCache:
+    """Caches search results so repeated queries skip the 100-unit search.list call.
+    
+    Entries are keyed by the normalized query parameters and expire after
+    SEARCH_CACHE_TTL_MINUTES. Statistics on a fresh entry can be refreshed
+    with a cheap videos.list call on the cached IDs.
+    """
+    
+    def __init__(self):
+        config = load_config()
+        self.cache_dir = resolve_cache_dir(None, 'search')
+        self.ttl = timedelta(minutes=config.search_cache_ttl_minutes)
+    
+    @staticmethod
+    def make_key(query: str, order: str, published_after: Optional[str], max_results: int) -> str:
+        """Stable key for a search; queries differing only in case or whitespace share it"""
+        normalized = {
+            "query": ' '.join(query.lower().split()),
+            "order": order,
+            "published_after": published_after,
+            "max_results": max_results
         }
+        return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+    
+    def get_cache_path(self, key: str) -> Path:
+        """Get cache file path for a search key"""
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Get a cached search if it is younger than the TTL"""
+        cache_path = self.get_cache_path(key)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r') as f:
+                entry = json.load(f)
+            if datetime.now() - datetime.fromisoformat(entry['fetched_at']) > self.ttl:
+                return None
+            return entry
+        except Exception:
+            return None
+    
+    def set(self, key: str, entry: Dict):
+        """Store a search result; `fetched_at` is kept if present (statistics refresh)"""
+        entry.setdefault('fetched_at', datetime.now().isoformat())
+        tmp_path = self.get_cache_path(key).with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, self.get_cache_path(key))
+
+class CommentCache:
+    """Per-video comment threads for incremental refresh.
+    
+    An entry holds the threads fetched so far, newest first, with the page
+    token to continue into older threads and whether the whole comment
+    section has been read. A refresh only pages through threads newer
+    than the newest cached one.
+    """
+    
+    def __init__(self):
+        config = load_config()
+        self.cache_dir = resolve_cache_dir(None, 'comments')
+        self.ttl = timedelta(minutes=config.comment_cache_ttl_minutes)
+    
+    def get_cache_path(self, video_id: str) -> Path:
+        """Get cache file path for a video's comments"""
+        return self.cache_dir / f"{video_id}.json"
+    
+    def get(self, video_id: str) -> Optional[Dict]:
+        """Load a video's cached comments (fresh or not; see is_fresh)"""
+        cache_path = self.get_cache_path(video_id)
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return None
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether an entry is younger than COMMENT_CACHE_TTL_MINUTES"""
+        return datetime.now() - datetime.fromisoformat(entry['fetched_at']) <= self.ttl
+    
+    def set(self, video_id: str, entry: Dict):
+        """Atomically store a video's comments"""
+        entry['fetched_at'] = datetime.now().isoformat()
+        tmp_path = self.get_cache_path(video_id).with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, self.get_cache_path(video_id))
+
+def iter_comment_pages(
+    youtube,
+    video_id: str,
+    part: str = 'snippet',
+    page_token: Optional[str] = None,
+    max_threads: Optional[int] = None
+):
+    """
+    Page through a video's comment threads, newest first (1 quota unit per page).
+    
+    Args:
+        youtube: YouTube API client instance
+        video_id: Video ID
+        part: 'snippet' or 'snippet,replies' (replies cost nothing extra)
+        page_token: Page to start from, for continuing into older threads
+        max_threads: Stop after this many threads; the last page only asks for the rest
+    
+    Yields:
+        Raw commentThreads.list responses
+    """
+    fetched = 0
+    while max_threads is None or fetched < max_threads:
+        request = youtube.commentThreads().list(
+            part=part,
+            videoId=video_id,
+            order='time',
+            textFormat='plainText',
+            maxResults=100 if max_threads is None else min(100, max_threads - fetched),
+            pageToken=page_token
+        )
+        response = execute_api_request(request)
+        fetched += len(response.get('items', []))
+        yield response
+        
+        page_token = response.get('nextPageToken')
+        if not page_token or not response.get('items'):
+            break
 
 def parse_video_id(video_id_or_url: str) -> str:
     """Extract video ID from URL or return as-is"""
@@ -152,6 +1365,43 @@ def parse_video_id(video_id_or_url: str) -> str:
     # Assume it's already a video ID
     return video_id_or_url
 
+def parse_playlist_id(playlist_id_or_url: str) -> str:
+    """Extract playlist ID from a playlist or watch URL or return as-is"""
+    match = re.search(r'[?&]list=([\w-]+)', playlist_id_or_url)
+    if match:
+        return match.group(1)
+    return playlist_id_or_url.strip()
+
+def uploads_playlist_id(channel_id: str) -> str:
+    """Get the uploads playlist ID of a channel (UC... -> UU...)"""
+    return 'UU' + channel_id[2:]
+
+def iter_playlist_pages(youtube, playlist_id: str, page_token: Optional[str] = None):
+    """
+    Page through a playlist with playlistItems.list (1 quota unit per page).
+    
+    Args:
+        youtube: YouTube API client instance
+        playlist_id: Playlist ID (channel uploads playlists start with UU)
+        page_token: Page to start from, for resuming
+    
+    Yields:
+        Raw playlistItems.list responses, newest uploads first for uploads playlists
+    """
+    while True:
+        request = youtube.playlistItems().list(
+            part='snippet,contentDetails',
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token
+        )
+        response = execute_api_request(request)
+        yield response
+        
+        page_token = response.get('nextPageToken')
+        if not page_token or not response.get('items'):
+            break
+
 def parse_duration(duration: str) -> int:
     """Convert ISO 8601 duration to seconds"""
     if not duration:
@@ -171,7 +1421,8 @@ def parse_duration(duration: str) -> int:
 def format_error_response(error: Exception) -> Dict[str, Any]:
     """Format error for consistent error responses"""
     if isinstance(error, HttpError):
-        if error.resp.status == 403:
+        reason = api_error_reason(error)
+        if reason in QUOTA_API_REASONS or (error.resp.status == 403 and reason is None):
             return {
                 "error": {
                     "type": "quota_exceeded",
@@ -179,6 +1430,14 @@ def format_error_response(error: Exception) -> Dict[str, Any]:
                     "retry_after": 86400  # 24 hours in seconds
                 }
             }
+        elif reason in ('rateLimitExceeded', 'userRateLimitExceeded') or error.resp.status == 429:
+            return {
+                "error": {
+                    "type": "rate_limited",
+                    "message": "YouTube API rate limit hit and retries ran out. Slow down and try again.",
+                    "retry_after": 60
+                }
+            }
         elif error.resp.status == 404:
             return {
                 "error": {
@@ -186,11 +1445,21 @@ def format_error_response(error: Exception) -> Dict[str, Any]:
                     "message": "The requested resource was not found."
                 }
             }
+        elif error.resp.status == 403:
+            return {
+                "error": {
+                    "type": "forbidden",
+                    "message": str(error),
+                    "reason": reason
+                }
+            }
         else:
             return {
                 "error": {
                     "type": f"api_error_{error.resp.status}",
-                    "message": str(error)
+                    "message": str(error),
+                    "reason": reason,
+                    "retryable": is_retryable_api_error(error)
                 }
             }
     
@@ -244,4 +1513,131 @@ def extract_main_samples(transcript: List[Dict], num_samples: int = 3) -> List[D
                 'entries': sample_entries
             })
     
-    return samples
\ No newline at end of file
+    return samples
+
+# Words ignored when ranking terms and n-grams
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers herself him
+himself his how i if in into is it its itself just let me more most my myself
+no nor not now of off on once only or other our ours ourselves out over own
+really right same she should so some such than that the their theirs them
+themselves then there these they this those through to too um uh under until
+up very was we were what when where which while who whom why will with would
+yeah you your yours yourself yourselves gonna going get got like okay ok
+""".split())
+
+# Schema version of each transcript feature group. Bump a group's version when
+# its computation changes; cached entries then recompute only that group.
+TRANSCRIPT_FEATURE_VERSIONS = {
+    'pace': 1,
+    'segments': 1,
+    'vocabulary': 1,
+    'ngrams': 1,
+}
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return [t.strip("'") for t in re.findall(r"[a-z0-9']+", text.lower()) if t.strip("'")]
+
+def _words_per_minute(entries: List[Dict], span_seconds: float) -> float:
+    """Speaking pace over a span of transcript entries"""
+    if span_seconds <= 0:
+        return 0.0
+    word_count = sum(len(tokenize(e['text'])) for e in entries)
+    return round(word_count / (span_seconds / 60), 1)
+
+def _pace_features(transcript: List[Dict], duration: float) -> Dict[str, Any]:
+    intro_span = min(60, duration)
+    outro_span = min(60, duration)
+    intro_wpm = _words_per_minute(extract_intro(transcript), intro_span)
+    outro_wpm = _words_per_minute(extract_outro(transcript, duration), outro_span)
+    return {
+        'words_per_minute': _words_per_minute(transcript, duration),
+        'intro_words_per_minute': intro_wpm,
+        'outro_words_per_minute': outro_wpm,
+        'intro_outro_pace_ratio': round(intro_wpm / outro_wpm, 2) if outro_wpm else None
+    }
+
+def _segment_features(transcript: List[Dict], duration: float) -> Dict[str, Any]:
+    segment_count = len(transcript)
+    word_count = sum(len(tokenize(e['text'])) for e in transcript)
+    return {
+        'segment_count': segment_count,
+        'segments_per_minute': round(segment_count / (duration / 60), 2) if duration > 0 else 0.0,
+        'avg_segment_seconds': round(sum(e['duration'] for e in transcript) / segment_count, 2) if segment_count else 0.0,
+        'avg_words_per_segment': round(word_count / segment_count, 2) if segment_count else 0.0
+    }
+
+def _vocabulary_features(tokens: List[str]) -> Dict[str, Any]:
+    vocabulary = set(tokens)
+    content_vocabulary = vocabulary - STOPWORDS
+    return {
+        'word_count': len(tokens),
+        'vocabulary_size': len(vocabulary),
+        'content_vocabulary_size': len(content_vocabulary),
+        'type_token_ratio': round(len(vocabulary) / len(tokens), 3) if tokens else 0.0
+    }
+
+def _top_ngrams(tokens: List[str], n: int, top_k: int) -> List[Dict[str, Any]]:
+    """Most frequent n-grams, skipping those made up only of stopwords"""
+    counts = Counter(
+        ' '.join(gram) for gram in zip(*(tokens[i:] for i in range(n)))
+        if not all(word in STOPWORDS for word in gram)
+    )
+    if n == 1:
+        counts = Counter({k: v for k, v in counts.items() if k not in STOPWORDS})
+    return [{'ngram': gram, 'count': count} for gram, count in counts.most_common(top_k)]
+
+def _ngram_features(tokens: List[str], top_k: int = 10) -> Dict[str, Any]:
+    return {
+        'top_unigrams': _top_ngrams(tokens, 1, top_k),
+        'top_bigrams': _top_ngrams(tokens, 2, top_k),
+        'top_trigrams': _top_ngrams(tokens, 3, top_k)
+    }
+
+def stale_feature_groups(features: Optional[Dict]) -> List[str]:
+    """Return feature groups missing or computed under an older schema"""
+    features = features or {}
+    versions = features.get('schema_versions', {})
+    return [
+        group for group, version in TRANSCRIPT_FEATURE_VERSIONS.items()
+        if group not in features or versions.get(group) != version
+    ]
+
+def compute_transcript_features(
+    transcript: List[Dict],
+    duration: float,
+    existing: Optional[Dict] = None
+) -> Dict[str, Any]:
+    """
+    Compute per-transcript analytics features.
+    
+    Args:
+        transcript: Transcript entries with text/start/duration
+        duration: Transcript duration in seconds
+        existing: Previously computed features; groups whose schema version
+            is still current are kept as-is
+    
+    Returns:
+        Feature groups (pace, segments, vocabulary, ngrams) plus their schema versions
+    """
+    features = dict(existing or {})
+    stale = stale_feature_groups(existing)
+    if not stale:
+        return features
+    
+    tokens = tokenize(' '.join(e['text'] for e in transcript))
+    builders = {
+        'pace': lambda: _pace_features(transcript, duration),
+        'segments': lambda: _segment_features(transcript, duration),
+        'vocabulary': lambda: _vocabulary_features(tokens),
+        'ngrams': lambda: _ngram_features(tokens),
+    }
+    versions = dict(features.get('schema_versions', {}))
+    for group in stale:
+        features[group] = builders[group]()
+        versions[group] = TRANSCRIPT_FEATURE_VERSIONS[group]
+    features['schema_versions'] = versions
+    return features
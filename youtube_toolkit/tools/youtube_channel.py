@@ -1,33 +1,47 @@
 """YouTube channel tools"""
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from mcp import types
 from googleapiclient.errors import HttpError
 from youtube_toolkit.tools.youtube_base import (
-    YouTubeAPIClient, parse_duration, format_error_response
+    YouTubeAPIClient, TranscriptCache, VideoMetadataCache, DuplicatePredictor,
+    ChannelSnapshotStore, VideoDetailsFetcher, uploads_playlist_id, iter_playlist_pages,
+    parse_duration, format_error_response, execute_api_request, resolve_channel, cached_channel_id,
+    parse_channel_id, track_api_retries, api_retry_count
 )
 from youtube_toolkit.tools.youtube_video import youtube_get_video_transcript
-from youtube_toolkit.config import load_config
+from youtube_toolkit.tools.youtube_history import record_stats
 from youtube_toolkit.logging_config import logger
 
+# channels.list accepts at most this many IDs per request
+CHANNELS_LIST_MAX_IDS = 50
+
+@track_api_retries
 def youtube_get_channel_videos(
     channel_id: str,
     max_results: int = 10,
     include_transcripts: bool = False,
     use_cache: bool = True,
-    delay_seconds: Optional[float] = None
+    delay_seconds: Optional[float] = None,
+    skip_likely_duplicates: bool = False,
+    progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None
 ) -> types.TextContent:
     """
     List recent videos from a YouTube channel.
     
     Args:
-        channel_id: YouTube channel ID (starts with UC...)
+        channel_id: YouTube channel ID (starts with UC...), handle, username, or channel URL
         max_results: Maximum number of videos to return
         include_transcripts: Fetch transcripts for each video
         use_cache: Whether to use cached transcripts (only applies when include_transcripts is True)
         delay_seconds: Delay between transcript fetches
+        skip_likely_duplicates: Don't scrape transcripts for videos whose title and
+            duration match a video with a known transcript (likely reuploads)
+        progress_callback: Called as (completed, total, video_data) after each video
     
     Returns:
         Array of video objects with metadata and optional transcripts
@@ -36,66 +50,64 @@ def youtube_get_channel_videos(
         # Get YouTube API client
         youtube = YouTubeAPIClient.get_instance()
         
-        # First, get channel info
-        channel_request = youtube.channels().list(
-            part='snippet,statistics,brandingSettings',
-            id=channel_id
+        not_found = types.TextContent(
+            type="text",
+            text=json.dumps({
+                "error": {
+                    "type": "not_found",
+                    "message": f"Channel {channel_id} not found"
+                }
+            })
         )
-        channel_response = channel_request.execute()
         
-        if not channel_response.get('items'):
-            return types.TextContent(
-                type="text",
-                text=json.dumps({
-                    "error": {
-                        "type": "not_found",
-                        "message": f"Channel {channel_id} not found"
-                    }
-                })
+        # First, get channel info (a handle lookup already returns it)
+        channel_parts = 'snippet,statistics,brandingSettings'
+        resolved = resolve_channel(youtube, channel_id, part=channel_parts)
+        if not resolved:
+            return not_found
+        channel_info = resolved['channel']
+        if channel_info is None:
+            channel_request = youtube.channels().list(
+                part=channel_parts,
+                id=resolved['channel_id']
             )
+            channel_response = execute_api_request(channel_request)
+            
+            if not channel_response.get('items'):
+                return not_found
+            
+            channel_info = channel_response['items'][0]
+        channel_id = channel_info['id']
         
-        channel_info = channel_response['items'][0]
-        
-        # Search for videos from this channel
+        # Search for videos from this channel; each page's details are fetched
+        # while the next page loads
         videos = []
         next_page_token = None
         
-        while len(videos) < max_results:
-            search_request = youtube.search().list(
-                part='snippet',
-                channelId=channel_id,
-                maxResults=min(50, max_results - len(videos)),
-                order='date',
-                type='video',
-                pageToken=next_page_token
-            )
-            search_response = search_request.execute()
-            
-            if 'items' not in search_response:
-                break
-            
-            videos.extend(search_response['items'])
-            
-            next_page_token = search_response.get('nextPageToken')
-            if not next_page_token:
-                break
-        
-        # Get video details
-        video_ids = [v['id']['videoId'] for v in videos[:max_results]]
-        if video_ids:
-            details_request = youtube.videos().list(
-                part='statistics,contentDetails',
-                id=','.join(video_ids)
-            )
-            details_response = details_request.execute()
+        with VideoDetailsFetcher(youtube) as details_fetcher:
+            while len(videos) < max_results:
+                search_request = youtube.search().list(
+                    part='snippet',
+                    channelId=channel_id,
+                    maxResults=min(50, max_results - len(videos)),
+                    order='date',
+                    type='video',
+                    pageToken=next_page_token
+                )
+                search_response = execute_api_request(search_request)
+                
+                if 'items' not in search_response:
+                    break
+                
+                page = search_response['items'][:max_results - len(videos)]
+                videos.extend(page)
+                details_fetcher.submit([v['id']['videoId'] for v in page])
+                
+                next_page_token = search_response.get('nextPageToken')
+                if not next_page_token:
+                    break
             
-            # Create lookup for details
-            details_lookup = {
-                item['id']: item 
-                for item in details_response.get('items', [])
-            }
-        else:
-            details_lookup = {}
+            details_lookup = details_fetcher.results()
         
         # Format response
         snippet = channel_info['snippet']
@@ -125,9 +137,31 @@ def youtube_get_channel_videos(
             "videos": []
         }
         
+        # Keep statistics history for growth tracking
+        record_stats("channel", channel_info['id'], {
+            "subscriber_count": result['channel']['subscriber_count'] if 'subscriberCount' in statistics else None,
+            "view_count": result['channel']['view_count'],
+            "video_count": result['channel']['video_count']
+        })
+        
         # Track transcript statistics
         transcripts_fetched = 0
         transcripts_cached = 0
+        transcripts_blocked = 0
+        
+        # Keep video metadata for offline analysis tools
+        metadata_cache = VideoMetadataCache()
+        
+        # Seed duplicate prediction with videos whose transcripts are already indexed
+        duplicate_predictor = None
+        transcripts_skipped = 0
+        if include_transcripts and skip_likely_duplicates:
+            duplicate_predictor = DuplicatePredictor()
+            transcript_cache = TranscriptCache()
+            for known_id in transcript_cache.lsh_index.video_ids():
+                known = metadata_cache.get(known_id)
+                if known:
+                    duplicate_predictor.add(known_id, known.get('title'), known.get('duration_seconds', 0))
         
         # Process each video
         for i, video in enumerate(videos[:max_results]):
@@ -149,11 +183,30 @@ def youtube_get_channel_videos(
                 "transcript": None
             }
             
+            metadata_cache.set(video_id, {
+                **{k: v for k, v in video_data.items() if k != 'transcript'},
+                "channel_id": channel_info['id'],
+                "channel_title": snippet['title']
+            })
+            if 'statistics' in details:
+                record_stats("video", video_id, video_data)
+            
+            # Skip scraping likely reuploads of videos we already have
+            if duplicate_predictor and not (use_cache and transcript_cache.get(video_id)):
+                duplicate_of = duplicate_predictor.match(
+                    video_data['title'], video_data['duration_seconds'], exclude=video_id
+                )
+                if duplicate_of:
+                    logger.info(f"Skipping transcript for {video_id}: likely duplicate of {duplicate_of}")
+                    video_data['duplicate_of'] = duplicate_of
+                    transcripts_skipped += 1
+                    result['videos'].append(video_data)
+                    if progress_callback:
+                        progress_callback(len(result['videos']), len(videos[:max_results]), video_data)
+                    continue
+            
             # Fetch transcript if requested
             if include_transcripts:
-                # Use delay for all but first video
-                transcript_delay = 0 if i == 0 else (delay_seconds or load_config().default_transcript_delay)
-                
                 logger.info(f"Fetching transcript {i+1}/{len(videos[:max_results])} for: {video_data['title'][:50]}...")
                 
                 # Get transcript using full mode as per v3 spec
@@ -161,7 +214,8 @@ def youtube_get_channel_videos(
                     video_id,
                     extract_mode="full",
                     use_cache=use_cache,
-                    delay_seconds=transcript_delay
+                    delay_seconds=delay_seconds,
+                    priority="harvest"
                 )
                 
                 transcript_data = json.loads(transcript_response.text)
@@ -175,31 +229,43 @@ def youtube_get_channel_videos(
                     
                     # Set transcript to the full text
                     video_data['transcript'] = transcript_data.get('text', '')
+                    
+                    if duplicate_predictor:
+                        duplicate_predictor.add(video_id, video_data['title'], video_data['duration_seconds'])
                 else:
                     # Keep transcript as null on error
                     logger.warning(f"Failed to get transcript for {video_id}: {transcript_data['error']}")
                     
-                    # Stop if rate limited
+                    # While blocked the rate controller serves cached transcripts only,
+                    # so keep going to return the remaining videos' metadata
                     error_info = transcript_data['error']
                     if isinstance(error_info, dict) and 'blocked' in error_info.get('type', ''):
-                        logger.warning("Rate limit detected, stopping transcript fetching")
-                        break
+                        transcripts_blocked += 1
             
             result['videos'].append(video_data)
+            if progress_callback:
+                progress_callback(len(result['videos']), len(videos[:max_results]), video_data)
         
         # Add metadata
         # Calculate API quota cost:
         # - channels.list: 1 unit
         # - search.list: 100 units per request (we might make multiple)
-        # - videos.list: 1 unit
+        # - videos.list: 1 unit per 50 videos
         search_requests = ((len(videos) - 1) // 50) + 1 if videos else 0
-        api_quota_cost = 1 + (100 * search_requests) + (1 if video_ids else 0)
+        api_quota_cost = (
+            max(1, resolved['quota_cost'])
+            + (100 * search_requests)
+            + details_fetcher.requests_made
+        )
         
         result['_metadata'] = {
             "api_quota_cost": api_quota_cost,
+            "api_retries": api_retry_count(),
             "videos_returned": len(result['videos']),
             "transcripts_fetched": transcripts_fetched,
             "transcripts_cached": transcripts_cached,
+            "transcripts_skipped_duplicates": transcripts_skipped,
+            "transcripts_blocked": transcripts_blocked,
             "fetched_at": datetime.utcnow().isoformat() + "Z"
         }
         
@@ -215,6 +281,88 @@ def youtube_get_channel_videos(
             text=json.dumps(format_error_response(e))
         )
 
+def _format_channel(channel: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the channel object of the metadata response (v3 spec) and record its statistics"""
+    data = {
+        "id": channel['id'],
+        "title": channel['snippet']['title'],
+        "handle": None,  # Will be set if available
+        "custom_url": None,  # Will be set if available
+        "description": channel['snippet']['description'],
+        "published_at": channel['snippet']['publishedAt'],
+        "country": channel['snippet'].get('country', None),
+        "statistics": {
+            "subscriber_count": int(channel['statistics'].get('subscriberCount', 0)),
+            "subscriber_count_hidden": channel['statistics'].get('hiddenSubscriberCount', False),
+            "view_count": int(channel['statistics'].get('viewCount', 0)),
+            "video_count": int(channel['statistics'].get('videoCount', 0))
+        },
+        "branding": {
+            "keywords": [],  # Will be set if available
+            "banner_url": None,  # Will be set if available
+            "thumbnail_url": channel['snippet'].get('thumbnails', {}).get('high', {}).get('url', None)
+        },
+        "content_details": {
+            "related_playlists": {}
+        },
+        "status": {
+            "privacy_status": None,
+            "is_linked": None,
+            "long_uploads_status": None,
+            "made_for_kids": None
+        }
+    }
+    
+    # Extract handle from custom URL if available
+    if 'brandingSettings' in channel and 'channel' in channel['brandingSettings']:
+        branding = channel['brandingSettings']['channel']
+        
+        # Get keywords
+        if 'keywords' in branding:
+            # Keywords are space-separated, handle quoted phrases
+            keywords_str = branding['keywords']
+            # Simple parsing - could be improved for quoted phrases
+            data['branding']['keywords'] = keywords_str.split()
+        
+        # Get custom URL/handle
+        if 'customUrl' in branding:
+            custom_url = branding['customUrl']
+            data['custom_url'] = f"https://youtube.com/{custom_url}"
+            # Extract handle (custom URL often starts with @)
+            if custom_url.startswith('@'):
+                data['handle'] = custom_url
+            else:
+                data['handle'] = '@' + custom_url.lstrip('/')
+    
+    # Get banner URL if available
+    if 'brandingSettings' in channel and 'image' in channel['brandingSettings']:
+        banner = channel['brandingSettings']['image'].get('bannerExternalUrl')
+        if banner:
+            data['branding']['banner_url'] = banner
+    
+    # Get content details
+    if 'contentDetails' in channel and 'relatedPlaylists' in channel['contentDetails']:
+        data['content_details']['related_playlists'] = channel['contentDetails']['relatedPlaylists']
+    
+    # Get status details
+    if 'status' in channel:
+        status = channel['status']
+        data['status']['privacy_status'] = status.get('privacyStatus')
+        data['status']['is_linked'] = status.get('isLinked')
+        data['status']['long_uploads_status'] = status.get('longUploadsStatus')
+        data['status']['made_for_kids'] = status.get('madeForKids')
+    
+    # Keep statistics history for growth tracking
+    channel_stats = data['statistics']
+    record_stats("channel", data['id'], {
+        "subscriber_count": None if channel_stats['subscriber_count_hidden'] else channel_stats['subscriber_count'],
+        "view_count": channel_stats['view_count'],
+        "video_count": channel_stats['video_count']
+    })
+    
+    return data
+
+@track_api_retries
 def youtube_get_channel_metadata(
     channel_id: str
 ) -> types.TextContent:
@@ -231,147 +379,336 @@ def youtube_get_channel_metadata(
         # Get YouTube API client
         youtube = YouTubeAPIClient.get_instance()
         
-        # Try to get channel by ID first, then by username or handle
-        channel_response = None
+        channel_parts = 'snippet,statistics,status,brandingSettings,contentDetails'
+        not_found = types.TextContent(
+            type="text",
+            text=json.dumps({
+                "error": {
+                    "type": "channel_not_found",
+                    "message": f"Channel '{channel_id}' not found"
+                }
+            })
+        )
         
-        # First try as channel ID
-        if channel_id.startswith('UC') and len(channel_id) == 24:
-            request = youtube.channels().list(
-                part='snippet,statistics,status,brandingSettings,contentDetails',
-                id=channel_id
-            )
-            channel_response = request.execute()
+        # Resolve handles/usernames/URLs (free when the alias is cached). The
+        # lookup requests the full parts, so a handle costs a single call.
+        resolved = resolve_channel(youtube, channel_id, part=channel_parts)
+        if not resolved:
+            return not_found
         
-        # If not found or not a channel ID, try as username
-        if not channel_response or not channel_response.get('items'):
-            # Try as username without @
-            username = channel_id.lstrip('@')
+        channel = resolved['channel']
+        quota_cost = resolved['quota_cost']
+        if channel is None:
             request = youtube.channels().list(
-                part='snippet,statistics,status,brandingSettings,contentDetails',
-                forUsername=username
-            )
-            channel_response = request.execute()
-        
-        # If still not found, try as handle (custom URL)
-        if not channel_response or not channel_response.get('items'):
-            # Search for channel by handle
-            search_request = youtube.search().list(
-                part='snippet',
-                q=channel_id,
-                type='channel',
-                maxResults=1
+                part=channel_parts,
+                id=resolved['channel_id']
             )
-            search_response = search_request.execute()
+            channel_response = execute_api_request(request)
+            quota_cost += 1
+            if not channel_response.get('items'):
+                return not_found
+            channel = channel_response['items'][0]
+        
+        
+        # Build response matching v3 spec
+        result = {
+            "channel": _format_channel(channel),
+            "_metadata": {
+                "api_quota_cost": quota_cost,
+                "resolved_via": resolved['resolved_via'],
+                "fetched_at": datetime.utcnow().isoformat() + 'Z'
+            }
+        }
+        
+        result['_metadata']['api_retries'] = api_retry_count()
+        
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+        
+    except Exception as e:
+        logger.error(f"Error fetching channel metadata: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
+
+@track_api_retries
+def youtube_get_channels_metadata(
+    channel_ids: List[str],
+    max_concurrency: int = 4
+) -> types.TextContent:
+    """
+    Fetches metadata for many channels in a few round trips.
+    
+    IDs and cached aliases need no lookup; other handles and usernames are
+    resolved concurrently (and cached). All remaining channels are then
+    fetched with channels.list, 50 IDs per call, with the calls in flight
+    together.
+    
+    Args:
+        channel_ids: Channel IDs, handles, usernames, or channel URLs (may be mixed)
+        max_concurrency: API calls in flight at once
+    
+    Returns:
+        One result per input, in order, with either a channel object
+        (same shape as youtube_get_channel_metadata) or an error
+    """
+    try:
+        youtube = YouTubeAPIClient.get_instance()
+        channel_parts = 'snippet,statistics,status,brandingSettings,contentDetails'
+        inputs = list(channel_ids)
+        
+        # Channel IDs, channel URLs and cached aliases resolve without API calls
+        resolved_ids = {identifier: cached_channel_id(identifier) for identifier in dict.fromkeys(inputs)}
+        unresolved = [identifier for identifier, channel_id in resolved_ids.items() if channel_id is None]
+        resolved_via = {
+            identifier: 'id' if parse_channel_id(identifier) else 'cache'
+            for identifier, channel_id in resolved_ids.items() if channel_id
+        }
+        channels = {}
+        errors = {}
+        quota_cost = 0
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="youtube-channels") as executor:
+            # Resolution lookups request the full parts, so their channels need no second fetch
+            lookups = {
+                identifier: executor.submit(copy_context().run, resolve_channel, youtube, identifier, channel_parts)
+                for identifier in unresolved
+            }
+            for identifier, future in lookups.items():
+                try:
+                    resolved = future.result()
+                except Exception as e:
+                    errors[identifier] = format_error_response(e)['error']
+                    continue
+                if not resolved:
+                    continue
+                quota_cost += resolved['quota_cost']
+                resolved_ids[identifier] = resolved['channel_id']
+                resolved_via[identifier] = resolved['resolved_via']
+                if resolved['channel']:
+                    channels[resolved['channel_id']] = resolved['channel']
             
-            if search_response.get('items'):
-                found_channel_id = search_response['items'][0]['snippet']['channelId']
-                # Now get full channel info
-                request = youtube.channels().list(
-                    part='snippet,statistics,status,brandingSettings,contentDetails',
-                    id=found_channel_id
-                )
-                channel_response = request.execute()
+            to_fetch = list(dict.fromkeys(
+                channel_id for channel_id in resolved_ids.values()
+                if channel_id and channel_id not in channels
+            ))
+            chunks = [
+                to_fetch[start:start + CHANNELS_LIST_MAX_IDS]
+                for start in range(0, len(to_fetch), CHANNELS_LIST_MAX_IDS)
+            ]
+            fetches = [
+                executor.submit(copy_context().run, execute_api_request, youtube.channels().list(
+                    part=channel_parts,
+                    id=','.join(chunk)
+                ))
+                for chunk in chunks
+            ]
+            quota_cost += len(fetches)
+            for chunk, future in zip(chunks, fetches):
+                try:
+                    for item in future.result().get('items', []):
+                        channels[item['id']] = item
+                except Exception as e:
+                    for channel_id in chunk:
+                        errors[channel_id] = format_error_response(e)['error']
         
-        if not channel_response or not channel_response.get('items'):
+        results = []
+        formatted = {}
+        for identifier in inputs:
+            channel_id = resolved_ids.get(identifier)
+            entry = {"input": identifier}
+            error = errors.get(identifier) or errors.get(channel_id)
+            if error:
+                entry['error'] = error
+            elif channel_id in channels:
+                if channel_id not in formatted:
+                    formatted[channel_id] = _format_channel(channels[channel_id])
+                entry['channel'] = formatted[channel_id]
+            else:
+                entry['error'] = {
+                    "type": "channel_not_found",
+                    "message": f"Channel '{identifier}' not found"
+                }
+            if identifier in resolved_via:
+                entry['resolved_via'] = resolved_via[identifier]
+            results.append(entry)
+        
+        result = {
+            "channels": results,
+            "found": sum(1 for entry in results if 'channel' in entry),
+            "failed": sum(1 for entry in results if 'error' in entry),
+            "_metadata": {
+                "api_quota_cost": quota_cost,  # 1 per 50 channels, plus alias lookups
+                "api_retries": api_retry_count(),
+                "requested": len(inputs),
+                "fetched_at": datetime.utcnow().isoformat() + 'Z'
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error fetching channels metadata: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
+
+@track_api_retries
+def youtube_sync_channel_videos(
+    channel_id: str,
+    max_new: int = 50,
+    include_transcripts: bool = False,
+    use_cache: bool = True,
+    delay_seconds: Optional[float] = None
+) -> types.TextContent:
+    """
+    Fetch only the uploads added since the channel was last synced.
+    
+    Args:
+        channel_id: YouTube channel ID (starts with UC...), handle, username, or channel URL
+        max_new: Most new videos to fetch in one sync (also the size of the first sync)
+        include_transcripts: Fetch transcripts for new videos
+        use_cache: Whether to use cached transcripts (only applies when include_transcripts is True)
+        delay_seconds: Delay between transcript fetches
+    
+    Returns:
+        New videos since the last sync plus the merged list of all known videos
+    """
+    try:
+        youtube = YouTubeAPIClient.get_instance()
+        resolved = resolve_channel(youtube, channel_id)
+        if not resolved:
             return types.TextContent(
                 type="text",
                 text=json.dumps({
                     "error": {
-                        "type": "channel_not_found",
-                        "message": f"Channel '{channel_id}' not found"
+                        "type": "not_found",
+                        "message": f"Channel {channel_id} not found"
                     }
                 })
             )
+        channel_id = resolved['channel_id']
+        store = ChannelSnapshotStore()
+        snapshot = store.get(channel_id) or {"channel_id": channel_id, "videos": [], "synced_at": None}
+        known_ids = {v['video_id'] for v in snapshot['videos']}
+        last_published_at = snapshot.get('last_published_at')
         
-        channel = channel_response['items'][0]
+        # Page through uploads (newest first) until reaching a known video
+        new_items = []
+        playlist_requests = 0
+        reached_known = False
+        with VideoDetailsFetcher(youtube) as details_fetcher:
+            for page in iter_playlist_pages(youtube, uploads_playlist_id(channel_id)):
+                playlist_requests += 1
+                page_items = []
+                for item in page.get('items', []):
+                    video_id = item['contentDetails']['videoId']
+                    published_at = item['contentDetails'].get('videoPublishedAt') or item['snippet']['publishedAt']
+                    # Older than the newest known video covers a deleted last-seen video
+                    if video_id in known_ids or (last_published_at and published_at < last_published_at):
+                        reached_known = True
+                        break
+                    if len(new_items) + len(page_items) >= max_new:
+                        break
+                    page_items.append(item)
+                new_items.extend(page_items)
+                details_fetcher.submit([item['contentDetails']['videoId'] for item in page_items])
+                if reached_known or len(new_items) >= max_new:
+                    break
+            
+            details_lookup = details_fetcher.results()
+        
+        metadata_cache = VideoMetadataCache()
+        new_videos = []
+        transcripts_fetched = 0
+        transcripts_cached = 0
+        for item in new_items:
+            video_id = item['contentDetails']['videoId']
+            details = details_lookup.get(video_id, {})
+            video_data = {
+                "video_id": video_id,
+                "title": item['snippet']['title'],
+                "description": item['snippet']['description'],
+                "published_at": item['contentDetails'].get('videoPublishedAt') or item['snippet']['publishedAt'],
+                "duration": details.get('contentDetails', {}).get('duration', ''),
+                "duration_seconds": parse_duration(details.get('contentDetails', {}).get('duration', '')),
+                "thumbnail_url": item['snippet'].get('thumbnails', {}).get('high', {}).get('url', ''),
+                "view_count": int(details.get('statistics', {}).get('viewCount', 0)),
+                "like_count": int(details.get('statistics', {}).get('likeCount', 0)),
+                "comment_count": int(details.get('statistics', {}).get('commentCount', 0)),
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+                "synced_at": datetime.now().isoformat()
+            }
+            metadata_cache.set(video_id, {
+                **video_data,
+                "channel_id": channel_id,
+                "channel_title": item['snippet'].get('channelTitle')
+            })
+            if 'statistics' in details:
+                record_stats("video", video_id, video_data)
+            
+            if include_transcripts:
+                transcript_data = json.loads(youtube_get_video_transcript(
+                    video_id,
+                    extract_mode="features",
+                    use_cache=use_cache,
+                    delay_seconds=delay_seconds,
+                    priority="harvest"
+                ).text)
+                video_data['transcript_available'] = 'error' not in transcript_data
+                if 'error' in transcript_data:
+                    logger.warning(f"Failed to get transcript for {video_id}: {transcript_data['error']}")
+                elif transcript_data['_metadata'].get('cache_hit'):
+                    transcripts_cached += 1
+                else:
+                    transcripts_fetched += 1
+            
+            new_videos.append(video_data)
+        
+        # Merge and persist the snapshot
+        previous_synced_at = snapshot['synced_at']
+        snapshot['videos'] = new_videos + snapshot['videos']
+        if snapshot['videos']:
+            snapshot['last_video_id'] = snapshot['videos'][0]['video_id']
+            snapshot['last_published_at'] = max(v['published_at'] for v in snapshot['videos'])
+        snapshot['synced_at'] = datetime.now().isoformat()
+        store.set(channel_id, snapshot)
         
-        # Build response matching v3 spec
         result = {
-            "channel": {
-                "id": channel['id'],
-                "title": channel['snippet']['title'],
-                "handle": None,  # Will be set if available
-                "custom_url": None,  # Will be set if available
-                "description": channel['snippet']['description'],
-                "published_at": channel['snippet']['publishedAt'],
-                "country": channel['snippet'].get('country', None),
-                "statistics": {
-                    "subscriber_count": int(channel['statistics'].get('subscriberCount', 0)),
-                    "subscriber_count_hidden": channel['statistics'].get('hiddenSubscriberCount', False),
-                    "view_count": int(channel['statistics'].get('viewCount', 0)),
-                    "video_count": int(channel['statistics'].get('videoCount', 0))
-                },
-                "branding": {
-                    "keywords": [],  # Will be set if available
-                    "banner_url": None,  # Will be set if available
-                    "thumbnail_url": channel['snippet'].get('thumbnails', {}).get('high', {}).get('url', None)
-                },
-                "content_details": {
-                    "related_playlists": {}
-                },
-                "status": {
-                    "privacy_status": None,
-                    "is_linked": None,
-                    "long_uploads_status": None,
-                    "made_for_kids": None
-                }
+            "channel_id": channel_id,
+            "new_videos": new_videos,
+            "videos": snapshot['videos'],
+            "sync": {
+                "first_sync": previous_synced_at is None,
+                "previous_synced_at": previous_synced_at,
+                "new_count": len(new_videos),
+                "known_count": len(snapshot['videos']) - len(new_videos),
+                # Hit max_new before reaching a known video: more may be waiting
+                "complete": reached_known or len(new_items) < max_new
             },
             "_metadata": {
-                "api_quota_cost": 3,  # channels.list costs 1, search might add 100
-                "fetched_at": datetime.utcnow().isoformat() + 'Z'
+                # playlistItems.list and videos.list cost 1 unit per request
+                "api_quota_cost": resolved['quota_cost'] + playlist_requests + details_fetcher.requests_made,
+                "api_retries": api_retry_count(),
+                "transcripts_fetched": transcripts_fetched,
+                "transcripts_cached": transcripts_cached,
+                "fetched_at": datetime.utcnow().isoformat() + "Z"
             }
         }
         
-        # Extract handle from custom URL if available
-        if 'brandingSettings' in channel and 'channel' in channel['brandingSettings']:
-            branding = channel['brandingSettings']['channel']
-            
-            # Get keywords
-            if 'keywords' in branding:
-                # Keywords are space-separated, handle quoted phrases
-                keywords_str = branding['keywords']
-                # Simple parsing - could be improved for quoted phrases
-                result['channel']['branding']['keywords'] = keywords_str.split()
-            
-            # Get custom URL/handle
-            if 'customUrl' in branding:
-                custom_url = branding['customUrl']
-                result['channel']['custom_url'] = f"https://youtube.com/{custom_url}"
-                # Extract handle (custom URL often starts with @)
-                if custom_url.startswith('@'):
-                    result['channel']['handle'] = custom_url
-                else:
-                    result['channel']['handle'] = '@' + custom_url.lstrip('/')
-        
-        # Get banner URL if available
-        if 'brandingSettings' in channel and 'image' in channel['brandingSettings']:
-            banner = channel['brandingSettings']['image'].get('bannerExternalUrl')
-            if banner:
-                result['channel']['branding']['banner_url'] = banner
-        
-        # Get content details
-        if 'contentDetails' in channel and 'relatedPlaylists' in channel['contentDetails']:
-            result['channel']['content_details']['related_playlists'] = channel['contentDetails']['relatedPlaylists']
-        
-        # Get status details
-        if 'status' in channel:
-            status = channel['status']
-            result['channel']['status']['privacy_status'] = status.get('privacyStatus')
-            result['channel']['status']['is_linked'] = status.get('isLinked')
-            result['channel']['status']['long_uploads_status'] = status.get('longUploadsStatus')
-            result['channel']['status']['made_for_kids'] = status.get('madeForKids')
-        
-        # If we did a search, add to quota cost
-        if not channel_id.startswith('UC'):
-            result['_metadata']['api_quota_cost'] = 103  # search (100) + channels (3)
-        
         return types.TextContent(
             type="text",
             text=json.dumps(result, indent=2)
         )
         
     except Exception as e:
-        logger.error(f"Error fetching channel metadata: {e}")
+        logger.error(f"Error syncing channel videos: {e}")
         return types.TextContent(
             type="text",
             text=json.dumps(format_error_response(e))
@@ -0,0 +1,192 @@
+"""YouTube comment tools"""
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Dict, Any, List, Tuple
+from mcp import types
+from googleapiclient.errors import HttpError
+from youtube_toolkit.tools.youtube_base import (
+    YouTubeAPIClient, CommentCache, parse_video_id, iter_comment_pages,
+    format_error_response, api_error_reason, track_api_retries, api_retry_count
+)
+from youtube_toolkit.logging_config import logger
+
+def _format_comment(snippet: Dict[str, Any], comment_id: str) -> Dict[str, Any]:
+    return {
+        "id": comment_id,
+        "author": snippet.get('authorDisplayName'),
+        "author_channel_id": snippet.get('authorChannelId', {}).get('value'),
+        "text": snippet.get('textDisplay', ''),
+        "like_count": snippet.get('likeCount', 0),
+        "published_at": snippet.get('publishedAt'),
+        "updated_at": snippet.get('updatedAt')
+    }
+
+def _format_thread(item: Dict[str, Any], include_replies: bool) -> Dict[str, Any]:
+    """Flatten a commentThreads.list item"""
+    top_level = item['snippet']['topLevelComment']
+    thread = _format_comment(top_level['snippet'], item['id'])
+    thread['reply_count'] = item['snippet'].get('totalReplyCount', 0)
+    if include_replies:
+        thread['replies'] = [
+            _format_comment(reply['snippet'], reply['id'])
+            for reply in item.get('replies', {}).get('comments', [])
+        ]
+    return thread
+
+def _fetch_comments(
+    youtube,
+    cache: CommentCache,
+    video_id: str,
+    max_comments: int,
+    include_replies: bool,
+    use_cache: bool
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Bring a video's cached comment threads up to date.
+
+    Returns:
+        (cache entry with the comments, commentThreads.list requests made)
+    """
+    part = 'snippet,replies' if include_replies else 'snippet'
+    entry = cache.get(video_id) if use_cache else None
+    if entry and include_replies and not entry.get('include_replies'):
+        # Cached threads lack replies; fetch them again
+        entry = None
+
+    if entry and cache.is_fresh(entry) and (entry['complete'] or len(entry['comments']) >= max_comments):
+        return {**entry, "cache": "hit"}, 0
+
+    requests = 0
+    comments, next_page_token, complete, status = [], None, False, "miss"
+    if entry:
+        # Incremental refresh: only threads newer than the newest cached one
+        known = {c['id'] for c in entry['comments']}
+        newest = entry['comments'][0]['published_at'] if entry['comments'] else None
+        new_comments = []
+        reached_known = False
+        for page in iter_comment_pages(youtube, video_id, part, max_threads=max_comments):
+            requests += 1
+            for item in page.get('items', []):
+                thread = _format_thread(item, include_replies)
+                if thread['id'] in known or (newest and thread['published_at'] < newest):
+                    reached_known = True
+                    break
+                new_comments.append(thread)
+            next_page_token = page.get('nextPageToken')
+            if reached_known:
+                break
+        if reached_known or not entry['comments']:
+            comments = new_comments + entry['comments']
+            next_page_token, complete = entry.get('next_page_token'), entry['complete']
+        else:
+            # More new threads than the cap: the cached ones are no longer contiguous
+            comments, complete = new_comments, next_page_token is None
+        status = "refresh"
+
+    # Continue into older threads until the cap or the end of the comment section
+    if not complete and len(comments) < max_comments and (status == "miss" or next_page_token):
+        known = {c['id'] for c in comments}
+        for page in iter_comment_pages(
+            youtube, video_id, part, page_token=next_page_token, max_threads=max_comments - len(comments)
+        ):
+            requests += 1
+            for item in page.get('items', []):
+                if item['id'] not in known:
+                    comments.append(_format_thread(item, include_replies))
+            next_page_token = page.get('nextPageToken')
+        complete = next_page_token is None
+
+    entry = {
+        "video_id": video_id,
+        "comments": comments,
+        "next_page_token": next_page_token,
+        "complete": complete,
+        "include_replies": include_replies
+    }
+    cache.set(video_id, entry)
+    return {**entry, "cache": status}, requests
+
+@track_api_retries
+def youtube_get_video_comments(
+    video_ids: List[str],
+    max_comments: int = 100,
+    include_replies: bool = False,
+    use_cache: bool = True,
+    max_concurrency: int = 4
+) -> types.TextContent:
+    """
+    Fetch comment threads for one or more videos, newest first.
+
+    Comments are cached per video. Within COMMENT_CACHE_TTL_MINUTES the
+    cache is served as is; after that only threads newer than the newest
+    cached one are fetched. Pagination stops as soon as `max_comments`
+    threads are known, and videos are fetched concurrently.
+
+    Args:
+        video_ids: Video IDs or URLs
+        max_comments: Most comment threads to return per video
+        include_replies: Include up to 5 replies per thread (no extra quota)
+        use_cache: Use and incrementally refresh cached comments
+        max_concurrency: Videos fetched at once
+
+    Returns:
+        Per-video comment threads plus per-video errors (e.g., comments disabled)
+    """
+    try:
+        youtube = YouTubeAPIClient.get_instance()
+        cache = CommentCache()
+        video_ids = list(dict.fromkeys(parse_video_id(v) for v in video_ids))
+
+        videos = []
+        errors = []
+        requests = 0
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="youtube-comments") as executor:
+            futures = {
+                video_id: executor.submit(
+                    copy_context().run, _fetch_comments, youtube, cache, video_id,
+                    max_comments, include_replies, use_cache
+                )
+                for video_id in video_ids
+            }
+            for video_id, future in futures.items():
+                try:
+                    entry, video_requests = future.result()
+                except HttpError as e:
+                    error = format_error_response(e)['error']
+                    if api_error_reason(e) == 'commentsDisabled':
+                        error = {"type": "comments_disabled", "message": "Comments are disabled for this video"}
+                    errors.append({"video_id": video_id, "error": error})
+                    continue
+                requests += video_requests
+                comments = entry['comments'][:max_comments]
+                videos.append({
+                    "video_id": video_id,
+                    "comments": comments,
+                    "comments_returned": len(comments),
+                    "complete": entry['complete'] and len(comments) == len(entry['comments']),
+                    "cache": entry['cache'],
+                    "fetched_at": entry['fetched_at']
+                })
+
+        result = {
+            "videos": videos,
+            "errors": errors,
+            "_metadata": {
+                "api_quota_cost": requests,  # 1 unit per page of up to 100 threads
+                "api_retries": api_retry_count(),
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error fetching comments: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
@@ -0,0 +1,274 @@
+"""Streaming export of full channel and playlist catalogs to disk"""
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Literal, Callable
+from mcp import types
+from youtube_toolkit.tools.youtube_base import (
+    YouTubeAPIClient, resolve_cache_dir, format_error_response, execute_api_request,
+    resolve_channel, uploads_playlist_id, parse_playlist_id, iter_playlist_pages, parse_duration,
+    track_api_retries, api_retry_count
+)
+from youtube_toolkit.logging_config import logger
+
+# Columns of an exported video, in CSV order
+EXPORT_FIELDS = (
+    "video_id", "position", "title", "published_at", "channel_id", "channel_title",
+    "duration_seconds", "view_count", "like_count", "comment_count", "description"
+)
+EXPORT_FORMATS = ("ndjson", "csv")
+
+def _int_or_none(statistics: Dict[str, str], key: str) -> Optional[int]:
+    return int(statistics[key]) if key in statistics else None
+
+def _export_row(item: Dict[str, Any], details: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Flatten a playlistItems.list item and its videos.list details"""
+    snippet = item['snippet']
+    statistics = (details or {}).get('statistics', {})
+    duration = (details or {}).get('contentDetails', {}).get('duration')
+    return {
+        "video_id": item['contentDetails']['videoId'],
+        "position": snippet.get('position'),
+        "title": snippet.get('title'),
+        "published_at": item['contentDetails'].get('videoPublishedAt') or snippet.get('publishedAt'),
+        "channel_id": snippet.get('videoOwnerChannelId') or snippet.get('channelId'),
+        "channel_title": snippet.get('videoOwnerChannelTitle') or snippet.get('channelTitle'),
+        "duration_seconds": parse_duration(duration) if duration else None,
+        "view_count": _int_or_none(statistics, 'viewCount'),
+        "like_count": _int_or_none(statistics, 'likeCount'),
+        "comment_count": _int_or_none(statistics, 'commentCount'),
+        "description": snippet.get('description')
+    }
+
+class CatalogExporter:
+    """Streams a playlist (or a channel's uploads) to an NDJSON or CSV file.
+
+    Only two pages are held in memory at a time: while one page's details
+    are fetched, the next page is listed, and each page is written as soon
+    as its details arrive. After every page, `<output>.checkpoint.json`
+    records the page token and in-page offset of the next unwritten video
+    plus the file size at that point, so an interrupted export resumes
+    exactly there (anything written after the checkpoint is truncated).
+    """
+
+    def __init__(
+        self,
+        playlist_id: str,
+        output_path: Path,
+        export_format: str = "ndjson",
+        include_details: bool = True
+    ):
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"format must be one of {list(EXPORT_FORMATS)}")
+        self.playlist_id = playlist_id
+        self.output_path = Path(output_path)
+        self.checkpoint_path = self.output_path.with_name(self.output_path.name + ".checkpoint.json")
+        self.export_format = export_format
+        self.include_details = include_details
+        self.playlist_requests = 0
+        self.details_requests = 0
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if not self.checkpoint_path.exists():
+            return None
+        with open(self.checkpoint_path, 'r') as f:
+            return json.load(f)
+
+    def _save_checkpoint(self, state: Dict[str, Any]):
+        state['updated_at'] = datetime.now().isoformat()
+        tmp_path = self.checkpoint_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _fetch_details(self, youtube, video_ids: List[str]) -> Dict[str, Dict]:
+        request = youtube.videos().list(part='statistics,contentDetails', id=','.join(video_ids))
+        return {item['id']: item for item in execute_api_request(request).get('items', [])}
+
+    def run(
+        self,
+        youtube,
+        max_videos: Optional[int] = None,
+        restart: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Export until the catalog ends or `max_videos` more have been written.
+
+        Args:
+            youtube: YouTube API client instance
+            max_videos: Stop after writing this many videos in this run
+            restart: Ignore an existing checkpoint and start a new file
+            progress_callback: Called with the total written after each page
+
+        Returns:
+            Checkpoint state after the run
+        """
+        state = None if restart else self.load_checkpoint()
+        if state and (state['playlist_id'], state['format']) != (self.playlist_id, self.export_format):
+            raise ValueError(
+                f"{self.output_path} holds an export of {state['playlist_id']} as {state['format']}; "
+                "use another output path or restart"
+            )
+        resumed = state is not None
+        if state is None:
+            state = {
+                "playlist_id": self.playlist_id,
+                "format": self.export_format,
+                "page_token": None,
+                "skip": 0,
+                "written": 0,
+                "bytes": 0,
+                "complete": False,
+                "started_at": datetime.now().isoformat()
+            }
+        state['resumed'] = resumed
+        if state['complete']:
+            return state
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop anything written after the last checkpoint
+        with open(self.output_path, 'a'):
+            pass
+        os.truncate(self.output_path, state['bytes'])
+
+        written_this_run = 0
+        with open(self.output_path, 'a', newline='', encoding='utf-8') as f, \
+                ThreadPoolExecutor(max_workers=2, thread_name_prefix="youtube-export") as executor:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS) if self.export_format == "csv" else None
+            if writer and state['bytes'] == 0:
+                writer.writeheader()
+
+            def write_page(pending: Dict[str, Any]):
+                details = pending['details'].result() if pending['details'] else {}
+                for item in pending['items']:
+                    row = _export_row(item, details.get(item['contentDetails']['videoId']))
+                    if writer:
+                        writer.writerow(row)
+                    else:
+                        f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                f.flush()
+                state['written'] += len(pending['items'])
+                state['bytes'] = os.fstat(f.fileno()).st_size
+                state['page_token'], state['skip'] = pending['resume_at']
+                state['complete'] = pending['last']
+                self._save_checkpoint(state)
+                if progress_callback:
+                    progress_callback(state['written'])
+
+            pending = None
+            page_token, skip = state['page_token'], state['skip']
+            for page in iter_playlist_pages(youtube, self.playlist_id, page_token=page_token):
+                self.playlist_requests += 1
+                page_items = page.get('items', [])
+                items = page_items[skip:]
+                if max_videos is not None:
+                    items = items[:max_videos - written_this_run]
+                written_this_run += len(items)
+                end = skip + len(items)
+                next_token = page.get('nextPageToken')
+                if end < len(page_items):
+                    # Stopped mid-page: resume later from this page at the same offset
+                    resume_at, last = (page_token, end), False
+                else:
+                    resume_at, last = (next_token, 0), not next_token
+
+                video_ids = [item['contentDetails']['videoId'] for item in items]
+                details = None
+                if self.include_details and video_ids:
+                    details = executor.submit(copy_context().run, self._fetch_details, youtube, video_ids)
+                    self.details_requests += 1
+                # Write the previous page while this page's details load
+                if pending:
+                    write_page(pending)
+                pending = {"items": items, "details": details, "resume_at": resume_at, "last": last}
+
+                page_token, skip = next_token, 0
+                if max_videos is not None and written_this_run >= max_videos:
+                    break
+            if pending:
+                write_page(pending)
+
+        state['written_this_run'] = written_this_run
+        return state
+
+@track_api_retries
+def youtube_export_catalog(
+    channel_id: Optional[str] = None,
+    playlist_id: Optional[str] = None,
+    output_path: Optional[str] = None,
+    output_format: Literal["ndjson", "csv"] = "ndjson",
+    max_videos: Optional[int] = None,
+    include_details: bool = True,
+    restart: bool = False
+) -> types.TextContent:
+    """
+    Stream every video of a channel or playlist to an NDJSON or CSV file.
+
+    Args:
+        channel_id: Channel ID, handle, username, or channel URL (exports its uploads)
+        playlist_id: Playlist ID or URL (used instead of channel_id)
+        output_path: File to write (default: exports/<id>.<output_format> in the cache directory)
+        output_format: 'ndjson' (one JSON object per line) or 'csv'
+        max_videos: Write at most this many videos in this call; call again to continue
+        include_details: Add duration and statistics (1 extra unit per 50 videos)
+        restart: Discard an existing checkpoint and start over
+
+    Returns:
+        Export progress: file path, videos written, whether the catalog is complete
+    """
+    try:
+        if bool(channel_id) == bool(playlist_id):
+            raise ValueError("Provide exactly one of channel_id or playlist_id")
+        youtube = YouTubeAPIClient.get_instance()
+        resolve_quota = 0
+        source_id = parse_playlist_id(playlist_id) if playlist_id else None
+        if channel_id:
+            resolved = resolve_channel(youtube, channel_id)
+            if not resolved:
+                return types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "error": {
+                            "type": "not_found",
+                            "message": f"Channel {channel_id} not found"
+                        }
+                    })
+                )
+            resolve_quota = resolved['quota_cost']
+            source_id = uploads_playlist_id(resolved['channel_id'])
+
+        path = Path(output_path) if output_path else resolve_cache_dir(None, 'exports') / f"{source_id}.{output_format}"
+        exporter = CatalogExporter(source_id, path, output_format, include_details)
+        state = exporter.run(youtube, max_videos=max_videos, restart=restart)
+
+        result = {
+            "output_path": str(path),
+            "format": output_format,
+            "playlist_id": source_id,
+            "written": state['written'],
+            "written_this_call": state.get('written_this_run', 0),
+            "complete": state['complete'],
+            "resumed": state['resumed'],
+            "_metadata": {
+                "api_quota_cost": resolve_quota + exporter.playlist_requests + exporter.details_requests,
+                "api_retries": api_retry_count(),
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error exporting catalog: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
@@ -0,0 +1,212 @@
+"""Local time-series history of video and channel statistics"""
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Literal
+from mcp import types
+from youtube_toolkit.tools.youtube_base import resolve_cache_dir, format_error_response
+from youtube_toolkit.logging_config import logger
+
+# Metrics recorded per entity kind
+HISTORY_METRICS = {
+    "video": ("view_count", "like_count", "comment_count"),
+    "channel": ("subscriber_count", "view_count", "video_count"),
+}
+# Write a full (absolute) record every this many records so a damaged
+# line only affects values until the next keyframe
+KEYFRAME_INTERVAL = 100
+# Growth windows reported by the query tool
+GROWTH_WINDOWS = {"24h": timedelta(hours=24), "7d": timedelta(days=7), "30d": timedelta(days=30)}
+
+_append_lock = threading.Lock()
+
+class StatsHistoryStore:
+    """Append-only, delta-encoded statistics snapshots per entity.
+
+    Each entity has its own NDJSON file under `history/<kind>/`, so history
+    is indexed by entity, and records within a file are in time order. The
+    first record (and every KEYFRAME_INTERVAL-th) holds absolute values,
+    `{"t": <epoch seconds>, "v": {...}}`; the others hold only the seconds
+    since the previous record and the metrics that changed,
+    `{"dt": 3600, "d": {"view_count": 42}}`.
+    """
+
+    def __init__(self):
+        self.base_dir = resolve_cache_dir(None, 'history')
+
+    def _path(self, kind: str, entity_id: str) -> Path:
+        directory = self.base_dir / kind
+        directory.mkdir(exist_ok=True)
+        return directory / f"{entity_id}.ndjson"
+
+    def _decode(self, path: Path) -> tuple:
+        """Replay a history file; returns (snapshots, in_sync)"""
+        snapshots = []
+        t, values = None, {}
+        if not path.exists():
+            return snapshots, True
+        with open(path, 'r') as f:
+            content = f.read()
+        for line in content.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Skip a torn write; the next keyframe resynchronizes
+                t = None
+                continue
+            if 'v' in record:
+                t, values = record['t'], dict(record['v'])
+            elif t is None:
+                continue
+            else:
+                t += record['dt']
+                for metric, delta in record.get('d', {}).items():
+                    values[metric] = values.get(metric, 0) + delta
+            snapshots.append({"t": t, "values": dict(values)})
+        # A missing final newline means the last write was torn
+        in_sync = t is not None and (not content or content.endswith('\n'))
+        return snapshots, in_sync
+
+    def read(self, kind: str, entity_id: str) -> List[Dict[str, Any]]:
+        """
+        Decode an entity's history.
+
+        Returns:
+            Snapshots as {"t": epoch seconds, "values": {...}}, oldest first
+        """
+        return self._decode(self._path(kind, entity_id))[0]
+
+    def append(self, kind: str, entity_id: str, values: Dict[str, Optional[int]], t: Optional[int] = None):
+        """Record a snapshot; metrics that are None are not recorded"""
+        values = {k: v for k, v in values.items() if v is not None and k in HISTORY_METRICS[kind]}
+        if not values:
+            return
+        t = int(t if t is not None else time.time())
+        path = self._path(kind, entity_id)
+        with _append_lock:
+            history, in_sync = self._decode(path)
+            prefix = '' if in_sync or not path.exists() else '\n'
+            if not history or not in_sync or len(history) % KEYFRAME_INTERVAL == 0 or t < history[-1]['t']:
+                record = {"t": t, "v": {**(history[-1]['values'] if history else {}), **values}}
+            else:
+                previous = history[-1]['values']
+                record = {"dt": t - history[-1]['t']}
+                changed = {k: v - previous.get(k, 0) for k, v in values.items() if v != previous.get(k)}
+                if changed:
+                    record['d'] = changed
+            with open(path, 'a') as f:
+                f.write(prefix + json.dumps(record, separators=(',', ':')) + '\n')
+
+    def entities(self, kind: str) -> List[str]:
+        """IDs with recorded history"""
+        directory = self.base_dir / kind
+        if not directory.exists():
+            return []
+        return sorted(path.stem for path in directory.glob("*.ndjson"))
+
+def record_stats(kind: Literal["video", "channel"], entity_id: str, values: Dict[str, Optional[int]]):
+    """Append a statistics snapshot, never failing the calling tool"""
+    try:
+        StatsHistoryStore().append(kind, entity_id, values)
+    except Exception as e:
+        logger.warning(f"Could not record {kind} statistics for {entity_id}: {e}")
+
+def _iso(t: int) -> str:
+    return datetime.utcfromtimestamp(t).isoformat() + "Z"
+
+def _growth(snapshots: List[Dict[str, Any]], metric: str) -> Optional[Dict[str, Any]]:
+    """Change of a metric between the first and last snapshot that have it"""
+    points = [(s['t'], s['values'][metric]) for s in snapshots if metric in s['values']]
+    if len(points) < 2:
+        return None
+    (t0, v0), (t1, v1) = points[0], points[-1]
+    days = (t1 - t0) / 86400
+    return {
+        "start": v0,
+        "end": v1,
+        "change": v1 - v0,
+        "change_pct": round(100.0 * (v1 - v0) / v0, 2) if v0 else None,
+        "per_day": round((v1 - v0) / days, 2) if days > 0 else None,
+        "from": _iso(t0),
+        "to": _iso(t1)
+    }
+
+def _parse_time(value: str) -> int:
+    return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+
+def youtube_get_stats_history(
+    entity_ids: List[str],
+    kind: Literal["video", "channel"] = "video",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    include_points: bool = False
+) -> types.TextContent:
+    """
+    Report recorded statistics over time from local history (no API calls).
+
+    Args:
+        entity_ids: Video or channel IDs
+        kind: Whether the IDs are videos or channels
+        since: ISO 8601 start of the query window (default: all history)
+        until: ISO 8601 end of the query window (default: now)
+        include_points: Include every snapshot in the window
+
+    Returns:
+        Per entity: latest values, growth over the window and over the last 24h/7d/30d
+    """
+    try:
+        if kind not in HISTORY_METRICS:
+            raise ValueError(f"kind must be one of {list(HISTORY_METRICS)}")
+        store = StatsHistoryStore()
+        start = _parse_time(since) if since else None
+        end = _parse_time(until) if until else int(time.time())
+
+        entities = {}
+        missing = []
+        for entity_id in entity_ids:
+            history = [s for s in store.read(kind, entity_id) if s['t'] <= end]
+            if not history:
+                missing.append(entity_id)
+                continue
+            window = [s for s in history if start is None or s['t'] >= start]
+            latest = history[-1]
+            entry = {
+                "snapshots": len(window),
+                "first_recorded": _iso(history[0]['t']),
+                "latest": {"at": _iso(latest['t']), **latest['values']},
+                "window_growth": {m: _growth(window, m) for m in HISTORY_METRICS[kind]},
+                "recent_growth": {
+                    label: {
+                        m: _growth([s for s in history if s['t'] >= end - span.total_seconds()], m)
+                        for m in HISTORY_METRICS[kind]
+                    }
+                    for label, span in GROWTH_WINDOWS.items()
+                }
+            }
+            if include_points:
+                entry['points'] = [{"at": _iso(s['t']), **s['values']} for s in window]
+            entities[entity_id] = entry
+
+        result = {
+            "kind": kind,
+            "window": {"since": since, "until": until or _iso(end)},
+            "entities": entities,
+            "missing": missing,
+            "_metadata": {
+                "api_quota_cost": 0,  # Answered from local history
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error reading statistics history: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
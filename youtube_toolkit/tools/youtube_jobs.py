@@ -0,0 +1,306 @@
+"""Background jobs for long-running harvests"""
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable
+from mcp import types
+from youtube_toolkit.tools.youtube_base import resolve_cache_dir, format_error_response
+from youtube_toolkit.tools.youtube_channel import youtube_get_channel_videos
+from youtube_toolkit.config import load_config
+from youtube_toolkit.logging_config import logger
+
+def _run_channel_harvest(params: Dict[str, Any], progress: Callable) -> Dict[str, Any]:
+    """Job runner for youtube_get_channel_videos"""
+    response = youtube_get_channel_videos(
+        params['channel_id'],
+        params.get('max_results', 10),
+        params.get('include_transcripts', True),
+        params.get('use_cache', True),
+        params.get('delay_seconds'),
+        params.get('skip_likely_duplicates', False),
+        progress_callback=lambda done, total, video: progress(done, total, f"Processed {video['video_id']}")
+    )
+    return json.loads(response.text)
+
+# Job kinds and the functions that run them
+JOB_RUNNERS = {
+    "channel_harvest": _run_channel_harvest,
+}
+
+class JobManager:
+    """Runs jobs on a bounded worker pool and persists their state.
+
+    Each job is stored as `<job_id>.json` (status and progress) with its
+    result in `<job_id>.result.json`, so status polls stay cheap and
+    finished results survive client reconnects and server restarts.
+    """
+    _instance = None
+
+    def __init__(self, jobs_dir: Optional[Path] = None, max_workers: Optional[int] = None):
+        config = load_config()
+        self.jobs_dir = jobs_dir or resolve_cache_dir(None, 'jobs')
+        self.max_workers = max_workers or config.job_max_workers
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="youtube-job")
+        self._lock = threading.Lock()
+        self._requeue_unfinished()
+
+    @classmethod
+    def get_instance(cls) -> "JobManager":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _job_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _result_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.result.json"
+
+    def _save(self, job: Dict[str, Any]):
+        """Atomically persist a job record"""
+        path = self._job_path(job['job_id'])
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(job, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Load a job record"""
+        path = self._job_path(job_id)
+        if not path.exists():
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Load a finished job's result"""
+        path = self._result_path(job_id)
+        if not path.exists():
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def list(self, limit: Optional[int] = 20) -> list:
+        """Most recently submitted jobs"""
+        jobs = []
+        for path in self.jobs_dir.glob("*.json"):
+            if path.name.endswith('.result.json'):
+                continue
+            with open(path, 'r') as f:
+                jobs.append(json.load(f))
+        jobs.sort(key=lambda j: j['submitted_at'], reverse=True)
+        return jobs[:limit]
+
+    def submit(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a job and return its record immediately"""
+        if kind not in JOB_RUNNERS:
+            raise ValueError(f"Unknown job kind '{kind}'; use one of {list(JOB_RUNNERS)}")
+        job = {
+            "job_id": uuid.uuid4().hex[:12],
+            "kind": kind,
+            "params": params,
+            "status": "queued",
+            "progress": {"completed": 0, "total": None, "message": None},
+            "submitted_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None
+        }
+        self._save(job)
+        self._executor.submit(self._run, job['job_id'])
+        return job
+
+    def _requeue_unfinished(self):
+        """Restart jobs that were queued or running when the server last stopped"""
+        for job in self.list(limit=None):
+            if job['status'] in ('queued', 'running'):
+                logger.info(f"Requeueing interrupted job {job['job_id']}")
+                job['status'] = 'queued'
+                job['restarts'] = job.get('restarts', 0) + 1
+                self._save(job)
+                self._executor.submit(self._run, job['job_id'])
+
+    def _run(self, job_id: str):
+        with self._lock:
+            job = self.get(job_id)
+            job['status'] = 'running'
+            job['started_at'] = datetime.now().isoformat()
+            self._save(job)
+
+        def progress(completed: int, total: Optional[int], message: Optional[str] = None):
+            with self._lock:
+                job['progress'] = {"completed": completed, "total": total, "message": message}
+                self._save(job)
+
+        try:
+            result = JOB_RUNNERS[job['kind']](job['params'], progress)
+            with open(self._result_path(job_id), 'w') as f:
+                json.dump(result, f)
+            with self._lock:
+                if isinstance(result, dict) and 'error' in result:
+                    job['status'] = 'failed'
+                    job['error'] = result['error']
+                else:
+                    job['status'] = 'completed'
+                job['finished_at'] = datetime.now().isoformat()
+                self._save(job)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+            with self._lock:
+                job['status'] = 'failed'
+                job['error'] = format_error_response(e)['error']
+                job['finished_at'] = datetime.now().isoformat()
+                self._save(job)
+
+def youtube_submit_channel_harvest(
+    channel_id: str,
+    max_results: int = 10,
+    include_transcripts: bool = True,
+    use_cache: bool = True,
+    delay_seconds: Optional[float] = None,
+    skip_likely_duplicates: bool = False
+) -> types.TextContent:
+    """
+    Start a background youtube_get_channel_videos harvest.
+
+    Args:
+        channel_id: YouTube channel ID (starts with UC...)
+        max_results: Maximum number of videos to harvest
+        include_transcripts: Fetch transcripts for each video
+        use_cache: Use cached transcripts when available
+        delay_seconds: Delay between transcript fetches
+        skip_likely_duplicates: Skip transcript scraping for likely reuploads
+
+    Returns:
+        Job ID and initial status
+    """
+    try:
+        job = JobManager.get_instance().submit("channel_harvest", {
+            "channel_id": channel_id,
+            "max_results": max_results,
+            "include_transcripts": include_transcripts,
+            "use_cache": use_cache,
+            "delay_seconds": delay_seconds,
+            "skip_likely_duplicates": skip_likely_duplicates
+        })
+        result = {
+            "job_id": job['job_id'],
+            "status": job['status'],
+            "_metadata": {
+                "api_quota_cost": 0,  # The harvest itself costs what youtube_get_channel_videos costs
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error submitting harvest job: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
+
+def youtube_get_job_status(job_id: Optional[str] = None) -> types.TextContent:
+    """
+    Get status and progress of a background job.
+
+    Args:
+        job_id: Job to inspect; lists recent jobs when omitted
+
+    Returns:
+        Job record (status, progress, timings, error) or a list of recent jobs
+    """
+    try:
+        manager = JobManager.get_instance()
+        if job_id:
+            job = manager.get(job_id)
+            if job is None:
+                return types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "error": {
+                            "type": "not_found",
+                            "message": f"Job {job_id} not found"
+                        }
+                    })
+                )
+            result = dict(job)
+        else:
+            result = {"jobs": manager.list()}
+        result['_metadata'] = {
+            "api_quota_cost": 0,
+            "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error reading job status: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
+
+def youtube_get_job_result(job_id: str) -> types.TextContent:
+    """
+    Fetch the result of a finished background job.
+
+    Args:
+        job_id: Job to fetch
+
+    Returns:
+        The job's result (same shape as the underlying tool's response)
+    """
+    try:
+        manager = JobManager.get_instance()
+        job = manager.get(job_id)
+        if job is None:
+            return types.TextContent(
+                type="text",
+                text=json.dumps({
+                    "error": {
+                        "type": "not_found",
+                        "message": f"Job {job_id} not found"
+                    }
+                })
+            )
+        if job['status'] not in ('completed', 'failed'):
+            return types.TextContent(
+                type="text",
+                text=json.dumps({
+                    "error": {
+                        "type": "job_not_finished",
+                        "message": f"Job {job_id} is {job['status']}",
+                        "details": {"progress": job['progress']}
+                    }
+                })
+            )
+
+        result = manager.get_result(job_id) or {"error": job['error']}
+        result['_job'] = {
+            "job_id": job_id,
+            "status": job['status'],
+            "submitted_at": job['submitted_at'],
+            "finished_at": job['finished_at']
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error reading job result: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
@@ -0,0 +1,202 @@
+"""YouTube playlist tools"""
+import itertools
+import json
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable
+from mcp import types
+from youtube_toolkit.tools.youtube_base import (
+    YouTubeAPIClient, TranscriptCache, VideoMetadataCache, VideoDetailsFetcher,
+    parse_playlist_id, iter_playlist_pages, parse_duration, format_error_response,
+    execute_api_request, run_concurrently, track_api_retries, api_retry_count
+)
+from youtube_toolkit.tools.youtube_video import youtube_get_video_transcript
+from youtube_toolkit.tools.youtube_history import record_stats
+from youtube_toolkit.logging_config import logger
+
+@track_api_retries
+def youtube_get_playlist_videos(
+    playlist_id: str,
+    max_results: int = 50,
+    include_transcripts: bool = False,
+    use_cache: bool = True,
+    scrape_missing: bool = True,
+    delay_seconds: Optional[float] = None,
+    progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None
+) -> types.TextContent:
+    """
+    List the videos of a playlist in playlist order.
+    
+    Pages playlistItems.list (1 unit per 50 videos) while each page's
+    durations and statistics load in the background, so a course playlist
+    comes back in a few round trips instead of one call per video.
+    
+    Args:
+        playlist_id: Playlist ID or a URL with a list= parameter
+        max_results: Maximum number of videos to return
+        include_transcripts: Add each video's transcript text
+        use_cache: Use cached transcripts when available
+        scrape_missing: Scrape transcripts that are not cached (rate limited);
+            when False only cached transcripts are returned
+        delay_seconds: Delay between transcript scrapes
+        progress_callback: Called as (completed, total, video_data) after each video
+    
+    Returns:
+        Playlist info and array of video objects with metadata and optional transcripts
+    """
+    try:
+        youtube = YouTubeAPIClient.get_instance()
+        playlist_id = parse_playlist_id(playlist_id)
+        
+        # Playlist info and the first page are independent: fetch them together
+        pages = iter_playlist_pages(youtube, playlist_id)
+        playlist_request = youtube.playlists().list(part='snippet,contentDetails', id=playlist_id)
+        playlist_response, first_page = run_concurrently(
+            lambda: execute_api_request(playlist_request),
+            lambda: next(pages)
+        )
+        
+        if not playlist_response.get('items'):
+            return types.TextContent(
+                type="text",
+                text=json.dumps({
+                    "error": {
+                        "type": "not_found",
+                        "message": f"Playlist {playlist_id} not found"
+                    }
+                })
+            )
+        playlist_info = playlist_response['items'][0]
+        
+        # Each page's details are fetched while the next page loads
+        items = []
+        playlist_requests = 0
+        with VideoDetailsFetcher(youtube) as details_fetcher:
+            for page in itertools.chain([first_page], pages):
+                playlist_requests += 1
+                page_items = page.get('items', [])[:max_results - len(items)]
+                items.extend(page_items)
+                details_fetcher.submit([item['contentDetails']['videoId'] for item in page_items])
+                if len(items) >= max_results:
+                    break
+            
+            details_lookup = details_fetcher.results()
+        
+        snippet = playlist_info['snippet']
+        result = {
+            "playlist": {
+                "id": playlist_info['id'],
+                "title": snippet['title'],
+                "description": snippet.get('description', ''),
+                "channel_id": snippet.get('channelId'),
+                "channel_title": snippet.get('channelTitle'),
+                "published_at": snippet.get('publishedAt'),
+                "item_count": playlist_info.get('contentDetails', {}).get('itemCount'),
+                "url": f"https://www.youtube.com/playlist?list={playlist_info['id']}"
+            },
+            "videos": []
+        }
+        
+        transcripts_fetched = 0
+        transcripts_cached = 0
+        transcripts_missing = 0
+        transcripts_blocked = 0
+        unavailable = 0
+        metadata_cache = VideoMetadataCache()
+        transcript_cache = TranscriptCache()
+        
+        for item in items:
+            video_id = item['contentDetails']['videoId']
+            details = details_lookup.get(video_id)
+            item_snippet = item['snippet']
+            video_data = {
+                "video_id": video_id,
+                "position": item_snippet.get('position'),
+                "title": item_snippet['title'],
+                "description": item_snippet.get('description', ''),
+                "published_at": item['contentDetails'].get('videoPublishedAt') or item_snippet.get('publishedAt'),
+                "channel_id": item_snippet.get('videoOwnerChannelId'),
+                "channel_title": item_snippet.get('videoOwnerChannelTitle'),
+                "duration": '',
+                "duration_seconds": 0,
+                "thumbnail_url": item_snippet.get('thumbnails', {}).get('high', {}).get('url', ''),
+                "view_count": 0,
+                "like_count": 0,
+                "comment_count": 0,
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+                "transcript": None
+            }
+            
+            if details is None:
+                # Deleted and private videos stay in playlists but have no details
+                video_data['unavailable'] = True
+                unavailable += 1
+            else:
+                statistics = details.get('statistics', {})
+                duration = details.get('contentDetails', {}).get('duration', '')
+                video_data.update({
+                    "duration": duration,
+                    "duration_seconds": parse_duration(duration),
+                    "view_count": int(statistics.get('viewCount', 0)),
+                    "like_count": int(statistics.get('likeCount', 0)),
+                    "comment_count": int(statistics.get('commentCount', 0))
+                })
+                metadata_cache.set(video_id, {
+                    k: v for k, v in video_data.items() if k not in ('transcript', 'position')
+                })
+                if statistics:
+                    record_stats("video", video_id, video_data)
+            
+            if include_transcripts and not video_data.get('unavailable'):
+                cached = use_cache and transcript_cache.get(video_id) is not None
+                if not cached and not scrape_missing:
+                    transcripts_missing += 1
+                else:
+                    transcript_data = json.loads(youtube_get_video_transcript(
+                        video_id,
+                        extract_mode="full",
+                        use_cache=use_cache,
+                        delay_seconds=delay_seconds,
+                        priority="harvest"
+                    ).text)
+                    if 'error' not in transcript_data:
+                        if transcript_data.get('_metadata', {}).get('cache_hit', False):
+                            transcripts_cached += 1
+                        else:
+                            transcripts_fetched += 1
+                        video_data['transcript'] = ' '.join(
+                            entry['text'] for entry in transcript_data.get('full_transcript', [])
+                        )
+                    else:
+                        logger.warning(f"Failed to get transcript for {video_id}: {transcript_data['error']}")
+                        error_info = transcript_data['error']
+                        if isinstance(error_info, dict) and 'blocked' in error_info.get('type', ''):
+                            transcripts_blocked += 1
+            
+            result['videos'].append(video_data)
+            if progress_callback:
+                progress_callback(len(result['videos']), len(items), video_data)
+        
+        result['_metadata'] = {
+            # playlists.list (1) + playlistItems.list (1 per page) + videos.list (1 per 50 videos)
+            "api_quota_cost": 1 + playlist_requests + details_fetcher.requests_made,
+            "api_retries": api_retry_count(),
+            "videos_returned": len(result['videos']),
+            "videos_unavailable": unavailable,
+            "transcripts_fetched": transcripts_fetched,
+            "transcripts_cached": transcripts_cached,
+            "transcripts_not_cached": transcripts_missing,
+            "transcripts_blocked": transcripts_blocked,
+            "fetched_at": datetime.utcnow().isoformat() + "Z"
+        }
+        
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+        
+    except Exception as e:
+        logger.error(f"Error fetching playlist videos: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
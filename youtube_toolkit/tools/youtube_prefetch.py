@@ -0,0 +1,345 @@
+"""Resumable bulk transcript prefetch (cache warming)"""
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from mcp import types
+from youtube_toolkit.tools.youtube_base import (
+    YouTubeAPIClient, resolve_cache_dir, format_error_response,
+    parse_video_id, uploads_playlist_id, iter_playlist_pages, resolve_channel
+)
+from youtube_toolkit.tools.youtube_video import youtube_get_video_transcript
+from youtube_toolkit.config import load_config
+from youtube_toolkit.logging_config import logger
+
+# Give up on a video after this many failed (non-blocked) attempts
+MAX_ATTEMPTS = 3
+# Longest cool-down after repeated blocking
+MAX_BLOCK_COOLDOWN = 6 * 3600
+
+class PrefetchQueue:
+    """Persistent work queue of videos whose transcripts should be cached.
+
+    The queue is checkpointed to disk after every state change, so a
+    prefetch run can stop at any point (rate-limit block, restart) and
+    pick up exactly where it left off.
+    """
+    _instance = None
+
+    def __init__(self, state_dir: Optional[Path] = None):
+        self.state_dir = state_dir or resolve_cache_dir(None, 'prefetch')
+        self.state_path = self.state_dir / "queue.json"
+        self._lock = threading.RLock()
+        self._worker: Optional[threading.Thread] = None
+        self.state = self._load()
+
+    @classmethod
+    def get_instance(cls) -> "PrefetchQueue":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _load(self) -> Dict[str, Any]:
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Prefetch queue unreadable, starting fresh: {e}")
+        return {
+            "sources": [],
+            "items": {},
+            "blocked_until": None,
+            "consecutive_blocks": 0,
+            "totals": {"scraped": 0, "cached": 0, "no_transcript": 0, "failed": 0, "blocks": 0}
+        }
+
+    def checkpoint(self):
+        """Atomically persist the queue state"""
+        with self._lock:
+            self.state['updated_at'] = datetime.now().isoformat()
+            tmp_path = self.state_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+
+    def enqueue(
+        self,
+        channel_ids: Optional[List[str]] = None,
+        playlist_ids: Optional[List[str]] = None,
+        video_ids: Optional[List[str]] = None,
+        max_videos_per_source: int = 50
+    ) -> int:
+        """
+        Add sources to the queue.
+
+        Channels and playlists are expanded to video IDs lazily by the worker;
+        video IDs are queued directly.
+
+        Returns:
+            Number of new video IDs queued directly
+        """
+        added = 0
+        with self._lock:
+            known_sources = {(s['type'], s['id']) for s in self.state['sources']}
+            for source_type, ids in (('channel', channel_ids), ('playlist', playlist_ids)):
+                for source_id in ids or []:
+                    if (source_type, source_id) not in known_sources:
+                        self.state['sources'].append({
+                            "type": source_type,
+                            "id": source_id,
+                            "status": "pending",
+                            "max_videos": max_videos_per_source
+                        })
+            for video_id in video_ids or []:
+                added += self._add_item(parse_video_id(video_id), "video")
+            self.checkpoint()
+        return added
+
+    def _add_item(self, video_id: str, source: str) -> int:
+        if video_id in self.state['items']:
+            return 0
+        self.state['items'][video_id] = {"status": "pending", "attempts": 0, "source": source}
+        return 1
+
+    def _expand_sources(self):
+        """Turn pending channels/playlists into queued video IDs"""
+        pending = [s for s in self.state['sources'] if s['status'] == 'pending']
+        if not pending:
+            return
+        youtube = YouTubeAPIClient.get_instance()
+        for source in pending:
+            try:
+                playlist_id = source['id']
+                if source['type'] == 'channel':
+                    resolved = resolve_channel(youtube, source['id'])
+                    if not resolved:
+                        raise ValueError(f"Channel {source['id']} not found")
+                    playlist_id = uploads_playlist_id(resolved['channel_id'])
+                queued = 0
+                for page in iter_playlist_pages(youtube, playlist_id):
+                    for item in page.get('items', []):
+                        if queued >= source['max_videos']:
+                            break
+                        self._add_item(item['contentDetails']['videoId'], f"{source['type']}:{source['id']}")
+                        queued += 1
+                    if queued >= source['max_videos']:
+                        break
+                source['status'] = 'expanded'
+                source['videos'] = queued
+            except Exception as e:
+                logger.error(f"Failed to expand prefetch source {source['id']}: {e}")
+                source['status'] = 'failed'
+                source['error'] = format_error_response(e)['error']
+            self.checkpoint()
+
+    def blocked_for(self) -> float:
+        """Seconds left in the current rate-limit cool-down"""
+        blocked_until = self.state.get('blocked_until')
+        if not blocked_until:
+            return 0.0
+        return max(0.0, (datetime.fromisoformat(blocked_until) - datetime.now()).total_seconds())
+
+    def _record_block(self, video_id: str):
+        config = load_config()
+        self.state['consecutive_blocks'] += 1
+        self.state['totals']['blocks'] += 1
+        cooldown = min(
+            MAX_BLOCK_COOLDOWN,
+            config.prefetch_block_cooldown * 2 ** (self.state['consecutive_blocks'] - 1)
+        )
+        self.state['blocked_until'] = (datetime.now() + timedelta(seconds=cooldown)).isoformat()
+        logger.warning(f"Transcript scraping blocked at {video_id}; pausing prefetch for {cooldown:.0f}s")
+
+    def run(
+        self,
+        max_videos: Optional[int] = None,
+        delay_seconds: Optional[float] = None,
+        wait_on_block: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Work through pending videos until the queue is empty, `max_videos`
+        have been processed, or scraping is blocked.
+
+        Args:
+            max_videos: Stop after processing this many videos
+            delay_seconds: Delay between transcript scrapes (config default if None)
+            wait_on_block: Sleep through block cool-downs and continue instead of stopping
+
+        Returns:
+            Queue status after the run
+        """
+        processed = 0
+        while True:
+            wait = self.blocked_for()
+            if wait > 0:
+                if not wait_on_block:
+                    break
+                logger.info(f"Prefetch waiting {wait:.0f}s for block cool-down")
+                time.sleep(wait)
+
+            with self._lock:
+                self._expand_sources()
+                pending = [v for v, item in self.state['items'].items() if item['status'] == 'pending']
+            if not pending or (max_videos is not None and processed >= max_videos):
+                break
+
+            video_id = pending[0]
+            response = json.loads(youtube_get_video_transcript(
+                video_id,
+                extract_mode="features",
+                use_cache=True,
+                delay_seconds=delay_seconds,
+                priority="prefetch"
+            ).text)
+
+            with self._lock:
+                item = self.state['items'][video_id]
+                item['attempts'] += 1
+                item['last_attempt'] = datetime.now().isoformat()
+                error = response.get('error')
+                if not error:
+                    cache_hit = response.get('_metadata', {}).get('cache_hit', False)
+                    item['status'] = 'cached' if cache_hit else 'done'
+                    self.state['totals']['cached' if cache_hit else 'scraped'] += 1
+                    self.state['consecutive_blocks'] = 0
+                    self.state['blocked_until'] = None
+                elif 'blocked' in error.get('type', ''):
+                    # Leave the video pending so the next run retries it
+                    details = error.get('details', {})
+                    negative = details.get('negative_cache', {})
+                    breaker = details.get('circuit_breaker')
+                    if negative.get('hit') or breaker:
+                        # Still cooling down from an earlier block, not a new block
+                        item['attempts'] -= 1
+                        self.state['blocked_until'] = breaker['retry_at'] if breaker else negative['expires_at']
+                    else:
+                        self._record_block(video_id)
+                elif error.get('type') == 'no_transcript':
+                    item['status'] = 'no_transcript'
+                    self.state['totals']['no_transcript'] += 1
+                else:
+                    item['error'] = error
+                    if item['attempts'] >= MAX_ATTEMPTS:
+                        item['status'] = 'failed'
+                        self.state['totals']['failed'] += 1
+                self.checkpoint()
+            processed += 1
+
+        return self.status()
+
+    def start_background(self, max_videos: Optional[int] = None, delay_seconds: Optional[float] = None) -> bool:
+        """Run the queue in a daemon thread; returns False if already running"""
+        with self._lock:
+            if self.is_running():
+                return False
+            self._worker = threading.Thread(
+                target=self.run,
+                kwargs={"max_videos": max_videos, "delay_seconds": delay_seconds},
+                name="transcript-prefetch",
+                daemon=True
+            )
+            self._worker.start()
+            return True
+
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def status(self) -> Dict[str, Any]:
+        """Summarize queue progress"""
+        with self._lock:
+            counts = {}
+            for item in self.state['items'].values():
+                counts[item['status']] = counts.get(item['status'], 0) + 1
+            blocked_for = self.blocked_for()
+            pending_sources = sum(1 for s in self.state['sources'] if s['status'] == 'pending')
+            if self.is_running():
+                state = "running"
+            elif blocked_for > 0:
+                state = "blocked"
+            elif counts.get('pending') or pending_sources:
+                state = "paused"
+            else:
+                state = "complete"
+            return {
+                "state": state,
+                "videos": {"total": len(self.state['items']), **counts},
+                "sources": self.state['sources'],
+                "blocked_until": self.state['blocked_until'] if blocked_for > 0 else None,
+                "totals": self.state['totals'],
+                "updated_at": self.state.get('updated_at')
+            }
+
+def youtube_prefetch_transcripts(
+    channel_ids: Optional[List[str]] = None,
+    playlist_ids: Optional[List[str]] = None,
+    video_ids: Optional[List[str]] = None,
+    max_videos_per_source: int = 50,
+    delay_seconds: Optional[float] = None,
+    start: bool = True
+) -> types.TextContent:
+    """
+    Queue channels, playlists or videos for transcript cache warming.
+
+    Args:
+        channel_ids: Channels whose recent uploads should be cached
+        playlist_ids: Playlists whose videos should be cached
+        video_ids: Individual video IDs or URLs
+        max_videos_per_source: Videos to take from each channel/playlist
+        delay_seconds: Delay between transcript scrapes
+        start: Start (or resume) the background prefetch worker
+
+    Returns:
+        Queue status
+    """
+    try:
+        queue = PrefetchQueue.get_instance()
+        queued = queue.enqueue(channel_ids, playlist_ids, video_ids, max_videos_per_source)
+        started = queue.start_background(delay_seconds=delay_seconds) if start else False
+
+        result = queue.status()
+        result['_metadata'] = {
+            "api_quota_cost": 0,  # Channel/playlist expansion costs 1 unit per 50 videos when it runs
+            "videos_queued": queued,
+            "worker_started": started,
+            "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error queueing prefetch: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
+
+def youtube_get_prefetch_status() -> types.TextContent:
+    """
+    Report progress of the transcript prefetch queue.
+
+    Returns:
+        Queue state (running, blocked, paused, complete) with per-status counts
+    """
+    try:
+        result = PrefetchQueue.get_instance().status()
+        result['_metadata'] = {
+            "api_quota_cost": 0,
+            "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+
+    except Exception as e:
+        logger.error(f"Error reading prefetch status: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
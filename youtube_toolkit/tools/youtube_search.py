@@ -1,18 +1,110 @@
 """YouTube search tools"""
 import json
 import time
-from typing import Optional, Literal
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime
+from typing import List, Optional, Literal
 from mcp import types
 from youtube_toolkit.tools.youtube_base import (
-    YouTubeAPIClient, parse_duration, format_error_response
+    YouTubeAPIClient, SearchCache, VideoDetailsFetcher, parse_duration, format_error_response, execute_api_request,
+    track_api_retries, api_retry_count
 )
 from youtube_toolkit.logging_config import logger
 
+def _refresh_statistics(youtube, results: list) -> int:
+    """
+    Update view and like counts of search results in place via videos.list.
+    
+    Returns:
+        Number of videos.list requests made (1 quota unit each)
+    """
+    requests_made = 0
+    for start in range(0, len(results), 50):
+        batch = results[start:start + 50]
+        stats_request = youtube.videos().list(
+            part='statistics',
+            id=','.join(r['id'] for r in batch)
+        )
+        stats_response = execute_api_request(stats_request)
+        requests_made += 1
+        stats_lookup = {
+            item['id']: item.get('statistics', {})
+            for item in stats_response.get('items', [])
+        }
+        for result in batch:
+            # Videos deleted since the search keep their last known counts
+            if result['id'] in stats_lookup:
+                stats = stats_lookup[result['id']]
+                result['view_count'] = int(stats.get('viewCount', 0))
+                result['like_count'] = int(stats.get('likeCount', 0))
+    return requests_made
+
+def _search_pages(youtube, search_params: dict, max_results: int, on_page=None) -> tuple:
+    """
+    Page through search.list until `max_results` videos are collected.
+    
+    Args:
+        youtube: YouTube API client instance
+        search_params: search.list parameters (without paging)
+        max_results: Videos to collect
+        on_page: Called with each page's items as soon as the page arrives
+    
+    Returns:
+        (search items, number of search.list requests made)
+    """
+    search_params = dict(search_params)
+    videos = []
+    next_page_token = None
+    search_requests = 0
+    while len(videos) < max_results:
+        if next_page_token:
+            search_params['pageToken'] = next_page_token
+        search_params['maxResults'] = min(50, max_results - len(videos))
+        
+        search_request = youtube.search().list(**search_params)
+        search_response = execute_api_request(search_request)
+        search_requests += 1
+        
+        if 'items' not in search_response:
+            break
+        
+        page = search_response['items'][:max_results - len(videos)]
+        videos.extend(page)
+        if on_page:
+            on_page(page)
+        
+        next_page_token = search_response.get('nextPageToken')
+        if not next_page_token or len(videos) >= max_results:
+            break
+    return videos, search_requests
+
+def _format_result(video: dict, details: dict) -> dict:
+    """Build a search result from a search.list item and its videos.list details"""
+    video_id = video['id']['videoId']
+    return {
+        "id": video_id,
+        "title": video['snippet']['title'],
+        "channel": video['snippet']['channelTitle'],
+        "channel_id": video['snippet']['channelId'],
+        "description": video['snippet']['description'],
+        "published_at": video['snippet']['publishedAt'],
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "thumbnail": video['snippet']['thumbnails'].get('high', {}).get('url', ''),
+        "duration": details.get('contentDetails', {}).get('duration', ''),
+        "duration_seconds": parse_duration(details.get('contentDetails', {}).get('duration', '')),
+        "view_count": int(details.get('statistics', {}).get('viewCount', 0)),
+        "like_count": int(details.get('statistics', {}).get('likeCount', 0))
+    }
+
+@track_api_retries
 def youtube_search_videos(
     query: str,
     max_results: int = 10,
     order: Literal["relevance", "date", "viewCount", "rating"] = "relevance",
-    published_after: Optional[str] = None
+    published_after: Optional[str] = None,
+    use_cache: bool = True,
+    refresh_statistics: bool = False
 ) -> types.TextContent:
     """
     Search YouTube videos by query.
@@ -22,6 +114,8 @@ def youtube_search_videos(
         max_results: Maximum results to return
         order: Sort order for results
         published_after: ISO 8601 date string (e.g., "2024-01-01T00:00:00Z")
+        use_cache: Reuse a cached result for the same search within the TTL
+        refresh_statistics: On a cache hit, update view/like counts via videos.list
     
     Returns:
         Array of video search results
@@ -30,79 +124,65 @@ def youtube_search_videos(
         # Get YouTube API client
         youtube = YouTubeAPIClient.get_instance()
         
+        # Serve repeated searches from the cache
+        search_cache = SearchCache()
+        cache_key = SearchCache.make_key(query, order, published_after, max_results)
+        cached = search_cache.get(cache_key) if use_cache else None
+        if cached:
+            results = cached['results']
+            api_quota_cost = 0
+            cache_status = "hit"
+            if refresh_statistics and results:
+                api_quota_cost = _refresh_statistics(youtube, results)
+                cached['statistics_refreshed_at'] = datetime.now().isoformat()
+                search_cache.set(cache_key, cached)
+                cache_status = "refresh"
+            
+            response = {
+                "query": query,
+                "total_results": len(results),
+                "order": order,
+                "results": results,
+                "_metadata": {
+                    "api_quota_cost": api_quota_cost,
+                    "api_retries": api_retry_count(),
+                    "cache": cache_status,
+                    "cached_at": cached['fetched_at'],
+                    "statistics_refreshed_at": cached.get('statistics_refreshed_at'),
+                    "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+                }
+            }
+            if published_after:
+                response["published_after"] = published_after
+            return types.TextContent(
+                type="text",
+                text=json.dumps(response, indent=2)
+            )
+        
         # Build search parameters
         search_params = {
             'part': 'snippet',
             'q': query,
             'type': 'video',
-            'maxResults': min(50, max_results),
             'order': order
         }
         
         if published_after:
             search_params['publishedAfter'] = published_after
         
-        # Execute search
-        videos = []
-        next_page_token = None
-        
-        while len(videos) < max_results:
-            if next_page_token:
-                search_params['pageToken'] = next_page_token
-            
-            search_request = youtube.search().list(**search_params)
-            search_response = search_request.execute()
-            
-            if 'items' not in search_response:
-                break
-            
-            videos.extend(search_response['items'])
-            
-            next_page_token = search_response.get('nextPageToken')
-            if not next_page_token or len(videos) >= max_results:
-                break
-        
-        # Trim to requested max
-        videos = videos[:max_results]
-        
-        # Get detailed information for videos
-        video_ids = [v['id']['videoId'] for v in videos]
-        
-        if video_ids:
-            details_request = youtube.videos().list(
-                part='statistics,contentDetails',
-                id=','.join(video_ids)
+        # Execute search; each page's details are fetched while the next page loads
+        with VideoDetailsFetcher(youtube) as details_fetcher:
+            videos, search_requests = _search_pages(
+                youtube, search_params, max_results,
+                on_page=lambda page: details_fetcher.submit([v['id']['videoId'] for v in page])
             )
-            details_response = details_request.execute()
-            
-            # Create lookup
-            details_lookup = {
-                item['id']: item 
-                for item in details_response.get('items', [])
-            }
-        else:
-            details_lookup = {}
+            details_lookup = details_fetcher.results()
         
         # Format results
-        results = []
-        for video in videos:
-            video_id = video['id']['videoId']
-            details = details_lookup.get(video_id, {})
-            
-            results.append({
-                "id": video_id,
-                "title": video['snippet']['title'],
-                "channel": video['snippet']['channelTitle'],
-                "channel_id": video['snippet']['channelId'],
-                "description": video['snippet']['description'],
-                "published_at": video['snippet']['publishedAt'],
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-                "thumbnail": video['snippet']['thumbnails'].get('high', {}).get('url', ''),
-                "duration": details.get('contentDetails', {}).get('duration', ''),
-                "duration_seconds": parse_duration(details.get('contentDetails', {}).get('duration', '')),
-                "view_count": int(details.get('statistics', {}).get('viewCount', 0)),
-                "like_count": int(details.get('statistics', {}).get('likeCount', 0))
-            })
+        results = [
+            _format_result(video, details_lookup.get(video['id']['videoId'], {}))
+            for video in videos
+        ]
         
         response = {
             "query": query,
@@ -110,7 +190,9 @@ def youtube_search_videos(
             "order": order,
             "results": results,
             "_metadata": {
-                "api_quota_cost": 100,  # Search operation costs 100 units
+                "api_quota_cost": 100 * search_requests + details_fetcher.requests_made,  # 100 per search page, 1 per 50 details
+                "api_retries": api_retry_count(),
+                "cache": "miss",
                 "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
             }
         }
@@ -118,6 +200,14 @@ def youtube_search_videos(
         if published_after:
             response["published_after"] = published_after
         
+        search_cache.set(cache_key, {
+            "query": query,
+            "order": order,
+            "published_after": published_after,
+            "max_results": max_results,
+            "results": results
+        })
+        
         return types.TextContent(
             type="text",
             text=json.dumps(response, indent=2)
@@ -128,4 +218,161 @@ def youtube_search_videos(
         return types.TextContent(
             type="text",
             text=json.dumps(format_error_response(e))
-        )
\ No newline at end of file
+        )
+@track_api_retries
+def youtube_search_videos_multi(
+    queries: List[str],
+    max_results_per_query: int = 10,
+    order: Literal["relevance", "date", "viewCount", "rating"] = "relevance",
+    published_after: Optional[str] = None,
+    quota_budget: Optional[int] = None,
+    use_cache: bool = True,
+    max_concurrency: int = 4
+) -> types.TextContent:
+    """
+    Run several related searches at once and fetch details for their union.
+    
+    Searches run concurrently. Video IDs are deduplicated across queries
+    and looked up in one chunked videos.list pass, so overlapping queries
+    never pay twice for details. Each query is cached like a single
+    youtube_search_videos call (and served from that cache).
+    
+    Args:
+        queries: Search query strings
+        max_results_per_query: Maximum results per query
+        order: Sort order for results
+        published_after: ISO 8601 date string (e.g., "2024-01-01T00:00:00Z")
+        quota_budget: Most quota units to spend; queries that don't fit are skipped
+        use_cache: Reuse cached results for queries searched recently
+        max_concurrency: Searches in flight at once
+    
+    Returns:
+        Results grouped by query, plus the videos found by more than one query
+    """
+    try:
+        youtube = YouTubeAPIClient.get_instance()
+        search_cache = SearchCache()
+        
+        # Queries differing only in case or whitespace are searched once
+        keys = {}
+        unique_queries = []
+        for query in queries:
+            key = SearchCache.make_key(query, order, published_after, max_results_per_query)
+            if key not in keys.values():
+                unique_queries.append(query)
+            keys[query] = key
+        
+        cached = {}
+        to_search = []
+        skipped = []
+        pages_per_query = max(1, -(-max_results_per_query // 50))
+        planned_cost = 0
+        for query in unique_queries:
+            entry = search_cache.get(keys[query]) if use_cache else None
+            if entry:
+                cached[query] = entry
+                continue
+            # Each query costs 100 per search page plus, at worst, its share of the details pass
+            query_cost = 100 * pages_per_query
+            details_cost = -(-(len(to_search) + 1) * max_results_per_query // 50)
+            if quota_budget is not None and planned_cost + query_cost + details_cost > quota_budget:
+                skipped.append(query)
+                continue
+            to_search.append(query)
+            planned_cost += query_cost
+        
+        search_params = {
+            'part': 'snippet',
+            'type': 'video',
+            'order': order
+        }
+        if published_after:
+            search_params['publishedAfter'] = published_after
+        
+        searched = {}
+        search_requests = 0
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="youtube-search") as executor:
+            futures = {
+                query: executor.submit(
+                    copy_context().run, _search_pages, youtube, {**search_params, 'q': query}, max_results_per_query
+                )
+                for query in to_search
+            }
+            for query, future in futures.items():
+                searched[query], requests = future.result()
+                search_requests += requests
+        
+        # One details pass over the union of new results
+        union_ids = list(dict.fromkeys(
+            video['id']['videoId'] for query in to_search for video in searched[query]
+        ))
+        with VideoDetailsFetcher(youtube) as details_fetcher:
+            details_fetcher.submit(union_ids)
+            details_lookup = details_fetcher.results()
+        
+        grouped = []
+        seen_in = {}
+        for query in unique_queries:
+            if query in skipped:
+                grouped.append({"query": query, "cache": "skipped", "total_results": 0, "results": []})
+                continue
+            if query in cached:
+                results = cached[query]['results']
+                cache_status = "hit"
+            else:
+                results = [
+                    _format_result(video, details_lookup.get(video['id']['videoId'], {}))
+                    for video in searched[query]
+                ]
+                cache_status = "miss"
+                search_cache.set(keys[query], {
+                    "query": query,
+                    "order": order,
+                    "published_after": published_after,
+                    "max_results": max_results_per_query,
+                    "results": results
+                })
+            for result in results:
+                seen_in.setdefault(result['id'], []).append(query)
+            grouped.append({
+                "query": query,
+                "cache": cache_status,
+                "total_results": len(results),
+                "results": results
+            })
+        
+        response = {
+            "queries": grouped,
+            "order": order,
+            "unique_videos": len(seen_in),
+            "overlap": [
+                {"id": video_id, "queries": found_in}
+                for video_id, found_in in seen_in.items() if len(found_in) > 1
+            ],
+            "skipped_queries": skipped,
+            "_metadata": {
+                # 100 per search page, 1 per 50 unique videos
+                "api_quota_cost": 100 * search_requests + details_fetcher.requests_made,
+                "api_retries": api_retry_count(),
+                "quota_budget": quota_budget,
+                "searches": len(to_search),
+                "cache_hits": len(cached),
+                "details_requests": details_fetcher.requests_made,
+                "duplicate_results_skipped": sum(len(searched[q]) for q in to_search) - len(union_ids),
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        if published_after:
+            response["published_after"] = published_after
+        
+        return types.TextContent(
+            type="text",
+            text=json.dumps(response, indent=2)
+        )
+        
+    except Exception as e:
+        logger.error(f"Error running multi-query search: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
@@ -0,0 +1,35 @@
+"""Runtime status of the toolkit's shared fetch machinery"""
+import json
+import time
+from mcp import types
+from youtube_toolkit.tools.youtube_base import single_flight, scrape_controller, format_error_response
+from youtube_toolkit.logging_config import logger
+
+def youtube_get_toolkit_status() -> types.TextContent:
+    """
+    Report runtime metrics for shared fetch machinery.
+    
+    Returns:
+        Request coalescing metrics per operation (calls, executions, coalesced)
+        and the transcript scrape rate controller's delay and breaker state
+    """
+    try:
+        result = {
+            "single_flight": single_flight.get_stats(),
+            "transcript_scraping": scrape_controller.get_status(),
+            "_metadata": {
+                "api_quota_cost": 0,
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error reading toolkit status: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )
@@ -1,15 +1,22 @@
 """YouTube video information and transcript tools"""
 import json
 import time
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, List, Optional, Literal
 from mcp import types
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound,
+    RequestBlocked, IpBlocked
+)
 from googleapiclient.errors import HttpError
 from youtube_toolkit.tools.youtube_base import (
-    YouTubeAPIClient, TranscriptCache, parse_video_id, 
+    YouTubeAPIClient, TranscriptCache, VideoMetadataCache, parse_video_id, 
     parse_duration, format_error_response, extract_intro,
-    extract_outro, extract_main_samples
+    extract_outro, extract_main_samples, compute_transcript_features,
+    execute_api_request, run_concurrently, VideoDetailsFetcher, single_flight,
+    track_api_retries, api_retry_count, scrape_controller, scrape_scheduler, CircuitOpenError,
+    cached_channel_id
 )
+from youtube_toolkit.tools.youtube_history import record_stats
 from youtube_toolkit.config import load_config
 from youtube_toolkit.logging_config import logger
 
@@ -40,7 +47,7 @@ def _get_category_name(youtube, category_id: str) -> str:
             part='snippet',
             id=category_id
         )
-        response = request.execute()
+        response = execute_api_request(request)
         
         if response.get('items'):
             category_name = response['items'][0]['snippet']['title']
@@ -51,6 +58,7 @@ def _get_category_name(youtube, category_id: str) -> str:
     
     return ""
 
+@track_api_retries
 def youtube_get_video_metadata(
     video_id: str,
     include_statistics: bool = True
@@ -82,7 +90,7 @@ def youtube_get_video_metadata(
             part=','.join(parts),
             id=video_id
         )
-        response = request.execute()
+        response = execute_api_request(request)
         
         if not response.get('items'):
             return types.TextContent(
@@ -111,12 +119,15 @@ def youtube_get_video_metadata(
             "maxres": thumbnails.get('maxres', {}).get('url', f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg")
         }
         
-        # Get channel subscriber count (requires additional API call)
+        # Channel subscriber count and category name are independent lookups; run them together
         channel_request = youtube.channels().list(
             part='statistics',
             id=snippet['channelId']
         )
-        channel_response = channel_request.execute()
+        channel_response, category_name = run_concurrently(
+            lambda: execute_api_request(channel_request),
+            lambda: _get_category_name(youtube, snippet.get('categoryId', ''))
+        )
         subscriber_count = 0
         if channel_response.get('items'):
             subscriber_count = int(channel_response['items'][0]['statistics'].get('subscriberCount', 0))
@@ -136,7 +147,7 @@ def youtube_get_video_metadata(
             "thumbnail": thumbnail_obj,
             "tags": snippet.get('tags', []),
             "category_id": snippet.get('categoryId', ''),
-            "category_name": _get_category_name(youtube, snippet.get('categoryId', '')),
+            "category_name": category_name,
             "statistics": {
                 "view_count": int(video.get('statistics', {}).get('viewCount', 0)),
                 "like_count": int(video.get('statistics', {}).get('likeCount', 0)),
@@ -150,14 +161,37 @@ def youtube_get_video_metadata(
             "default_audio_language": snippet.get('defaultAudioLanguage'),
             "_metadata": {
                 "api_quota_cost": 3,  # 1 for video + 1 for channel + potential category lookup
+                "api_retries": api_retry_count(),
                 "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
             }
         }
         
+        # Keep statistics history for growth tracking
+        if include_statistics:
+            record_stats("video", video_id, result['statistics'])
+        if channel_response.get('items') and 'subscriberCount' in channel_response['items'][0]['statistics']:
+            record_stats("channel", snippet['channelId'], {"subscriber_count": subscriber_count})
+        
         # Remove statistics if not requested
         if not include_statistics:
             del result['statistics']
         
+        # Keep video metadata for offline analysis tools
+        statistics = result.get('statistics') or {}
+        VideoMetadataCache().set(video_id, {
+            "title": result['title'],
+            "description": result['description'],
+            "channel_id": result['channel']['id'],
+            "channel_title": result['channel']['title'],
+            "published_at": result['published_at'],
+            "duration": result['duration'],
+            "duration_seconds": result['duration_seconds'],
+            "tags": result['tags'],
+            "view_count": statistics.get('view_count'),
+            "like_count": statistics.get('like_count'),
+            "comment_count": statistics.get('comment_count')
+        })
+        
         return types.TextContent(
             type="text",
             text=json.dumps(result, indent=2)
@@ -170,11 +204,130 @@ def youtube_get_video_metadata(
             text=json.dumps(format_error_response(e))
         )
 
+def _classify_transcript_error(error: Exception) -> Optional[str]:
+    """
+    Classify a transcript fetch failure for negative caching.
+    
+    Returns:
+        'disabled' when the video has no transcript to fetch, 'blocked' when
+        YouTube refused the request, None for anything else
+    """
+    if isinstance(error, (TranscriptsDisabled, NoTranscriptFound)):
+        return 'disabled'
+    if isinstance(error, (RequestBlocked, IpBlocked)):
+        return 'blocked'
+    error_msg = str(error)
+    if 'Subtitles are disabled' in error_msg or 'No transcripts' in error_msg or 'TranscriptsDisabled' in error_msg:
+        return 'disabled'
+    if 'Could not retrieve' in error_msg or 'NoTranscriptFound' in error_msg:
+        return 'blocked'
+    return None
+
+def _transcript_error_response(
+    video_id: str,
+    reason: str,
+    negative_entry: Dict[str, Any],
+    cache_hit: bool = False
+) -> types.TextContent:
+    """Error response for a video without a usable transcript"""
+    if reason == 'disabled':
+        error_type, message = "no_transcript", "No transcript available for this video"
+    else:
+        error_type, message = "transcript_blocked", "Transcript blocked or unavailable"
+    return types.TextContent(
+        type="text",
+        text=json.dumps({
+            "error": {
+                "type": error_type,
+                "message": message,
+                "details": {
+                    "video_id": video_id,
+                    "negative_cache": {
+                        "hit": cache_hit,
+                        "reason": negative_entry['reason'],
+                        "cached_at": negative_entry['fetched_at'],
+                        "expires_at": negative_entry['expires_at']
+                    }
+                }
+            }
+        })
+    )
+
+def _scrape_transcript(
+    video_id: str,
+    delay_seconds: Optional[float],
+    cache: TranscriptCache,
+    priority: str = "interactive"
+) -> Dict[str, Any]:
+    """
+    Scrape a transcript in the next rate-controlled slot and cache it.
+    
+    Args:
+        video_id: YouTube video ID
+        delay_seconds: Minimum spacing from the previous scrape (adaptive if None)
+        cache: Transcript cache to store the result in
+        priority: Scheduling class ('interactive', 'harvest' or 'prefetch')
+    
+    Returns:
+        Cached transcript data including analysis extracts and features
+    
+    Raises:
+        CircuitOpenError: Scraping is paused after blocking
+    """
+    # Wait for a slot by priority; fails fast while the circuit breaker is open
+    with scrape_scheduler.slot(priority, delay_seconds):
+        # Create API instance
+        api = YouTubeTranscriptApi()
+        
+        # Fetch transcript - tries manual first, then auto-generated
+        logger.info(f"Fetching transcript for video {video_id}...")
+        try:
+            transcript_list = api.fetch(video_id)
+        except Exception as e:
+            reason = _classify_transcript_error(e)
+            if reason == 'blocked':
+                scrape_controller.record_block()
+            elif reason == 'disabled':
+                scrape_controller.record_success()
+            else:
+                scrape_controller.record_failure()
+            raise
+        scrape_controller.record_success()
+    
+    # Convert to our format
+    transcript = []
+    for entry in transcript_list:
+        transcript.append({
+            'text': entry.text,
+            'start': entry.start,
+            'duration': entry.duration
+        })
+    
+    # Calculate duration
+    duration = transcript[-1]['start'] + transcript[-1]['duration'] if transcript else 0
+    
+    # Build analysis data
+    analysis_data = {
+        'video_id': video_id,
+        'duration': duration,
+        'full_transcript': transcript,
+        'intro': extract_intro(transcript),
+        'outro': extract_outro(transcript, duration),
+        'main_samples': extract_main_samples(transcript),
+        'transcript_length': len(transcript),
+        'features': compute_transcript_features(transcript, duration)
+    }
+    
+    # Cache the data
+    cache.set(video_id, analysis_data)
+    return analysis_data
+
 def youtube_get_video_transcript(
     video_id: str,
-    extract_mode: Literal["full", "analysis", "intro_only", "outro_only"] = "full",
+    extract_mode: Literal["full", "analysis", "intro_only", "outro_only", "features"] = "full",
     use_cache: bool = True,
-    delay_seconds: Optional[float] = None
+    delay_seconds: Optional[float] = None,
+    priority: Literal["interactive", "harvest", "prefetch"] = "interactive"
 ) -> types.TextContent:
     """
     Fetch and cache video transcript with smart extraction options.
@@ -183,7 +336,9 @@ def youtube_get_video_transcript(
         video_id: YouTube video ID
         extract_mode: Extraction mode for transcript
         use_cache: Use cached transcript if available
-        delay_seconds: Rate limit delay (uses default if None)
+        delay_seconds: Minimum spacing between scrapes (adaptive if None)
+        priority: Scrape scheduling class; bulk callers pass 'harvest' or
+            'prefetch' so single-video requests are served first
     
     Returns:
         Transcript data based on extraction mode
@@ -192,15 +347,13 @@ def youtube_get_video_transcript(
         # Parse video ID
         video_id = parse_video_id(video_id)
         
-        # Get config
-        config = load_config()
-        if delay_seconds is None:
-            delay_seconds = config.default_transcript_delay
-        
         # Enforce minimum delay to avoid IP blocking
-        if delay_seconds < 1.0:
-            logger.warning(f"Delay of {delay_seconds}s is too low, using minimum of 1.0s to avoid IP blocking")
-            delay_seconds = 1.0
+        config = load_config()
+        if delay_seconds is not None and delay_seconds < config.scrape_min_delay:
+            logger.warning(
+                f"Delay of {delay_seconds}s is too low, using minimum of {config.scrape_min_delay}s to avoid IP blocking"
+            )
+            delay_seconds = config.scrape_min_delay
         
         # Check cache
         cache = TranscriptCache()
@@ -209,72 +362,48 @@ def youtube_get_video_transcript(
             cached_data = cache.get(video_id)
             if cached_data:
                 logger.info(f"Using cached transcript for video {video_id}")
+                # Upgrade features computed under an older schema
+                cached_data = cache.ensure_features(video_id, cached_data)
+        cache_hit = cached_data is not None
         
-        # Fetch if not cached
+        # Videos known to have no usable transcript fail fast without scraping
+        if not cached_data and use_cache:
+            negative = cache.get_negative(video_id)
+            if negative:
+                logger.info(f"Negative cache hit for video {video_id} ({negative['reason']})")
+                return _transcript_error_response(video_id, negative['reason'], negative, cache_hit=True)
+        
+        # Fetch if not cached; concurrent requests for the same video share one scrape
+        coalesced = False
         if not cached_data:
-            # Apply delay for rate limiting
-            if delay_seconds > 0:
-                logger.info(f"Waiting {delay_seconds}s before fetching transcript...")
-                time.sleep(delay_seconds)
-            
             try:
-                # Create API instance
-                api = YouTubeTranscriptApi()
-                
-                # Fetch transcript - tries manual first, then auto-generated
-                logger.info(f"Fetching transcript for video {video_id}...")
-                transcript_list = api.fetch(video_id)
-                
-                # Convert to our format
-                transcript = []
-                for entry in transcript_list:
-                    transcript.append({
-                        'text': entry.text,
-                        'start': entry.start,
-                        'duration': entry.duration
+                cached_data, coalesced = single_flight.do(
+                    ('transcript', video_id),
+                    lambda: _scrape_transcript(video_id, delay_seconds, cache, priority)
+                )
+            except CircuitOpenError as e:
+                logger.info(f"Circuit breaker open, not scraping {video_id}")
+                return types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "error": {
+                            "type": "transcript_blocked",
+                            "message": "Transcript scraping is paused after blocking; only cached transcripts are served",
+                            "details": {
+                                "video_id": video_id,
+                                "circuit_breaker": {
+                                    "state": "open",
+                                    "retry_at": e.retry_at.isoformat()
+                                }
+                            }
+                        }
                     })
-                
-                # Calculate duration
-                duration = transcript[-1]['start'] + transcript[-1]['duration'] if transcript else 0
-                
-                # Build analysis data
-                analysis_data = {
-                    'video_id': video_id,
-                    'duration': duration,
-                    'full_transcript': transcript,
-                    'intro': extract_intro(transcript),
-                    'outro': extract_outro(transcript, duration),
-                    'main_samples': extract_main_samples(transcript),
-                    'transcript_length': len(transcript)
-                }
-                
-                # Cache the data
-                cache.set(video_id, analysis_data)
-                cached_data = analysis_data
-                
+                )
             except Exception as e:
-                error_msg = str(e)
-                if 'Subtitles are disabled' in error_msg or 'No transcripts' in error_msg or 'TranscriptsDisabled' in error_msg:
-                    return types.TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "error": {
-                                "type": "no_transcript",
-                                "message": "No transcript available for this video",
-                                "details": {"video_id": video_id}
-                            }
-                        })
-                    )
-                elif 'Could not retrieve' in error_msg or 'NoTranscriptFound' in error_msg:
-                    return types.TextContent(
-                        type="text",
-                        text=json.dumps({
-                            "error": {
-                                "type": "transcript_blocked",
-                                "message": "Transcript blocked or unavailable",
-                                "details": {"video_id": video_id}
-                            }
-                        })
+                reason = _classify_transcript_error(e)
+                if reason:
+                    return _transcript_error_response(
+                        video_id, reason, cache.set_negative(video_id, reason, str(e)[:500])
                     )
                 raise
         
@@ -296,11 +425,18 @@ def youtube_get_video_transcript(
                 'outro': cached_data['outro'],
                 'duration': cached_data['duration']
             }
+        elif extract_mode == "features":
+            result = {
+                'video_id': video_id,
+                'duration': cached_data['duration'],
+                'features': cached_data['features']
+            }
         
         # Add metadata
         result['_metadata'] = {
             "api_quota_cost": 0,  # No YouTube API calls, uses youtube-transcript-api
-            "cache_hit": use_cache and cached_data is not None,
+            "cache_hit": cache_hit,
+            "coalesced": coalesced,
             "extract_mode": extract_mode,
             "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
         }
@@ -315,4 +451,81 @@ def youtube_get_video_transcript(
         return types.TextContent(
             type="text",
             text=json.dumps(format_error_response(e))
-        )
\ No newline at end of file
+        )
+
+@track_api_retries
+def youtube_refresh_statistics(
+    video_ids: Optional[List[str]] = None,
+    channel_ids: Optional[List[str]] = None,
+    max_concurrency: int = 4
+) -> types.TextContent:
+    """
+    Refresh view, like and comment counts for many known videos at once.
+    
+    Args:
+        video_ids: Video IDs or URLs to refresh
+        channel_ids: Refresh every video cached for these channels
+        max_concurrency: videos.list batches in flight at once
+    
+    Returns:
+        Per-video counts with the change since the cached values
+    """
+    try:
+        metadata_cache = VideoMetadataCache()
+        targets = [parse_video_id(v) for v in video_ids or []]
+        for channel_id in channel_ids or []:
+            # Handles resolve through the alias cache; a channel never looked up has no cached videos
+            channel_id = cached_channel_id(channel_id) or channel_id
+            targets.extend(entry['video_id'] for entry in metadata_cache.list(channel_id))
+        targets = list(dict.fromkeys(targets))
+        if not targets:
+            raise ValueError("Provide video_ids or channel_ids with cached videos")
+        
+        youtube = YouTubeAPIClient.get_instance()
+        videos = []
+        with VideoDetailsFetcher(youtube, part='statistics', max_workers=max(1, max_concurrency)) as fetcher:
+            fetcher.submit(targets)
+            # Store each batch as it arrives so an interrupted run keeps its progress
+            for items in fetcher.iter_completed():
+                for item in items:
+                    statistics = item.get('statistics', {})
+                    counts = {
+                        "view_count": int(statistics['viewCount']) if 'viewCount' in statistics else None,
+                        "like_count": int(statistics['likeCount']) if 'likeCount' in statistics else None,
+                        "comment_count": int(statistics['commentCount']) if 'commentCount' in statistics else None
+                    }
+                    previous = metadata_cache.get(item['id']) or {}
+                    metadata_cache.set(item['id'], counts)
+                    record_stats("video", item['id'], counts)
+                    change = None
+                    if counts['view_count'] is not None and previous.get('view_count') is not None:
+                        change = counts['view_count'] - previous['view_count']
+                    videos.append({"video_id": item['id'], **counts, "view_change": change})
+        
+        # Keep the caller's order; videos missing from the response were deleted or made private
+        order = {video_id: i for i, video_id in enumerate(targets)}
+        videos.sort(key=lambda v: order[v['video_id']])
+        found = {v['video_id'] for v in videos}
+        
+        result = {
+            "videos": videos,
+            "updated": len(videos),
+            "not_found": [v for v in targets if v not in found],
+            "_metadata": {
+                "api_quota_cost": fetcher.requests_made,  # 1 unit per 50 videos
+                "api_retries": api_retry_count(),
+                "requested": len(targets),
+                "fetched_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+        }
+        return types.TextContent(
+            type="text",
+            text=json.dumps(result, indent=2)
+        )
+    
+    except Exception as e:
+        logger.error(f"Error refreshing statistics: {e}")
+        return types.TextContent(
+            type="text",
+            text=json.dumps(format_error_response(e))
+        )